@@ -1,4 +1,4 @@
-from nicegui_tabulator import tabulator, use_theme
+from nicegui_tabulator import tabulator, use_theme, register_preset
 from nicegui import ui
 
 
@@ -36,6 +36,9 @@ langs = {
     }
 }
 
+# sent to each client once, however many tables use it
+register_preset("cn", {"langs": langs, "locale": "cn"})
+
 table_config = {
     "rowHeader": True,
     "data": tabledata,
@@ -47,11 +50,9 @@ table_config = {
     "paginationSizeSelector": [3, 6, 8, 10],
     "movableColumns": True,
     "paginationCounter": "rows",
-    "langs": langs,
-    "locale": "cn",
 }
 
-tabulator(table_config)
+tabulator(table_config, presets=["cn"])
 
 
 if __name__ in {"__main__", "__mp_main__"}:
@@ -1,7 +1,19 @@
 from .version import __version__
 from .core.tabulator import Tabulator as tabulator
 from .core.types import CellSlotProps
+from .core.transfer import TransferOptions
+from .core.shared import SharedData
+from .core.presets import register_preset
 from .core.themes import use_theme
 from .core.dependencies import import_luxon
 
-__all__ = ["__version__", "tabulator", "CellSlotProps", "use_theme", "import_luxon"]
+__all__ = [
+    "__version__",
+    "tabulator",
+    "CellSlotProps",
+    "TransferOptions",
+    "SharedData",
+    "register_preset",
+    "use_theme",
+    "import_luxon",
+]
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from .remote import RemoteDataSource, RemoteFilter, RemoteRequest, RemoteSorter
+
+
+class _RowGroupReader(ABC):
+    """Reads a memory-mapped file one row group (or record batch) at a time."""
+
+    schema: pa.Schema
+    group_rows: List[int]
+
+    @abstractmethod
+    def read(self, group: int, columns: Optional[List[str]] = None) -> pa.Table:
+        """Read a row group, with all columns or only the given ones."""
+
+    def statistics(self, group: int, field: str) -> Optional[Tuple[Any, Any]]:
+        return None
+
+
+class _ParquetReader(_RowGroupReader):
+    def __init__(self, path: Union[str, Path]):
+        self._file = pq.ParquetFile(str(path), memory_map=True)
+        self.schema = self._file.schema_arrow
+        metadata = self._file.metadata
+        self.group_rows = [
+            metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+        ]
+
+    def read(self, group: int, columns: Optional[List[str]] = None) -> pa.Table:
+        return self._file.read_row_group(group, columns=columns)
+
+    def statistics(self, group: int, field: str) -> Optional[Tuple[Any, Any]]:
+        column_index = self._file.metadata.schema.names.index(field)
+        stats = self._file.metadata.row_group(group).column(column_index).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        return stats.min, stats.max
+
+
+class _IpcReader(_RowGroupReader):
+    def __init__(self, path: Union[str, Path]):
+        self._reader = ipc.open_file(pa.memory_map(str(path), "r"))
+        self.schema = self._reader.schema
+        # batches of a memory-mapped IPC file are zero-copy, reading them only touches the metadata
+        self.group_rows = [
+            self._reader.get_batch(i).num_rows
+            for i in range(self._reader.num_record_batches)
+        ]
+
+    def read(self, group: int, columns: Optional[List[str]] = None) -> pa.Table:
+        table = pa.Table.from_batches([self._reader.get_batch(group)])
+        return table.select(columns) if columns is not None else table
+
+
+def _is_json_friendly(data_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(data_type)
+        or pa.types.is_floating(data_type)
+        or pa.types.is_boolean(data_type)
+        or pa.types.is_string(data_type)
+        or pa.types.is_large_string(data_type)
+        or pa.types.is_null(data_type)
+        or pa.types.is_nested(data_type)
+    )
+
+
+def _coerce_scalar(value: Any, data_type: pa.DataType) -> Optional[pa.Scalar]:
+    try:
+        return pa.scalar(value).cast(data_type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return None
+
+
+def _as_text(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        return column
+    return pc.cast(column, pa.string())
+
+
+def _filter_mask(column: pa.ChunkedArray, flt: RemoteFilter) -> pa.ChunkedArray:
+    value = flt.value
+    if flt.type in ("like", "starts", "ends", "regex", "keywords"):
+        text = _as_text(column)
+        if flt.type == "like":
+            return pc.match_substring(text, str(value), ignore_case=True)
+        if flt.type == "starts":
+            return pc.starts_with(text, str(value), ignore_case=True)
+        if flt.type == "ends":
+            return pc.ends_with(text, str(value), ignore_case=True)
+        if flt.type == "regex":
+            return pc.match_substring_regex(text, str(value))
+        masks = [
+            pc.match_substring(text, keyword, ignore_case=True)
+            for keyword in str(value).split()
+        ]
+        mask = masks[0] if masks else pc.is_valid(text)
+        for other in masks[1:]:
+            mask = pc.or_(mask, other)
+        return mask
+
+    if flt.type == "in":
+        values = value if isinstance(value, list) else [value]
+        try:
+            value_set = pa.array(values).cast(column.type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            value_set = pa.array([str(v) for v in values])
+            column = _as_text(column)
+        return pc.is_in(column, value_set=value_set)
+
+    compare = {
+        "=": pc.equal,
+        "!=": pc.not_equal,
+        "<": pc.less,
+        "<=": pc.less_equal,
+        ">": pc.greater,
+        ">=": pc.greater_equal,
+    }.get(flt.type)
+    if compare is None:
+        raise ValueError(f"Unsupported remote filter type '{flt.type}'")
+
+    scalar = _coerce_scalar(value, column.type)
+    if scalar is None:
+        if flt.type in ("=", "!="):
+            return compare(_as_text(column), str(value))
+        return pa.chunked_array([pa.array([False] * len(column))])
+    return compare(column, scalar)
+
+
+def _may_match(
+    stats: Optional[Tuple[Any, Any]], flt: RemoteFilter, data_type: pa.DataType
+) -> bool:
+    """Whether a row group whose column lies within `stats` can contain rows matching `flt`."""
+    if stats is None or flt.type not in ("=", "<", "<=", ">", ">="):
+        return True
+    scalar = _coerce_scalar(flt.value, data_type)
+    if scalar is None or not scalar.is_valid:
+        return True
+    value = scalar.as_py()
+    low, high = stats
+    try:
+        if flt.type == "=":
+            return low <= value <= high
+        if flt.type == "<":
+            return low < value
+        if flt.type == "<=":
+            return low <= value
+        if flt.type == ">":
+            return high > value
+        return high >= value
+    except TypeError:
+        return True
+
+
+class ArrowDataSource(RemoteDataSource):
+    """A remote data source backed by a memory-mapped Parquet or Arrow IPC file.
+
+    Pages, sorts and filters are evaluated lazily, one row group at a time, so the memory used by the server
+    is bounded by the row groups and columns a request touches rather than by the size of the file.
+    """
+
+    def __init__(
+        self,
+        reader: _RowGroupReader,
+        *,
+        row_id_field: Optional[str] = None,
+        cache_size: int = 4,
+    ):
+        """
+        Args:
+            reader (_RowGroupReader): The reader of the underlying file.
+            row_id_field (Optional[str], optional): If set, each row gets this field holding its position in the file.
+            cache_size (int, optional): The number of decoded row groups and computed orders to keep in memory. Defaults to 4.
+        """
+        self._reader = reader
+        self._row_id_field = row_id_field
+        self._cache_size = cache_size
+        # fetches run in separate threads, and share the caches and the reader
+        self._lock = threading.RLock()
+        self._offsets = np.concatenate(([0], np.cumsum(reader.group_rows))).astype(
+            np.int64
+        )
+        self._groups: OrderedDict[int, pa.Table] = OrderedDict()
+        self._orders: OrderedDict[Tuple, np.ndarray] = OrderedDict()
+        self._selections: OrderedDict[Tuple, np.ndarray] = OrderedDict()
+
+    @classmethod
+    def from_parquet(cls, path: Union[str, Path], **kwargs) -> ArrowDataSource:
+        return cls(_ParquetReader(path), **kwargs)
+
+    @classmethod
+    def from_arrow_file(cls, path: Union[str, Path], **kwargs) -> ArrowDataSource:
+        return cls(_IpcReader(path), **kwargs)
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self._reader.schema
+
+    @property
+    def fields(self) -> List[str]:
+        names = list(self._reader.schema.names)
+        if self._row_id_field:
+            names.insert(0, self._row_id_field)
+        return names
+
+    @property
+    def num_rows(self) -> int:
+        return int(self._offsets[-1])
+
+    def fetch(self, request: RemoteRequest) -> Tuple[List[Dict], int]:
+        with self._lock:
+            selection = self._select(request.filters)
+            order = self._order(request.sorters)
+
+            if order is None and selection is None:
+                # the rows of the page are in file order, positions of all rows would take memory per row
+                start, stop = request.page_range(self.num_rows)
+                positions = np.arange(start, stop, dtype=np.int64)
+                return self._rows_at(positions), self.num_rows
+
+            if order is None:
+                positions = selection
+            elif selection is None:
+                positions = order
+            else:
+                selected = np.zeros(self.num_rows, dtype=bool)
+                selected[selection] = True
+                positions = order[selected[order]]
+
+            start, stop = request.page_range(len(positions))
+            return self._rows_at(positions[start:stop]), len(positions)
+
+    def _cached(self, cache: OrderedDict, key, compute):
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        value = compute()
+        cache[key] = value
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return value
+
+    def _read_group(self, group: int) -> pa.Table:
+        return self._cached(self._groups, group, lambda: self._reader.read(group))
+
+    def _read_columns(self, columns: List[str]) -> pa.Table:
+        return pa.concat_tables(
+            self._reader.read(group, columns)
+            for group in range(len(self._reader.group_rows))
+        )
+
+    def _select(self, filters: List[RemoteFilter]) -> Optional[np.ndarray]:
+        filters = [flt for flt in filters if flt.field != self._row_id_field]
+        if not filters:
+            return None
+
+        key = tuple((flt.field, flt.type, repr(flt.value)) for flt in filters)
+
+        def compute():
+            columns = list(dict.fromkeys(flt.field for flt in filters))
+            matches: List[np.ndarray] = []
+            for group in range(len(self._reader.group_rows)):
+                if not all(
+                    _may_match(
+                        self._reader.statistics(group, flt.field),
+                        flt,
+                        self._reader.schema.field(flt.field).type,
+                    )
+                    for flt in filters
+                ):
+                    continue
+                table = self._reader.read(group, columns)
+                mask = _filter_mask(table[filters[0].field], filters[0])
+                for flt in filters[1:]:
+                    mask = pc.and_(mask, _filter_mask(table[flt.field], flt))
+                mask = pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+                matches.append(np.flatnonzero(mask) + self._offsets[group])
+            return np.concatenate(matches) if matches else np.empty(0, dtype=np.int64)
+
+        return self._cached(self._selections, key, compute)
+
+    def _order(self, sorters: List[RemoteSorter]) -> Optional[np.ndarray]:
+        # Tabulator sends the primary sorter last
+        sort_keys = [
+            (s.field, "descending" if s.descending else "ascending")
+            for s in reversed(sorters)
+        ]
+        # the row id is the natural order of the file, it only matters as the primary key
+        if sort_keys and sort_keys[0][0] == self._row_id_field:
+            return (
+                None
+                if sort_keys[0][1] == "ascending"
+                else np.arange(self.num_rows - 1, -1, -1)
+            )
+        sort_keys = [key for key in sort_keys if key[0] != self._row_id_field]
+        if not sort_keys:
+            return None
+
+        def compute():
+            table = self._read_columns(list(dict.fromkeys(f for f, _ in sort_keys)))
+            return (
+                pc.sort_indices(table, sort_keys=sort_keys).to_numpy().astype(np.int64)
+            )
+
+        return self._cached(self._orders, tuple(sort_keys), compute)
+
+    def _rows_at(self, positions: np.ndarray) -> List[Dict]:
+        if len(positions) == 0:
+            return []
+
+        groups = np.searchsorted(self._offsets, positions, side="right") - 1
+        rows: List[Optional[Dict]] = [None] * len(positions)
+        for group in np.unique(groups):
+            slots = np.flatnonzero(groups == group)
+            local = positions[slots] - self._offsets[group]
+            table = self._read_group(int(group)).take(pa.array(local))
+            for slot, row in zip(slots, _json_rows(table)):
+                rows[slot] = row
+
+        if self._row_id_field:
+            for row, position in zip(rows, positions):
+                row[self._row_id_field] = int(position)  # type: ignore[index]
+        return rows  # type: ignore[return-value]
+
+
+def _json_rows(table: pa.Table) -> Iterable[Dict]:
+    columns = [
+        column if _is_json_friendly(column.type) else pc.cast(column, pa.string())
+        for column in table.columns
+    ]
+    return pa.Table.from_arrays(columns, names=table.column_names).to_pylist()
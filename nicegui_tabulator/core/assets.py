@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+from nicegui import app
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSETS_URL = "/_nicegui_tabulator/assets"
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass
+class _Asset:
+    media_type: str
+    content: bytes
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+    """The precompressed content by `Content-Encoding`."""
+
+
+_assets: Dict[str, _Asset] = {}
+_urls: Dict[Path, str] = {}
+
+
+def asset_url(path: Path) -> str:
+    """The URL serving the file under a name containing its content hash.
+
+    The file is compressed once, with gzip and (if the `brotli` package is installed) brotli, and served with
+    immutable cache headers, so browsers never revalidate it; a changed file gets a new URL.
+    """
+    path = path.resolve()
+    if path not in _urls:
+        content = path.read_bytes()
+        name = f"{path.stem}.{hashlib.sha256(content).hexdigest()[:16]}{path.suffix}"
+        asset = _Asset(
+            media_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            content=content,
+        )
+        asset.encoded["gzip"] = gzip.compress(content, compresslevel=9, mtime=0)
+        if brotli is not None:
+            asset.encoded["br"] = brotli.compress(content)
+        _assets[name] = asset
+        _urls[path] = f"{ASSETS_URL}/{name}"
+    return _urls[path]
+
+
+def _accepted_encodings(request: Request):
+    return {
+        token.split(";")[0].strip()
+        for token in request.headers.get("accept-encoding", "").split(",")
+    }
+
+
+@app.get(ASSETS_URL + "/{name}")
+def _get_asset(name: str, request: Request) -> Response:
+    if name not in _assets:
+        raise HTTPException(status_code=404, detail=f'asset "{name}" not found')
+    asset = _assets[name]
+
+    accepted = _accepted_encodings(request)
+    encoding = next(
+        (enc for enc in ("br", "gzip") if enc in accepted and enc in asset.encoded),
+        None,
+    )
+    headers = {
+        "Cache-Control": _CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "ETag": f'"{name}-{encoding or "identity"}"',
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+
+    if encoding is None:
+        return Response(asset.content, media_type=asset.media_type, headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(
+        asset.encoded[encoding], media_type=asset.media_type, headers=headers
+    )
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+RESET_METHODS = frozenset({"setData", "clearData"})
+"""Changes that replace all rows, so no earlier change has to be replayed after them."""
+
+
+@dataclass(frozen=True)
+class Change:
+    version: int
+    """The data version reached by applying this change."""
+    method: str
+    """The Tabulator method applying the change, e.g. `"updateData"`."""
+    data: Optional[List[Dict]]
+    """The rows passed to the method."""
+    args: tuple = ()
+    """The remaining arguments of the method."""
+
+
+class ChangeLog:
+    """The data version of a table and a bounded log of its latest changes.
+
+    A client that reconnects reports the version it has. If the changes since then are still in the log they are
+    replayed, otherwise the client has to be sent all rows again.
+    """
+
+    def __init__(self, max_changes: int = 100, max_rows: int = 10_000):
+        """
+        Args:
+            max_changes (int, optional): The maximum number of changes kept. Defaults to 100.
+            max_rows (int, optional): The maximum number of rows kept across all changes. Defaults to 10_000.
+        """
+        self.max_changes = max_changes
+        self.max_rows = max_rows
+        self.version = 0
+        """Incremented with every change."""
+        self._changes: Deque[Change] = deque()
+        self._num_rows = 0
+        self._oldest_resumable = 0
+
+    def record(
+        self, method: str, data: Optional[List[Dict]] = None, args: tuple = ()
+    ) -> int:
+        """Record a change and return the new version."""
+        self.version += 1
+        if method in RESET_METHODS:
+            self._changes.clear()
+            self._num_rows = 0
+            self._oldest_resumable = self.version
+            return self.version
+
+        self._changes.append(Change(self.version, method, data, args))
+        self._num_rows += len(data or [])
+        while self._changes and (
+            len(self._changes) > self.max_changes or self._num_rows > self.max_rows
+        ):
+            dropped = self._changes.popleft()
+            self._num_rows -= len(dropped.data or [])
+            self._oldest_resumable = dropped.version
+        return self.version
+
+    def since(self, version: int) -> Optional[List[Change]]:
+        """The changes a client at `version` has missed, or `None` if they are no longer all in the log."""
+        if version < self._oldest_resumable or version > self.version:
+            return None
+        return [change for change in self._changes if change.version > version]
@@ -1,30 +1,62 @@
-from typing import Final
+from pathlib import Path
+from typing import Dict, Final, Iterable, Optional
 from nicegui import ui
 
+from .assets import asset_url
+
 LUXON_DEFAULT_SCRIPT_URL: Final[str] = (
     "https://cdn.jsdelivr.net/npm/luxon@3/build/global/luxon.min.js"
 )
+"""Luxon's global build on jsDelivr. By default, Luxon is served from the copy shipped with this package."""
+
+_LUXON_PATH = Path(__file__).parent / "libs" / "luxon.min.js"
+
+_LUXON_FORMATTERS = frozenset({"datetime", "datetimediff"})
+_LUXON_SORTERS = frozenset({"date", "time", "datetime"})
+
 
+def uses_luxon(columns: Iterable[Dict]) -> bool:
+    """Whether any of the column definitions, or of their column groups, uses a formatter or sorter requiring Luxon."""
+    for column in columns:
+        if (
+            column.get("formatter") in _LUXON_FORMATTERS
+            or column.get("sorter") in _LUXON_SORTERS
+        ):
+            return True
+        if uses_luxon(column.get("columns") or []):
+            return True
+    return False
 
-def import_luxon(shared: bool = True, script_url: str = LUXON_DEFAULT_SCRIPT_URL):
+
+def luxon_url() -> str:
+    """The URL of the Luxon copy shipped with this package, served by the app itself, so it works offline."""
+    return asset_url(_LUXON_PATH)
+
+
+def import_luxon(shared: bool = True, script_url: Optional[str] = None):
     """Inject Luxon into the page so Tabulator date/time features can work.
 
     Tabulator's date/time formatters and sorters require Luxon to be available in the
-    browser environment. Call this function **before** creating tables that use any of:
-    - ``formatter: "datetime"``
-    - ``sorter: "date"`` or ``sorter: "datetime"``
-    - editors that depend on Luxon (if used in the future)
+    browser environment. Tables whose column definitions use any of the following load
+    the Luxon copy shipped with this package by themselves, unless it is already loaded:
+    - ``formatter: "datetime"`` or ``formatter: "datetimediff"``
+    - ``sorter: "date"``, ``sorter: "time"`` or ``sorter: "datetime"``
+
+    Call this function to load Luxon from another URL, or for date/time features used
+    in other ways (e.g. in custom formatters).
 
     Args:
         shared:  Whether to import the dependency for all clients or only the current client.
          `True`(default): import for all clients.
          `False`: import only for the current client.
-        script_url: The URL of Luxon's global build. Override this if you self-host
-            Luxon or want to pin to a different version.
+        script_url: The URL of Luxon's global build. Defaults to the copy shipped with this
+            package. Override this to load another version, e.g. `LUXON_DEFAULT_SCRIPT_URL`.
 
     Notes:
         - Call it once during your page/app setup, before creating Tabulator grids that
           require date/time formatting/sorting.
     """
 
-    ui.add_head_html(f'<script src="{script_url}"></script>', shared=shared)
+    ui.add_head_html(
+        f'<script src="{script_url or luxon_url()}"></script>', shared=shared
+    )
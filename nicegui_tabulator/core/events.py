@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import (
     Any,
+    Optional,
 )
 
 from nicegui.events import UiEventArguments
@@ -12,3 +13,17 @@ from nicegui.dataclasses import KWONLY_SLOTS
 @dataclass(**KWONLY_SLOTS)
 class TabulatorEventArguments(UiEventArguments):
     args: Any
+
+
+@dataclass(**KWONLY_SLOTS)
+class DataProgressEventArguments(UiEventArguments):
+    loaded_rows: int
+    """The number of rows pushed to the client so far."""
+    total_rows: Optional[int]
+    """The total number of rows, if known."""
+    bytes_read: Optional[int] = None
+    """The number of bytes read from the source, if it is a file."""
+    total_bytes: Optional[int] = None
+    """The size of the source in bytes, if it is a file."""
+    done: bool = False
+    """Whether all rows have been pushed."""
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import hashlib
+import weakref
+from typing import Any, Dict, Set
+
+from nicegui import Client
+
+FUNCTION_REF_KEY = "__ngt_fn__"
+"""Marks a reference to a function registered on the client, see `tabulator.js`."""
+
+_sent_functions: weakref.WeakKeyDictionary[Client, Set[str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def function_id(source: str) -> str:
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+
+def extract_functions(value: Any, functions: Dict[str, str]) -> Any:
+    """Replace the `:`-prefixed string properties in `value` with references to functions.
+
+    The sources are collected in `functions` by their id. `value` is not modified.
+    """
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if isinstance(key, str) and key.startswith(":") and isinstance(item, str):
+                ref = function_id(item)
+                functions[ref] = item
+                result[key[1:]] = {FUNCTION_REF_KEY: ref}
+            else:
+                result[key] = extract_functions(item, functions)
+        return result
+    if isinstance(value, (list, tuple)):
+        return [extract_functions(item, functions) for item in value]
+    return value
+
+
+def unsent_functions(client: Client, functions: Dict[str, str]) -> Dict[str, str]:
+    """The functions that have not been sent to `client` yet; they are considered sent from now on."""
+    sent = _sent_functions.setdefault(client, set())
+    unsent = {ref: source for ref, source in functions.items() if ref not in sent}
+    sent.update(unsent)
+    return unsent
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import itertools
+import weakref
+from typing import Dict, Set, Tuple
+
+from nicegui import Client
+
+_presets: Dict[str, Tuple[str, Dict]] = {}
+_registrations = itertools.count()
+_sent_presets: weakref.WeakKeyDictionary[Client, Set[str]] = weakref.WeakKeyDictionary()
+
+
+def register_preset(name: str, options: Dict) -> None:
+    """Register options shared by many tables, e.g. locales, column sets or formatter params.
+
+    Tables reference the preset by name with `tabulator(options, presets=[name])`. The preset is sent to each client
+    once, no matter how many tables use it, and the options of the table take precedence over it.
+    Registering a name again only affects tables created afterwards.
+
+    Args:
+        name (str): The name of the preset.
+        options (Dict): The tabulator options of the preset.
+
+    ## Example Usage
+
+    .. code-block:: python
+        from nicegui_tabulator import tabulator, register_preset
+
+        register_preset("cn", {"langs": {"cn": {...}}, "locale": "cn"})
+
+        tabulator({"data": [...], "columns": [...]}, presets=["cn"])
+
+    """
+    _presets[name] = (f"{name}:{next(_registrations)}", options)
+
+
+def get_preset(name: str) -> Tuple[str, Dict]:
+    """The id and options of the registered preset."""
+    if name not in _presets:
+        raise ValueError(f"Unknown preset '{name}', register it with `register_preset`")
+    return _presets[name]
+
+
+def unsent_presets(client: Client, presets: Dict[str, Dict]) -> Dict[str, Dict]:
+    """The presets that have not been sent to `client` yet; they are considered sent from now on."""
+    sent = _sent_presets.setdefault(client, set())
+    unsent = {ref: options for ref, options in presets.items() if ref not in sent}
+    sent.update(unsent)
+    return unsent
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class RemoteSorter:
+    field: str
+    """The field to sort by."""
+    dir: str = "asc"
+    """The direction of the sort, `"asc"` or `"desc"`."""
+
+    @property
+    def descending(self) -> bool:
+        return self.dir == "desc"
+
+
+@dataclass
+class RemoteFilter:
+    field: str
+    """The field to filter on."""
+    type: str
+    """The Tabulator filter type, e.g. `"="`, `"like"` or `"<"`."""
+    value: Any
+    """The value to compare against."""
+
+
+@dataclass
+class RemoteRequest:
+    """A page request sent by a remotely paginated table.
+
+    Mirrors the params Tabulator sends when `paginationMode`, `sortMode` and `filterMode` are `"remote"`.
+    """
+
+    page: int = 1
+    """The requested page, starting from 1."""
+    size: Optional[int] = None
+    """The page size. `None` means all rows."""
+    sorters: List[RemoteSorter] = field(default_factory=list)
+    """The active sorters in Tabulator's order: the **last** sorter is the primary one."""
+    filters: List[RemoteFilter] = field(default_factory=list)
+    """The active filters, header filters included."""
+
+    @classmethod
+    def from_params(cls, params: Dict) -> RemoteRequest:
+        size = params.get("size")
+        return cls(
+            page=int(params.get("page") or 1),
+            size=int(size) if size else None,
+            sorters=[
+                RemoteSorter(field=s["field"], dir=s.get("dir", "asc"))
+                for s in params.get("sort") or []
+            ],
+            filters=[
+                RemoteFilter(
+                    field=f["field"], type=f.get("type", "="), value=f.get("value")
+                )
+                for f in params.get("filter") or []
+                if isinstance(f.get("field"), str)
+            ],
+        )
+
+    @property
+    def offset(self) -> int:
+        """The position of the first row of the requested page."""
+        return (self.page - 1) * self.size if self.size else 0
+
+    def page_range(self, total: int) -> Tuple[int, int]:
+        """The `[start, stop)` positions of the requested page within `total` rows."""
+        if not self.size:
+            return 0, total
+        start = min(self.offset, total)
+        return start, min(start + self.size, total)
+
+    def to_response(self, rows: List[Dict], total: int) -> Dict:
+        last_page = max(1, math.ceil(total / self.size)) if self.size else 1
+        return {"last_page": last_page, "last_row": total, "data": rows}
+
+
+class RemoteDataSource(ABC):
+    """Serves the pages of a remotely paginated table from the server.
+
+    A data source is passed to `Tabulator(options, data_source=...)`; the table then asks the source for each page,
+    sort and filter instead of holding all rows on the client.
+    """
+
+    @property
+    @abstractmethod
+    def fields(self) -> List[str]:
+        """The fields available in each row."""
+
+    @abstractmethod
+    def fetch(self, request: RemoteRequest) -> Tuple[List[Dict], int]:
+        """Return the rows of the requested page and the total number of rows that match the request's filters.
+
+        This is called in a separate thread, so it can block on I/O.
+        """
+
+
+def apply_remote_options(options: Dict) -> Dict:
+    """Configure table options so that pages, sorts and filters are served by the server."""
+    options.setdefault("pagination", True)
+    options.setdefault("paginationSize", 50)
+    options["paginationMode"] = "remote"
+    options["sortMode"] = "remote"
+    options["filterMode"] = "remote"
+    return options
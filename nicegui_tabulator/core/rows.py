@@ -0,0 +1,708 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import numbers
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+from numpy.dtypes import StringDType
+
+from . import utils
+from .remote import RemoteDataSource, RemoteFilter, RemoteRequest, RemoteSorter
+from .search import SearchIndex, words
+
+_SortKey = Tuple[str, bool]
+"""A field and whether it is sorted in descending order."""
+
+_MAX_RANK_INSERTS = 64
+"""New distinct values inserted one by one; more are merged into the ranks of the column at once."""
+_MAX_PATCHED_ROWS = 1024
+"""Changed rows moved within the cached permutations of a field; more changes sort the field again."""
+
+_TEXT_FILTERS = frozenset({"like", "starts", "ends", "regex", "keywords"})
+_COMPARISON_FILTERS = frozenset({"=", "!=", "<", "<=", ">", ">="})
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _value_key(value: Any) -> Tuple:
+    """Orders values of mixed types: numbers before text before anything else."""
+    if isinstance(value, numbers.Real):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return (2, repr(value))
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+def _number_value(key: float) -> Union[int, float]:
+    # shown without a fraction in the browser, e.g. for `like` filters
+    return int(key) if key.is_integer() else key
+
+
+class _Column:
+    """The values of a field as an array of float sort keys, missing values being NaN.
+
+    Numbers are their own keys. Other values are replaced by a rank that orders them among the distinct values of the
+    field. A value the field did not have before gets a rank between those of its neighbours, so the keys of the other
+    rows, and the orders built from them, stay valid.
+    """
+
+    def __init__(self, values: List[Any]):
+        types = {type(value) for value in values}
+        types.discard(type(None))
+        self._ranks: Optional[Dict[Any, float]] = None
+        self._distinct: List[Any] = []
+        self._value_key: Callable[[Any], Any] = _value_key
+        self._codes: Optional[Tuple[List[Any], np.ndarray]] = None
+        self._texts: Optional[np.ndarray] = None
+        if all(issubclass(t, numbers.Real) for t in types):
+            # None becomes NaN
+            self.keys = np.array(values, dtype=np.float64)
+            return
+
+        if types <= {str}:
+            # text is ordered as it is, and a value of another type is never one of the ranked ones
+            self._value_key = _same
+            self._distinct = sorted(set(values) - {None})
+            self._ranks = {key: float(rank) for rank, key in enumerate(self._distinct)}
+            keys = map({**self._ranks, None: math.nan}.__getitem__, values)
+        else:
+            self._distinct = sorted(
+                {_value_key(v) for v in values if not _is_missing(v)}
+            )
+            self._ranks = {key: float(rank) for rank, key in enumerate(self._distinct)}
+            keys = map(self._key, values)
+        self.keys = np.fromiter(keys, dtype=np.float64, count=len(values))
+
+    def _key(self, value: Any) -> Optional[float]:
+        """The sort key of the value, or `None` if the column has no key for it."""
+        if _is_missing(value):
+            return math.nan
+        if self._ranks is None:
+            return float(value) if isinstance(value, numbers.Real) else None
+        return self._ranks.get(self._value_key(value))
+
+    def _neighbour_ranks(self, index: int) -> Tuple[Optional[float], Optional[float]]:
+        """The ranks of the distinct values before and at `index`, if any."""
+        lower = self._ranks[self._distinct[index - 1]] if index > 0 else None
+        upper = (
+            self._ranks[self._distinct[index]] if index < len(self._distinct) else None
+        )
+        return lower, upper
+
+    def _rank_between(self, index: int) -> float:
+        """A rank between those of the distinct values before and at `index`."""
+        lower, upper = self._neighbour_ranks(index)
+        if lower is None:
+            return 0.0 if upper is None else upper - 1
+        return lower + 1 if upper is None else (lower + upper) / 2
+
+    def _add_distinct(self, values: Iterable[Any]) -> bool:
+        """Rank the values the column does not have yet, or return `False` if they cannot be ordered with its values."""
+        value_keys = {
+            self._value_key(value) for value in values if not _is_missing(value)
+        }
+        value_keys = {key for key in value_keys if key not in self._ranks}
+        if not value_keys:
+            return True
+        self._codes = None
+        try:
+            value_keys = sorted(value_keys)
+            if len(value_keys) > _MAX_RANK_INSERTS:
+                self._texts = None
+                self._rerank(list(heapq.merge(self._distinct, value_keys)))
+                return True
+            # the positions of the new values among the old ones
+            slots: List[int] = []
+            for value_key in value_keys:
+                index = bisect.bisect_left(self._distinct, value_key)
+                slots.append(index - len(slots))
+                neighbours = self._neighbour_ranks(index)
+                rank = self._rank_between(index)
+                self._distinct.insert(index, value_key)
+                if rank in neighbours:
+                    # no float left between the ranks of the neighbours
+                    self._rerank(self._distinct)
+                else:
+                    self._ranks[value_key] = rank
+        except TypeError:
+            return False
+        if self._texts is not None:
+            texts = [str(self._value(value_key)) for value_key in value_keys]
+            self._texts = np.insert(
+                self._texts,
+                slots,
+                np.strings.lower(np.array(texts, dtype=StringDType())),
+            )
+        return True
+
+    def _value(self, value_key: Any) -> Any:
+        """The value a distinct value key of a ranked column stands for."""
+        return value_key if self._value_key is _same else value_key[1]
+
+    def _rerank(self, distinct: List[Any]) -> None:
+        """Number the sorted distinct values again. This changes the keys of the rows, but not their order."""
+        ranked = [key for key in distinct if key in self._ranks]
+        before = np.array([self._ranks[key] for key in ranked], dtype=np.float64)
+        self._ranks = {key: float(rank) for rank, key in enumerate(distinct)}
+        after = np.array([self._ranks[key] for key in ranked], dtype=np.float64)
+        present = ~np.isnan(self.keys)
+        self.keys[present] = after[np.searchsorted(before, self.keys[present])]
+        self._distinct = distinct
+
+    def search_key(self, value: Any) -> Optional[float]:
+        """The key a filter value is compared by, or `None` if it cannot be compared with the values of the field.
+
+        This is the key of an equal value if the field has one, otherwise a key between those of its neighbours.
+        """
+        if self._ranks is None:
+            try:
+                key = float(value)
+            except (TypeError, ValueError):
+                return None
+            return None if math.isnan(key) else key
+
+        value_key = self._value_key(str(value) if self._value_key is _same else value)
+        if value_key in self._ranks:
+            return self._ranks[value_key]
+        try:
+            return self._rank_between(bisect.bisect_left(self._distinct, value_key))
+        except TypeError:
+            return None
+
+    def distinct(self) -> Tuple[List[Any], np.ndarray]:
+        """The distinct values of the field in order, and the position of the value of each row among them.
+
+        Missing values are at the position after the last value.
+        """
+        if self._codes is None:
+            if self._ranks is None:
+                keys = np.unique(self.keys[~np.isnan(self.keys)])
+                values = [_number_value(float(key)) for key in keys]
+            else:
+                # the ranks increase with the distinct values
+                keys = np.sort(
+                    np.fromiter(
+                        self._ranks.values(), dtype=np.float64, count=len(self._ranks)
+                    )
+                )
+                values = (
+                    self._distinct
+                    if self._value_key is _same
+                    else [self._value(key) for key in self._distinct]
+                )
+            if np.array_equal(keys, np.arange(len(keys))):
+                # ranks without values inserted between them are the positions already
+                codes = np.nan_to_num(self.keys, nan=len(keys)).astype(np.intp)
+            else:
+                # NaN is sorted after all keys
+                codes = np.searchsorted(keys, self.keys)
+            self._codes = (values, codes)
+        return self._codes
+
+    def texts(self) -> np.ndarray:
+        """The distinct values of the field as lowercase text, in the order of `distinct`."""
+        if self._texts is None:
+            values, _ = self.distinct()
+            if self._value_key is not _same:
+                values = [str(value) for value in values]
+            texts = np.array(values, dtype=StringDType())
+            self._texts = np.strings.lower(texts)
+        return self._texts
+
+    def set(self, position: int, value: Any) -> bool:
+        if self._ranks is not None and not self._add_distinct([value]):
+            return False
+        key = self._key(value)
+        if key is None:
+            return False
+        self.keys[position] = key
+        self._codes = None
+        if self._ranks is None:
+            self._texts = None
+        return True
+
+    def extend(self, values: List[Any]) -> bool:
+        if self._ranks is not None and not self._add_distinct(values):
+            return False
+        keys = [self._key(v) for v in values]
+        if any(key is None for key in keys):
+            return False
+        self.keys = np.concatenate((self.keys, np.array(keys, dtype=np.float64)))
+        self._codes = None
+        if self._ranks is None:
+            self._texts = None
+        return True
+
+
+def _signed(keys: np.ndarray, descending: bool) -> np.ndarray:
+    # negating keeps NaN, so missing values are last in both directions
+    return -keys if descending else keys
+
+
+class _SortEngine:
+    """Orders row positions by the sort keys of their columns.
+
+    The permutation of each sorted field and direction is cached. Multi-column sorts are composed from the cached
+    permutation of the least significant field, refined by stable sorts on the more significant ones. A permutation
+    orders the rows by key, and rows with equal keys by position, as a stable sort does; changes keep it that way.
+    """
+
+    def __init__(self, column: Callable[[str], _Column], cache_size: int):
+        self._column = column
+        self._cache_size = cache_size
+        self._permutations: Dict[_SortKey, np.ndarray] = {}
+        self._orders: OrderedDict[Tuple[_SortKey, ...], np.ndarray] = OrderedDict()
+        self._sorted_keys: Dict[str, np.ndarray] = {}
+
+    def order(self, sort_keys: List[_SortKey]) -> Optional[np.ndarray]:
+        """The positions of the rows in sorted order, or `None` to keep their order.
+
+        `sort_keys` are in Tabulator's order: the **last** one is the primary key.
+        """
+        if not sort_keys:
+            return None
+        if len(sort_keys) == 1:
+            return self.permutation(sort_keys[0])
+
+        key = tuple(sort_keys)
+        if key in self._orders:
+            self._orders.move_to_end(key)
+            return self._orders[key]
+
+        order = self.permutation(sort_keys[0])
+        for field, descending in sort_keys[1:]:
+            keys = _signed(self._column(field).keys, descending)
+            order = order[np.argsort(keys[order], kind="stable")]
+
+        self._orders[key] = order
+        if len(self._orders) > self._cache_size:
+            self._orders.popitem(last=False)
+        return order
+
+    def permutation(self, sort_key: _SortKey) -> np.ndarray:
+        if sort_key not in self._permutations:
+            field, descending = sort_key
+            keys = _signed(self._column(field).keys, descending)
+            self._permutations[sort_key] = np.argsort(keys, kind="stable")
+        return self._permutations[sort_key]
+
+    def sorted_keys(self, field: str) -> np.ndarray:
+        """The keys of the field in ascending order, missing values last."""
+        if field not in self._sorted_keys:
+            self._sorted_keys[field] = self._column(field).keys[
+                self.permutation((field, False))
+            ]
+        return self._sorted_keys[field]
+
+    def invalidate(self, fields: Iterable[str]) -> None:
+        """Drop the orders depending on the given fields, e.g. because values of them changed."""
+        fields = set(fields)
+        for sort_key in [k for k in self._permutations if k[0] in fields]:
+            del self._permutations[sort_key]
+        self.invalidate_orders(fields)
+
+    def invalidate_orders(self, fields: Iterable[str]) -> None:
+        """Drop the multi-column orders and sorted keys depending on the given fields, keeping their permutations."""
+        fields = set(fields)
+        for key in [k for k in self._orders if any(field in fields for field, _ in k)]:
+            del self._orders[key]
+        for field in fields:
+            self._sorted_keys.pop(field, None)
+
+    def update(self, field: str, positions: np.ndarray) -> None:
+        """Move rows whose keys of the field changed to their new places in its cached permutations.
+
+        Args:
+            field (str): The field whose column holds the new keys.
+            positions (np.ndarray): The positions of the changed rows, ascending.
+        """
+        self.invalidate_orders([field])
+        for descending in (False, True):
+            permutation = self._permutations.get((field, descending))
+            if permutation is None:
+                continue
+            keys = _signed(self._column(field).keys, descending)
+            moved = np.zeros(len(keys), dtype=bool)
+            moved[positions] = True
+            remaining = permutation[~moved[permutation]]
+            remaining_keys = keys[remaining]
+
+            moved_order = positions[np.argsort(keys[positions], kind="stable")]
+            moved_keys = keys[moved_order]
+            starts = np.searchsorted(remaining_keys, moved_keys, side="left")
+            stops = np.searchsorted(remaining_keys, moved_keys, side="right")
+            # among equal keys, by position
+            slots = [
+                start + np.searchsorted(remaining[start:stop], position)
+                for start, stop, position in zip(starts, stops, moved_order)
+            ]
+            self._permutations[(field, descending)] = np.insert(
+                remaining, slots, moved_order
+            )
+
+    def extend(self, start: int, count: int) -> None:
+        """Merge rows appended at `start` into the cached permutations, their columns already being extended."""
+        self._orders.clear()
+        self._sorted_keys.clear()
+        added = np.arange(start, start + count)
+        for (field, descending), permutation in self._permutations.items():
+            keys = _signed(self._column(field).keys, descending)
+            added_order = added[np.argsort(keys[added], kind="stable")]
+            # after equal keys, as a stable sort of all rows would place them
+            slots = np.searchsorted(keys[permutation], keys[added_order], side="right")
+            self._permutations[(field, descending)] = np.insert(
+                permutation, slots, added_order
+            )
+
+    def clear(self) -> None:
+        self._permutations.clear()
+        self._orders.clear()
+        self._sorted_keys.clear()
+
+
+def _text_hits(column: _Column, flt: RemoteFilter) -> np.ndarray:
+    """Whether each distinct value of a column passes a text filter, the way `ArrowDataSource` evaluates it."""
+    target = str(flt.value)
+    if flt.type == "regex":
+        # NumPy has no regular expressions
+        pattern = re.compile(target)
+        values, _ = column.distinct()
+        return np.fromiter(
+            (pattern.search(str(value)) is not None for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+
+    texts, target = column.texts(), target.lower()
+    if flt.type == "starts":
+        return np.strings.startswith(texts, target)
+    if flt.type == "ends":
+        return np.strings.endswith(texts, target)
+    keywords = target.split() if flt.type == "keywords" else [target]
+    if not keywords:
+        return np.ones(len(texts), dtype=bool)
+    hits = np.zeros(len(texts), dtype=bool)
+    for keyword in keywords:
+        hits |= np.strings.find(texts, keyword) >= 0
+    return hits
+
+
+class _FilterEngine:
+    """Selects the row positions matching Tabulator filters.
+
+    Comparisons look the filter value up in the ranks of the field, a hash index, and find the matching rows by
+    binary search in the cached ascending order of the field, a sorted index. Text filters run NumPy string functions
+    on the lowercase distinct values of the field, cached with its keys, instead of looping over rows in Python; only
+    regular expressions are matched value by value.
+    """
+
+    def __init__(
+        self, column: Callable[[str], _Column], sorts: _SortEngine, cache_size: int
+    ):
+        self._column = column
+        self._sorts = sorts
+        self._cache_size = cache_size
+        self._selections: OrderedDict[Tuple, np.ndarray] = OrderedDict()
+
+    def select(
+        self, filters: List[RemoteFilter], num_rows: int
+    ) -> Optional[np.ndarray]:
+        """The positions of the rows matching all filters in ascending order, or `None` if there are no filters."""
+        if not filters:
+            return None
+
+        key = tuple((flt.field, flt.type, repr(flt.value)) for flt in filters)
+        if key in self._selections:
+            self._selections.move_to_end(key)
+            return self._selections[key]
+
+        mask = self._mask(filters[0], num_rows)
+        for flt in filters[1:]:
+            mask &= self._mask(flt, num_rows)
+        selection = np.flatnonzero(mask)
+
+        self._selections[key] = selection
+        if len(self._selections) > self._cache_size:
+            self._selections.popitem(last=False)
+        return selection
+
+    def clear(self) -> None:
+        self._selections.clear()
+
+    def _mask(self, flt: RemoteFilter, num_rows: int) -> np.ndarray:
+        column = self._column(flt.field)
+        if flt.type in _TEXT_FILTERS:
+            _, codes = column.distinct()
+            # missing values are at the position after the last value
+            return np.append(_text_hits(column, flt), False)[codes]
+
+        mask = np.zeros(num_rows, dtype=bool)
+        if flt.type == "in":
+            for value in flt.value if isinstance(flt.value, list) else [flt.value]:
+                mask[self._range(flt.field, column.search_key(value), "=")] = True
+            return mask
+
+        if flt.type not in _COMPARISON_FILTERS:
+            raise ValueError(f"Unsupported remote filter type '{flt.type}'")
+        key = column.search_key(flt.value)
+        if flt.type == "!=":
+            mask[self._range(flt.field, key, "=")] = True
+            return ~mask
+        mask[self._range(flt.field, key, flt.type)] = True
+        return mask
+
+    def _range(self, field: str, key: Optional[float], comparison: str) -> np.ndarray:
+        """The positions of the rows whose keys compare with `key` as given."""
+        if key is None:
+            return np.empty(0, dtype=np.int64)
+        keys = self._sorts.sorted_keys(field)
+        # missing values are last, after the infinite ones
+        present = int(np.searchsorted(keys, np.inf, side="right"))
+        start, stop = {
+            "=": (
+                np.searchsorted(keys, key, side="left"),
+                np.searchsorted(keys, key, side="right"),
+            ),
+            "<": (0, np.searchsorted(keys, key, side="left")),
+            "<=": (0, np.searchsorted(keys, key, side="right")),
+            ">": (np.searchsorted(keys, key, side="right"), present),
+            ">=": (np.searchsorted(keys, key, side="left"), present),
+        }[comparison]
+        return self._sorts.permutation((field, False))[start:stop]
+
+
+class RowsDataSource(RemoteDataSource):
+    """A remote data source serving rows held in memory on the server.
+
+    Used by `tabulator(options, server_side=True)`. Sorts and filters are evaluated on NumPy arrays of sort keys, built
+    per field on first use, and the order of each sorted field and direction is cached; it doubles as the index of
+    range and equality filters. Changes made through the methods of this class keep the cached orders: updated rows
+    are moved to their new places in them, and rows added at the bottom are merged into them, values the field did not
+    have before included. Only large updates sort the changed fields again, and rows added at the top or next to
+    another row build all keys again. Requires `numpy` 2.0 or later.
+    """
+
+    def __init__(
+        self,
+        rows: Optional[List[Dict]] = None,
+        *,
+        index: str = "id",
+        cache_size: int = 16,
+    ):
+        """
+        Args:
+            rows (Optional[List[Dict]], optional): The initial rows.
+            index (str, optional): The field used as the unique index for each row. Defaults to "id".
+            cache_size (int, optional): The number of multi-column orders and filter results to keep. Defaults to 16.
+        """
+        self._rows: List[Dict] = list(rows or [])
+        self.index_field = index
+        self._cache_size = cache_size
+        # fetches run in a separate thread
+        self._lock = threading.RLock()
+        self._columns: Dict[str, _Column] = {}
+        self._positions: Optional[Dict[Any, int]] = None
+        self._sorts = _SortEngine(self._column, cache_size)
+        self._filters = _FilterEngine(self._column, self._sorts, cache_size)
+        self._search_index: Optional[SearchIndex] = None
+        self._search_query = ""
+        self._search_selection: Optional[np.ndarray] = None
+
+    @property
+    def rows(self) -> List[Dict]:
+        """The rows. Mutate them through the methods of this class so that the cached orders stay valid."""
+        return self._rows
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._rows[0]) if self._rows else []
+
+    def row_position(self, key: Any) -> Optional[int]:
+        """The position of the row with the given index value in `rows`, or `None` if there is no such row."""
+        with self._lock:
+            return self._row_positions().get(key)
+
+    def search(self, query: str) -> None:
+        """Serve only the rows matching a full-text query from now on, see `SearchIndex`. An empty query shows all rows.
+
+        The index is built on the first search and then kept up to date by the methods of this class.
+        """
+        with self._lock:
+            self._search_query = query
+            self._search_selection = None
+
+    def fetch(self, request: RemoteRequest) -> Tuple[List[Dict], int]:
+        with self._lock:
+            selection = self._filters.select(request.filters, len(self._rows))
+            searched = self._searched()
+            if searched is not None:
+                selection = (
+                    searched
+                    if selection is None
+                    else np.intersect1d(selection, searched, assume_unique=True)
+                )
+            order = self._sorts.order(_sort_keys(request.sorters))
+
+            if order is None:
+                positions = (
+                    selection
+                    if selection is not None
+                    else np.arange(len(self._rows), dtype=np.int64)
+                )
+            elif selection is None:
+                positions = order
+            else:
+                selected = np.zeros(len(self._rows), dtype=bool)
+                selected[selection] = True
+                positions = order[selected[order]]
+
+            start, stop = request.page_range(len(positions))
+            return [self._rows[position] for position in positions[start:stop]], len(
+                positions
+            )
+
+    def set_data(self, data: List[Dict]) -> None:
+        """Replace all rows."""
+        with self._lock:
+            self._rows = list(data)
+            self._reset()
+
+    def add_data(
+        self,
+        data: List[Dict],
+        at_top: bool = False,
+        index: Optional[Union[int, str]] = None,
+    ) -> None:
+        """Add rows at the bottom (or top), or next to the row with the given index."""
+        with self._lock:
+            if at_top or index is not None:
+                utils.insert_rows(self._rows, data, self.index_field, at_top, index)
+                self._reset()
+            else:
+                self._extend(data)
+
+    def update_data(self, data: List[Dict]) -> None:
+        """Update existing rows by their index."""
+        with self._lock:
+            self._update(data)
+
+    def update_or_add_data(self, data: List[Dict]) -> None:
+        """Update existing rows by their index and add the others at the bottom."""
+        with self._lock:
+            positions = self._row_positions()
+            records = {record[self.index_field]: record for record in data}
+            self._update(
+                [record for key, record in records.items() if key in positions]
+            )
+            self._extend(
+                [record for key, record in records.items() if key not in positions]
+            )
+
+    def clear_data(self) -> None:
+        """Remove all rows."""
+        self.set_data([])
+
+    def _searched(self) -> Optional[np.ndarray]:
+        """The sorted positions of the rows matching the search query, `None` without a query."""
+        if not words(self._search_query):
+            return None
+        if self._search_selection is None:
+            if self._search_index is None:
+                self._search_index = SearchIndex(self.index_field)
+                self._search_index.update_rows(self._rows)
+            positions = self._row_positions()
+            self._search_selection = np.sort(
+                np.fromiter(
+                    (
+                        positions[key]
+                        for key in self._search_index.search(self._search_query)
+                    ),
+                    dtype=np.int64,
+                )
+            )
+        return self._search_selection
+
+    def _column(self, field: str) -> _Column:
+        if field not in self._columns:
+            self._columns[field] = _Column([row.get(field) for row in self._rows])
+        return self._columns[field]
+
+    def _row_positions(self) -> Dict[Any, int]:
+        if self._positions is None:
+            self._positions = {}
+            for position, row in enumerate(self._rows):
+                self._positions.setdefault(row.get(self.index_field), position)
+        return self._positions
+
+    def _reset(self) -> None:
+        self._columns.clear()
+        self._positions = None
+        self._sorts.clear()
+        self._filters.clear()
+        self._search_index = None
+        self._search_selection = None
+
+    def _update(self, data: List[Dict]) -> None:
+        positions = self._row_positions()
+        changed: Dict[str, Set[int]] = {}
+        for record in data:
+            position = positions.get(record.get(self.index_field))
+            if position is None:
+                continue
+            self._rows[position].update(record)
+            if self._search_index is not None:
+                self._search_index.update_rows([self._rows[position]])
+            for field, value in record.items():
+                changed.setdefault(field, set()).add(position)
+                column = self._columns.get(field)
+                if column is not None and not column.set(position, value):
+                    del self._columns[field]
+        for field, changed_positions in changed.items():
+            if field in self._columns and len(changed_positions) <= _MAX_PATCHED_ROWS:
+                self._sorts.update(
+                    field, np.array(sorted(changed_positions), dtype=np.int64)
+                )
+            else:
+                self._sorts.invalidate([field])
+        if changed:
+            self._filters.clear()
+            self._search_selection = None
+
+    def _extend(self, data: List[Dict]) -> None:
+        if not data:
+            return
+        start = len(self._rows)
+        self._rows.extend(data)
+        if self._positions is not None:
+            for position, row in enumerate(data, start):
+                self._positions.setdefault(row.get(self.index_field), position)
+
+        dropped = [
+            field
+            for field, column in self._columns.items()
+            if not column.extend([row.get(field) for row in data])
+        ]
+        for field in dropped:
+            del self._columns[field]
+        self._sorts.invalidate(dropped)
+        self._sorts.extend(start, len(data))
+        self._filters.clear()
+        if self._search_index is not None:
+            self._search_index.update_rows(data)
+        self._search_selection = None
+
+
+def _sort_keys(sorters: List[RemoteSorter]) -> List[_SortKey]:
+    return [(sorter.field, sorter.descending) for sorter in sorters]
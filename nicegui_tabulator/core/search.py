@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+
+_WORD = re.compile(r"\w+")
+
+
+def words(value: Any) -> List[str]:
+    """The lowercase words of a value, e.g. `["new", "york"]` for `"New York"`."""
+    if value is None:
+        return []
+    return _WORD.findall(str(value).lower())
+
+
+class SearchIndex:
+    """An inverted index from the words in the values of rows to the keys of the rows.
+
+    A query matches the rows that contain, for each of its words, a word starting with it, in any of the indexed
+    fields. The words of each row and the row itself are kept: rows changed in place are indexed again by passing
+    them, or records of their keys, to `update_rows` or `update_records`.
+    """
+
+    def __init__(self, index_field: str, fields: Optional[Iterable[str]] = None):
+        """
+        Args:
+            index_field (str): The field holding the key of each row.
+            fields (Optional[Iterable[str]], optional): The fields to index. Defaults to all fields of each row.
+        """
+        self.index_field = index_field
+        self.fields = frozenset(fields) if fields is not None else None
+        self._row_words: Dict[Any, FrozenSet[str]] = {}
+        self._rows: Dict[Any, Dict] = {}
+        self._postings: Dict[str, Set[Any]] = {}
+        self._sorted_words: Optional[List[str]] = []
+
+    def update_rows(self, rows: Iterable[Dict]) -> None:
+        """Index the rows, replacing the words of indexed rows with the same keys."""
+        for row in rows:
+            key = row.get(self.index_field)
+            self._remove(key)
+            self._add(key, row)
+
+    def update_records(self, records: Iterable[Dict], *, add: bool = False) -> None:
+        """Index again the rows changed by records holding some of their values, e.g. those of `updateData`.
+
+        The indexed rows are looked up by key, so they must have been updated in place.
+
+        Args:
+            records (Iterable[Dict]): The records, each with the key of its row.
+            add (bool, optional): Index the records of keys without a row as new rows, as `updateOrAddData` adds them. Defaults to False.
+        """
+        # the last record of a key is the one a new row is made of
+        records_by_key = {record.get(self.index_field): record for record in records}
+        self.update_rows(
+            self._rows.get(key, record)
+            for key, record in records_by_key.items()
+            if add or key in self._rows
+        )
+
+    def search(self, query: str) -> Set[Any]:
+        """The keys of the rows matching the query, all rows for a query without words."""
+        query_words = words(query)
+        if not query_words:
+            return set(self._row_words)
+
+        result: Optional[Set[Any]] = None
+        for word in sorted(query_words, key=len, reverse=True):
+            keys = self._prefix_matches(word)
+            result = keys if result is None else result & keys
+            if not result:
+                break
+        return result or set()
+
+    def _row_text_words(self, row: Dict) -> FrozenSet[str]:
+        values = (
+            row.values()
+            if self.fields is None
+            else (row.get(field) for field in self.fields)
+        )
+        return frozenset(word for value in values for word in words(value))
+
+    def _add(self, key: Any, row: Dict) -> None:
+        row_words = self._row_text_words(row)
+        self._row_words[key] = row_words
+        self._rows[key] = row
+        for word in row_words:
+            if word not in self._postings:
+                self._postings[word] = set()
+                self._sorted_words = None
+            self._postings[word].add(key)
+
+    def _remove(self, key: Any) -> None:
+        self._rows.pop(key, None)
+        for word in self._row_words.pop(key, ()):
+            keys = self._postings[word]
+            keys.discard(key)
+            if not keys:
+                del self._postings[word]
+                self._sorted_words = None
+
+    def _prefix_matches(self, prefix: str) -> Set[Any]:
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._postings)
+        keys: Set[Any] = set()
+        for i in range(
+            bisect.bisect_left(self._sorted_words, prefix), len(self._sorted_words)
+        ):
+            word = self._sorted_words[i]
+            if not word.startswith(prefix):
+                break
+            keys |= self._postings[word]
+        return keys
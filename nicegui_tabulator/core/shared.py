@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Union
+
+from . import utils
+from .changes import ChangeLog
+
+if TYPE_CHECKING:
+    from .tabulator import Tabulator
+
+
+class SharedData:
+    """Rows that are stored once on the server and shown by any number of tables, across all clients.
+
+    Pass it to `tabulator(options, shared_data=...)`. Every mutation is applied to the shared rows once
+    and the resulting delta is encoded once per distinct transfer configuration and sent to every subscribed table.
+
+    ## Example Usage
+
+    .. code-block:: python
+        from nicegui import ui
+        from nicegui_tabulator import tabulator, SharedData
+
+        prices = SharedData(load_rows(), index="id")
+
+        @ui.page("/")
+        def page():
+            tabulator({"columns": [...]}, shared_data=prices)
+
+        # later, e.g. in a timer: every open page receives the same delta
+        prices.update_data([{"id": 1, "price": 12.5}])
+    """
+
+    def __init__(self, rows: Optional[List[Dict]] = None, *, index: str = "id"):
+        """
+        Args:
+            rows (Optional[List[Dict]], optional): The initial rows.
+            index (str, optional): The field used as the unique index for each row. Defaults to "id".
+        """
+        self._rows: List[Dict] = list(rows or [])
+        self.index_field = index
+        self.changes = ChangeLog()
+        """The version of the rows and their latest changes, replayed to clients that reconnect."""
+        self._tables: weakref.WeakSet[Tabulator] = weakref.WeakSet()
+        self._encoded: Dict[Hashable, Any] = {}
+        self._encoded_version = 0
+
+    @property
+    def rows(self) -> List[Dict]:
+        """The shared rows. Mutate them through the methods of this class so that all tables are updated."""
+        return self._rows
+
+    @property
+    def version(self) -> int:
+        """Incremented with every mutation."""
+        return self.changes.version
+
+    @property
+    def tables(self) -> List[Tabulator]:
+        """The tables currently showing these rows."""
+        return [table for table in self._tables if not table.is_deleted]
+
+    def subscribe(self, table: Tabulator) -> None:
+        self._tables.add(table)
+
+    def unsubscribe(self, table: Tabulator) -> None:
+        self._tables.discard(table)
+
+    def encoded(self, key: Hashable, encode: Callable[[], Any]) -> Any:
+        """Return the current rows encoded with `encode`, computing them once per key and version."""
+        if self._encoded_version != self.version:
+            self._encoded.clear()
+            self._encoded_version = self.version
+        if key not in self._encoded:
+            self._encoded[key] = encode()
+        return self._encoded[key]
+
+    def set_data(self, data: List[Dict]) -> None:
+        """Replace all rows."""
+        self._rows[:] = data
+        self._broadcast("setData", data)
+
+    def add_data(
+        self,
+        data: List[Dict],
+        at_top: bool = False,
+        index: Optional[Union[int, str]] = None,
+    ) -> None:
+        """Add rows at the bottom (or top), or next to the row with the given index."""
+        utils.insert_rows(self._rows, data, self.index_field, at_top, index)
+        self._broadcast("addData", data, at_top, index)
+
+    def update_data(self, data: List[Dict]) -> None:
+        """Update existing rows by their index."""
+        utils.update_rows(self._rows, data, self.index_field)
+        self._broadcast("updateData", data)
+
+    def update_or_add_data(self, data: List[Dict]) -> None:
+        """Update existing rows by their index and add the others."""
+        utils.update_or_add_rows(self._rows, data, self.index_field)
+        self._broadcast("updateOrAddData", data)
+
+    def clear_data(self) -> None:
+        """Remove all rows."""
+        self._rows.clear()
+        self._broadcast("clearData", None)
+
+    def _broadcast(self, method: str, data: Optional[List[Dict]], *args) -> None:
+        self.changes.record(method, data, args)
+        payloads: Dict[Hashable, str] = {}
+        for table in self.tables:
+            table._apply_shared_delta(method, data, args, payloads)
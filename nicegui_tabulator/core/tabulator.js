@@ -1,6 +1,5 @@
 import { loadResource } from "../../static/utils/resources.js";
 import { convertDynamicProperties } from "../../static/utils/dynamic_properties.js";
-import 'tabulator'
 
 const completedEvents = new Set([
   'tableBuilding',
@@ -51,6 +50,134 @@ function extractEventArg(eventName, argsObject) {
   return result;
 }
 
+const ENCODED_ROWS_KEY = '__ngt_rows__';
+
+// changes that replace all rows, they do not depend on the changes before them
+const RESET_METHODS = new Set(['setData', 'clearData']);
+
+const TYPED_ARRAYS = {
+  f8: Float64Array,
+  f4: Float32Array,
+  i4: Int32Array,
+};
+
+function decodeBuffer(data, dtype) {
+  const binary = atob(data);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+  return new TYPED_ARRAYS[dtype](bytes.buffer);
+}
+
+function decodeRows(payload) {
+  if (!payload || !payload[ENCODED_ROWS_KEY]) return payload;
+
+  const { rows, dictionaries, buffers } = payload[ENCODED_ROWS_KEY];
+  Object.entries(dictionaries).forEach(([field, { values, codes }]) => {
+    for (let i = 0; i < codes.length; i++) {
+      if (codes[i] >= 0) rows[i][field] = values[codes[i]];
+    }
+  });
+  Object.entries(buffers).forEach(([field, { dtype, data }]) => {
+    const values = decodeBuffer(data, dtype);
+    for (let i = 0; i < values.length; i++) {
+      rows[i][field] = Number.isNaN(values[i]) ? null : values[i];
+    }
+  });
+  return rows;
+}
+
+const FUNCTION_REF_KEY = '__ngt_fn__';
+
+// entries sent once per page and shared by all its tables
+class Registry {
+  constructor() {
+    this.entries = new Map();
+    this.waiters = new Map();
+  }
+
+  register(entries) {
+    Object.entries(entries || {}).forEach(([id, value]) => {
+      this.entries.set(id, value);
+      (this.waiters.get(id) || []).forEach((resolve) => resolve());
+      this.waiters.delete(id);
+    });
+  }
+
+  get(id) {
+    return this.entries.get(id);
+  }
+
+  // an entry may be registered by another table of the page that has not been mounted yet
+  whenAvailable(ids) {
+    const missing = [...ids].filter((id) => !this.entries.has(id));
+    return Promise.all(missing.map((id) => new Promise((resolve) => {
+      if (!this.waiters.has(id)) this.waiters.set(id, []);
+      this.waiters.get(id).push(resolve);
+    })));
+  }
+}
+
+// functions are compiled once, on first use
+const functionSources = new Registry();
+const compiledFunctions = new Map();
+const presets = new Registry();
+
+function compileSource(source) {
+  let fn = compiledFunctions.get(source);
+  if (!fn) {
+    try {
+      fn = new Function(`return (${source})`)();
+    } catch (e) {
+      fn = eval(source);
+    }
+    compiledFunctions.set(source, fn);
+  }
+  return fn;
+}
+
+function collectFunctionRefs(obj, ids) {
+  if (typeof obj !== 'object' || obj === null) return ids;
+  if (Array.isArray(obj)) {
+    obj.forEach((value) => collectFunctionRefs(value, ids));
+    return ids;
+  }
+  if (FUNCTION_REF_KEY in obj) {
+    ids.add(obj[FUNCTION_REF_KEY]);
+    return ids;
+  }
+  Object.values(obj).forEach((value) => collectFunctionRefs(value, ids));
+  return ids;
+}
+
+function replaceFunctionRefs(obj) {
+  if (typeof obj !== 'object' || obj === null) return obj;
+  if (FUNCTION_REF_KEY in obj) return compileSource(functionSources.get(obj[FUNCTION_REF_KEY]));
+  const entries = Array.isArray(obj) ? obj.entries() : Object.entries(obj);
+  for (const [key, value] of entries) obj[key] = replaceFunctionRefs(value);
+  return obj;
+}
+
+// the library is imported on first use, so it does not delay mounting the page
+let tabulatorLibrary = null;
+
+function loadTabulator() {
+  tabulatorLibrary = tabulatorLibrary || import('tabulator');
+  return tabulatorLibrary;
+}
+
+function whenVisible(el, observers) {
+  return new Promise((resolve) => {
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        observer.disconnect();
+        resolve();
+      }
+    }, { rootMargin: '200px' });
+    observers.push(observer);
+    observer.observe(el);
+  });
+}
+
 function onSocketConnect(fn) {
   window.Vue.nextTick(() => {
     const socket = window.socket;
@@ -63,35 +190,155 @@ export default {
   props: {
     options: Object,
     resourcePath: String,
+    cssUrl: String,
+    luxonUrl: String,
+    remote: Boolean,
+    dataVersion: Number,
+    functions: Object,
+    presets: Object,
+    presetIds: Array,
+    lazy: Boolean,
+  },
+  created() {
+    // start downloading the library while the page renders, lazy tables wait until they are visible
+    if (!this.lazy) loadTabulator();
+    this.remoteRequests = new Map();
+    this.remoteRequestId = 0;
+    this.transfers = new Map();
+    this.version = this.dataVersion || 0;
+    this.resuming = false;
+    this.observers = [];
+    this.changesSkipped = false;
+    this.searchKeys = null;
+    this.searchFilter = (data) => !this.searchKeys || this.searchKeys.has(data[this.table.options.index]);
   },
   async mounted() {
-    await new Promise((resolve) => setTimeout(resolve, 0)); // NOTE: wait for window.path_prefix to be set
+    this.mountedAt = performance.now();
+    // the server sends each function and preset once per client, other tables may need them before this one is built
+    functionSources.register(this.functions);
+    presets.register(this.presets);
+    if (window.path_prefix === undefined) {
+      await new Promise((resolve) => setTimeout(resolve, 0)); // NOTE: wait for window.path_prefix to be set
+    }
+    if (this.lazy) {
+      await whenVisible(this.$el, this.observers);
+      this.mountedAt = performance.now();
+    }
+
+    const resources = [loadTabulator()];
     const hasNiceGuiTabulatorTheme = document.querySelector('link.nicegui-tabulator-theme') !== null;
     if (!hasNiceGuiTabulatorTheme) {
-      await Promise.all([
-        loadResource(window.path_prefix + `${this.resourcePath}/tabulator.min.css`),
-      ]);
+      resources.push(loadResource(window.path_prefix + this.cssUrl));
+    }
+    if (this.luxonUrl) {
+      resources.push(this.loadLuxon(this.luxonUrl));
     }
+    await Promise.all(resources);
 
+    if (this.options.data) {
+      this.options.data = decodeRows(this.options.data);
+    }
+    const presetIds = this.presetIds || [];
+    await presets.whenAvailable(presetIds);
+    // presets are copied, Tabulator may modify the options it is given
+    const { data, ...options } = Object.assign(
+      {},
+      ...presetIds.map((id) => JSON.parse(JSON.stringify(presets.get(id)))),
+      this.options,
+    );
+    await functionSources.whenAvailable(collectFunctionRefs(options, new Set()));
+    replaceFunctionRefs(options);
+    Object.assign(this.options, options);
     convertDynamicProperties(this.options, true);
+    if (this.remote) {
+      this.options.ajaxURL = this.options.ajaxURL || 'nicegui-tabulator:remote';
+      this.options.ajaxRequestFunc = (url, config, params) => this.requestRemoteData(params);
+    }
     this.table = new Tabulator(this.$el, this.options);
 
+    // the server may have withheld the values of hidden columns until they are shown
+    this.table.on('columnVisibilityChanged', (column, visible) => {
+      if (visible && column.getField()) {
+        this.$emit('columnShown', { field: column.getField() });
+      }
+    });
+
     this.table.on('tableBuilt', () => {
-      setTimeout(() => {
-        this.table.redraw();
-      }, 800);
+      this.builtAt = performance.now();
+      performance.measure(`nicegui-tabulator:built:${this.$el.id}`, { start: this.mountedAt, end: this.builtAt });
+      this.observeResize();
+      if (this.searchKeys) this.applySearch();
+      // changes sent before the table was built have been skipped, and the rows of a lazy table may have been withheld
+      if (this.lazy || this.changesSkipped) {
+        this.changesSkipped = false;
+        // a resume requested before, e.g. on connect, may have been answered with skipped changes
+        this.resuming = false;
+        this.requestResume();
+      }
     });
 
     // here we need to wait for socket connection before emitting events, because some events may not be triggered at page load
     onSocketConnect(() => {
       this.$emit('connected');
+      // changes sent while the socket was down may have been lost
+      this.resuming = false;
+      this.requestResume();
+      // requests emitted before the socket was ready may have been lost
+      this.remoteRequests.forEach((request, requestId) => {
+        this.$emit('remoteRequest', { requestId, params: request.params });
+      });
     })
 
     this.$emit('connected');
+  },
 
+  unmounted() {
+    this.observers.forEach((observer) => observer.disconnect());
   },
 
   methods: {
+    observeResize() {
+      // in its default virtual render mode, Tabulator observes its own size
+      const resizeTable = this.table.modules.resizeTable;
+      if (this.table.options.autoResize === false || (resizeTable && resizeTable.autoResize)) return;
+
+      // the height follows the rows, only a new width changes the layout, e.g. when a hidden tab is shown
+      let width = this.$el.clientWidth;
+      let frame = null;
+      const observer = new ResizeObserver(() => {
+        if (this.$el.clientWidth === width) return;
+        width = this.$el.clientWidth;
+        if (frame === null) {
+          frame = requestAnimationFrame(() => {
+            frame = null;
+            this.table.redraw();
+          });
+        }
+      });
+      observer.observe(this.$el);
+      this.observers.push(observer);
+    },
+
+    async loadLuxon(url) {
+      if (window.luxon) return;
+      try {
+        await loadResource(window.path_prefix + url);
+      } catch (error) {
+        // the table is built anyway, only its date/time cells stay empty
+        console.warn(`nicegui-tabulator: Luxon could not be loaded from ${url}`, error);
+        return;
+      }
+      // cells formatted before Luxon was loaded are empty
+      if (this.table) {
+        this.table.redraw(true);
+      }
+    },
+
+    getBuildTiming() {
+      if (this.builtAt === undefined) return null;
+      return { duration: this.builtAt - this.mountedAt };
+    },
+
     onEvent(eventName) {
       const orgEventName = eventName.replace(/^table:/, '');
 
@@ -113,28 +360,142 @@ export default {
     run_table_method(name, ...args) {
       if (name.startsWith(":")) {
         name = name.slice(1);
-        args = args.map((arg) => new Function(`return (${arg})`)());
+        args = args.map(compileSource);
       }
+      args = args.map(decodeRows);
       const result = runMethod(this.table, name, args);
       return result instanceof Promise ? null : result;
     },
 
+    runCalls(calls) {
+      const run = () => calls.forEach(([name, ...args]) => this[name](...args));
+      // a table not built yet has nothing to render, its changes are skipped and resumed once it is built
+      if (!this.builtAt) return run();
+      // render once, after all calls
+      this.table.blockRedraw();
+      try {
+        run();
+      } finally {
+        this.table.restoreRedraw();
+      }
+    },
+
+    registerFunctions(functions) {
+      functionSources.register(functions);
+    },
+
     setColumns(columns) {
+      replaceFunctionRefs(columns);
       convertDynamicProperties(columns, true);
       this.table.setColumns(columns);
     },
 
     updateColumnDefinition(field, definition) {
+      replaceFunctionRefs(definition);
       convertDynamicProperties(definition, true);
       this.table.updateColumnDefinition(field, definition);
     },
 
-    updateCellSlot(field, rowNumber, rowIndex) {
-      this.$emit('updateCellSlot', { field, rowNumber, rowIndex })
+    addColumn(definition, before, position) {
+      replaceFunctionRefs(definition);
+      convertDynamicProperties(definition, true);
+      return this.run_table_method('addColumn', definition, before, position);
+    },
+
+    updateCellSlot(field, rowNumber, rowKey) {
+      this.$emit('updateCellSlot', { field, rowNumber, rowKey })
     },
 
     resetRowFormat(position) {
       this.table.getRowFromPosition(position).normalizeHeight();
-    }
+    },
+
+    receiveChunk(transferId, rows) {
+      rows = decodeRows(rows);
+      const received = this.transfers.get(transferId);
+      if (received) {
+        for (const row of rows) received.push(row);
+      } else {
+        this.transfers.set(transferId, rows);
+      }
+    },
+
+    commitChunks(transferId, version, name, ...args) {
+      const rows = this.transfers.get(transferId) || [];
+      this.transfers.delete(transferId);
+      return this.applyChange(version, name, rows, ...args);
+    },
+
+    applyChange(version, name, ...args) {
+      // the table catches up once it is built, see `tableBuilt`
+      if (!this.builtAt) {
+        this.changesSkipped = true;
+        return null;
+      }
+      const isReset = RESET_METHODS.has(name);
+      // already applied, e.g. replayed after a reconnect
+      if (version < this.version || (version === this.version && !isReset)) return null;
+      if (version > this.version + 1 && !isReset) {
+        this.requestResume();
+        return null;
+      }
+      this.version = version;
+      if (isReset) this.resuming = false;
+      return this.run_table_method(name, ...args);
+    },
+
+    replayChanges(changes) {
+      this.resuming = false;
+      changes.forEach(([version, name, ...args]) => this.applyChange(version, name, ...args));
+    },
+
+    requestResume() {
+      if (this.resuming) return;
+      this.resuming = true;
+      this.$emit('resume', { version: this.version });
+    },
+
+    setSearchKeys(keys) {
+      // the server looks the query up in its index, the client only filters by the indexes of the matching rows
+      this.searchKeys = keys && new Set(keys);
+      if (this.builtAt) this.applySearch();
+    },
+
+    applySearch() {
+      // the filter is added again if `clearFilter` has removed it
+      if (this.table.getFilters().some((filter) => filter.field === this.searchFilter)) {
+        this.table.refreshFilter();
+      } else if (this.searchKeys) {
+        this.table.addFilter(this.searchFilter);
+      }
+    },
+
+    setFieldValues(rows) {
+      this.table.updateData(decodeRows(rows));
+    },
+
+    requestRemoteData(params) {
+      const requestId = ++this.remoteRequestId;
+      return new Promise((resolve, reject) => {
+        this.remoteRequests.set(requestId, { params, resolve, reject });
+        this.$emit('remoteRequest', { requestId, params });
+      });
+    },
+
+    resolveRemoteRequest(requestId, response) {
+      const request = this.remoteRequests.get(requestId);
+      if (!request) return;
+      this.remoteRequests.delete(requestId);
+      response.data = decodeRows(response.data);
+      request.resolve(response);
+    },
+
+    rejectRemoteRequest(requestId, message) {
+      const request = this.remoteRequests.get(requestId);
+      if (!request) return;
+      this.remoteRequests.delete(requestId);
+      // Tabulator reports the failed load with its `dataLoadError` event
+      request.reject(new Error(message));
+    },
   },
 };
\ No newline at end of file
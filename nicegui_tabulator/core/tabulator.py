@@ -1,67 +1,171 @@
+import csv
+import os
+import uuid
+from asyncio import TimerHandle
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from nicegui import core, json, run
 from nicegui.element import Element
-from nicegui.awaitable_response import AwaitableResponse
+from nicegui.events import Handler, handle_event
+from nicegui.awaitable_response import AwaitableResponse, NullResponse
 from warnings import warn
 from .utils import DeferredTask
 from nicegui.elements.teleport import Teleport as teleport
 from .types import CellSlotProps, T_Row_Range_Lookup
+from .events import DataProgressEventArguments
+from .remote import RemoteDataSource, RemoteRequest, apply_remote_options
+from .transfer import TransferOptions, encode_rows
+from .shared import SharedData
+from .changes import ChangeLog
+from .functions import extract_functions, unsent_functions
+from .presets import get_preset, unsent_presets
+from .assets import asset_url
+from .dependencies import luxon_url, uses_luxon
+from .search import SearchIndex, words
 from . import utils
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
-except ImportError:
-    pass
+    from .rows import RowsDataSource
+
+
+# the same source for every table, so it is sent and compiled once per client
+_CELL_SLOT_FORMATTER = r"""
+function(cell, formatterParams, onRendered){
+
+    const row = cell.getRow();
+    const field = cell.getField();
+
+    onRendered(function(){
+        const rowNumber = row.getPosition();
+        const target = cell.getElement();
+        target.innerHTML = `<div class="ng-cell-slot-${field}-${rowNumber} fit"></div>`
+        const tableObject = getElement(formatterParams.elementId);
+        // the server looks the row up by its key, the client only holds the rows of its page
+        runMethod(tableObject, 'updateCellSlot',[field,rowNumber,row.getIndex()]);
+    });
+}
+"""
 
 
 class Tabulator(
     Element, component="tabulator.js", dependencies=["libs/tabulator.min.js"]
 ):
+    DATA_CHUNK_SIZE = 10_000
+    """The default maximum number of rows sent to the client in a single message."""
+
     def __init__(
         self,
         options: Dict,
         row_key: Optional[str] = "id",
+        *,
+        data_source: Optional[RemoteDataSource] = None,
+        transfer: Optional[TransferOptions] = None,
+        shared_data: Optional[SharedData] = None,
+        presets: Optional[List[str]] = None,
+        lazy: bool = False,
+        lazy_data: bool = False,
+        server_side: bool = False,
     ) -> None:
         """Create a new tabulator table.
 
         Args:
             options (Dict): The options for the tabulator table.
             row_key (str, optional): The field to be used as the unique index for each row. Defaults to "id".
+            data_source (RemoteDataSource, optional): If set, the table is paginated remotely and every page, sort and filter is served by this data source.
+            transfer (TransferOptions, optional): How row data is encoded when it is sent to the client. Defaults to sending the rows as they are.
+            shared_data (SharedData, optional): If set, the table shows these shared rows instead of `options["data"]`, and its data methods mutate them for every table showing them.
+            presets (List[str], optional): The names of option presets registered with `register_preset`. The options are merged in order, `options` taking precedence.
+            lazy (bool, optional): Build the table on the client only when it first scrolls into view, e.g. for tables in tabs or expansion items. Defaults to False.
+            lazy_data (bool, optional): Also withhold the rows until the table is built, then fetch them from the server. Implies `lazy`. Defaults to False.
+            server_side (bool, optional): Keep `options["data"]` on the server and serve every page, sort and filter from it, for tables too large to send to the client. The data methods change the rows on the server and reload the current page. Requires `numpy` 2.0 or later. Defaults to False.
         """
         super().__init__()
-        self.__deferred_task = DeferredTask()
+        self._pending_calls: Optional[List[Tuple[List, float]]] = None
+        self.__deferred_task = DeferredTask(batch=self.batch)
+        self._transfer = transfer or TransferOptions()
+        self._presets = [get_preset(name) for name in presets or []]
+        self._lazy_data = lazy_data
+        if lazy or lazy_data:
+            self._props["lazy"] = True
 
         if row_key:
             options.update(index=row_key)
 
-        self._props["options"] = options
-        self.add_resource(Path(__file__).parent / "libs")
+        self._rows_source: Optional[RowsDataSource] = None
+        if server_side:
+            if data_source is not None or shared_data is not None:
+                raise ValueError(
+                    "`server_side` cannot be combined with `data_source` or `shared_data`"
+                )
+            # imported on first use, it requires numpy
+            from . import rows
+
+            data_source = self._rows_source = rows.RowsDataSource(
+                options.pop("data", None), index=options.get("index", "id")
+            )
 
-        self._cell_slot_map: Dict[str, Callable] = {}
-        self._teleport_slots_cache: Dict[Tuple[str, int], teleport] = {}
+        self._data_source = data_source
+        if data_source is not None:
+            apply_remote_options(options)
+            self._props["remote"] = True
 
-        def on_update_cell_slot(e):
-            field = e.args["field"]
-            row_number = e.args["rowNumber"]
-            row_index = e.args["rowIndex"]
-            key = (field, row_index)
+        self._shared_data = shared_data
+        self._rendered_version: Optional[int] = None
+        self._changes = shared_data.changes if shared_data is not None else ChangeLog()
+        if shared_data is not None:
+            # the rows stay in the shared data, the options would hold an observed copy of them
+            options.pop("data", None)
+            options.update(index=shared_data.index_field)
+            shared_data.subscribe(self)
 
-            if field not in self._cell_slot_map:
-                return
+        self._props["options"] = options
+        self.add_resource(Path(__file__).parent / "libs")
+        self._props["cssUrl"] = asset_url(
+            Path(__file__).parent / "libs" / "tabulator.min.css"
+        )
 
-            if key in self._teleport_slots_cache:
-                # TODO:how reuse the teleport instead of creating a new one?
-                tp = self._teleport_slots_cache[key]
-                tp.delete()
+        # the server's view of the column definitions, kept up to date by the column methods
+        columns = self._option("columns")
+        self._columns: Optional[List[Dict]] = (
+            list(columns) if columns is not None else None
+        )
+        self._revealed_fields: Set[str] = set()
 
-            fn = self._cell_slot_map[field]
-            tp = fn(row_number, row_index)
-            if tp:
-                self._teleport_slots_cache[key] = tp
+        # built on the first search, then kept up to date by the data methods
+        self._search_index: Optional[SearchIndex] = None
+        self._search_query = ""
+        self._search_timer: Optional[TimerHandle] = None
 
-            self.run_method("resetRowFormat", row_number)
+        self._cell_slot_map: Dict[str, Callable] = {}
+        self._teleport_slots_cache: Dict[Tuple[str, int], teleport] = {}
+
+        self.on(
+            "updateCellSlot",
+            lambda e: self._update_cell_slot(
+                e.args["field"], e.args["rowNumber"], e.args["rowKey"]
+            ),
+        )
 
-        self.on("updateCellSlot", on_update_cell_slot)
+        self.on(
+            "remoteRequest",
+            lambda e: self._serve_remote_request(e.args["requestId"], e.args["params"]),
+        )
+        self.on("columnShown", lambda e: self._reveal_field(e.args["field"]))
+        self.on("resume", lambda e: self._resume_client(e.args["version"]))
 
         def on_connected():
             self.__deferred_task.flush()
@@ -69,23 +173,263 @@ class Tabulator(
 
         self.on("connected", on_connected)
 
+    def _update_cell_slot(self, field: str, row_number: int, row_key: Any):
+        """Build the cell slot of `field` for the row the client rendered at `row_number`."""
+        if field not in self._cell_slot_map:
+            return
+
+        key = (field, row_number)
+        if key in self._teleport_slots_cache:
+            # TODO:how reuse the teleport instead of creating a new one?
+            tp = self._teleport_slots_cache.pop(key)
+            tp.delete()
+
+        row_index = self._row_position(row_key)
+        if row_index is None:
+            return
+
+        fn = self._cell_slot_map[field]
+        tp = fn(row_number, row_index)
+        if tp:
+            self._teleport_slots_cache[key] = tp
+
+        self.run_method("resetRowFormat", row_number)
+
+    def _row_position(self, row_key: Any) -> Optional[int]:
+        """The position of the row with the given key in the data on the server, if it is there."""
+        if self._rows_source is not None:
+            return self._rows_source.row_position(row_key)
+        index_field = self.index_field
+        return next(
+            (i for i, row in enumerate(self.data) if row.get(index_field) == row_key),
+            None,
+        )
+
+    async def _serve_remote_request(self, request_id: int, params: Optional[Dict]):
+        """Fetch a page for the client, or reject its request if the data source fails, e.g. on a filter it cannot apply."""
+        if self._data_source is None:
+            return
+        try:
+            request = RemoteRequest.from_params(params or {})
+            rows, total = await run.io_bound(self._data_source.fetch, request)
+            response = request.to_response(self._encode_rows(rows), total)
+        except Exception as error:
+            # otherwise Tabulator waits for the page forever
+            self.run_method("rejectRemoteRequest", request_id, str(error))
+            core.app.handle_exception(error)
+            return
+        self.run_method("resolveRemoteRequest", request_id, response)
+
     @property
     def index_field(self):
         """Get the index field for the tabulator table.By default Tabulator will look for this value in the id field for the data."""
-        return self._props["options"].get("index", "id")
+        return self._option("index", "id")
+
+    def _option(self, key: str, default=None):
+        """An option of the table, falling back to its presets."""
+        options = self._props["options"]
+        if key in options:
+            return options[key]
+        for _, preset in reversed(self._presets):
+            if key in preset:
+                return preset[key]
+        return default
+
+    @property
+    def data_source(self) -> Optional[RemoteDataSource]:
+        """The data source serving a remotely paginated table, if any."""
+        return self._data_source
 
     @property
     def data(self):
         """Get or set the data for the tabulator table."""
+        if self._shared_data is not None:
+            return self._shared_data.rows
+        if self._rows_source is not None:
+            return self._rows_source.rows
         if "data" not in self._props["options"]:
-            self._props["options"]["data"] = []
+            with self._props.suspend_updates():
+                self._props["options"]["data"] = []
         return self._props["options"]["data"]
 
+    @property
+    def data_version(self) -> int:
+        """The version of the table data, incremented with every change sent to the client."""
+        return self._changes.version
+
+    def _to_dict(self) -> Dict:
+        result = super()._to_dict()
+        options = self._props["options"]
+
+        # functions are sent once per client and referenced by id
+        functions: Dict[str, str] = {}
+        rendered_options = extract_functions(
+            {key: value for key, value in options.items() if key != "data"}, functions
+        )
+
+        data_version = self._changes.version
+        if self._lazy_data:
+            # the client asks for the rows with a version older than any change
+            data_version = -1
+            rendered_options["data"] = []
+            if self._shared_data is not None:
+                self._rendered_version = self._shared_data.version
+        elif self._shared_data is not None:
+            self._rendered_version = self._shared_data.version
+            rendered_options["data"] = self._shared_data.encoded(
+                self._encoding_key(), lambda: self._encode_rows(self._shared_data.rows)
+            )
+        elif options.get("data"):
+            rendered_options["data"] = self._encode_rows(options["data"])
+        elif "data" in options:
+            rendered_options["data"] = options["data"]
+
+        presets = extract_functions(
+            unsent_presets(self.client, dict(self._presets)), functions
+        )
+
+        result["props"] = {
+            **result["props"],
+            "options": rendered_options,
+            "dataVersion": data_version,
+            "functions": unsent_functions(self.client, functions),
+            "presets": presets,
+            "presetIds": [preset_id for preset_id, _ in self._presets],
+        }
+        if self._uses_luxon():
+            result["props"]["luxonUrl"] = luxon_url()
+        return result
+
+    def _uses_luxon(self, columns: Optional[List[Dict]] = None) -> bool:
+        if columns is None:
+            columns = [self._option("columnDefaults") or {}, *(self._columns or [])]
+        return uses_luxon(columns)
+
+    def _load_luxon(self, columns: List[Dict]):
+        """Make sure the client has Luxon before columns requiring it are sent."""
+        if self._uses_luxon(columns):
+            self.run_method("loadLuxon", luxon_url())
+
+    def _register_functions(self, value):
+        """Replace the `:`-prefixed properties in `value` with references, sending the functions new to the client."""
+        functions: Dict[str, str] = {}
+        value = extract_functions(value, functions)
+        unsent = unsent_functions(self.client, functions)
+        if unsent:
+            self.run_method("registerFunctions", unsent)
+        return value
+
+    def _encoding_key(self):
+        """Tables with equal keys encode the same rows to the same payload."""
+        fields, withheld = self._field_selection()
+        return (
+            repr(self._transfer),
+            None if fields is None else frozenset(fields),
+            frozenset(withheld),
+        )
+
+    def _apply_shared_delta(
+        self,
+        method: str,
+        data: Optional[List[Dict]],
+        args: tuple,
+        payloads: Dict,
+    ):
+        """Apply a mutation of the shared data, reusing the payload encoded for tables with the same encoding."""
+        self._update_search(method, data)
+        if self._rendered_version is None:
+            return  # the rows will be sent with the table
+
+        arguments = [str(self._changes.version), json.dumps(method)]
+        if data is not None:
+            key = self._encoding_key()
+            if key not in payloads:
+                payloads[key] = json.dumps(self._encode_rows(data))
+            arguments.append(payloads[key])
+        arguments.extend(json.dumps(arg) for arg in args)
+        code = f'return runMethod({self.id}, "applyChange", [{", ".join(arguments)}])'
+
+        # nobody awaits the delta, so it skips the response bookkeeping of `run_javascript`
+        @self.__deferred_task.register
+        def _():
+            self._enqueue_javascript(code)
+
+    def _resume_client(self, version: int):
+        """Send a reconnected client the changes it missed since `version`, or all rows if they are no longer logged."""
+        if self._data_source is not None:
+            return
+
+        changes = self._changes.since(version)
+        if changes is None:
+            self._run_data_method(
+                "setData",
+                self.data,
+                version=self._changes.version,
+                timeout=None,
+                chunk_size=None,
+                on_progress=None,
+            )
+            return
+
+        self.run_method(
+            "replayChanges",
+            [
+                [
+                    change.version,
+                    change.method,
+                    self._encode_rows(change.data or []),
+                    *change.args,
+                ]
+                for change in changes
+            ],
+            timeout=utils.scaled_timeout(
+                sum(len(change.data or []) for change in changes)
+            ),
+        )
+
+    def _encode_rows(self, rows: List[Dict]):
+        return encode_rows(rows, self._transfer, *self._field_selection())
+
+    def _full_rows(self, rows: List[Dict]) -> List[Dict]:
+        """Replace rows received from a projected client with the full rows of the server."""
+        fields, withheld = self._field_selection()
+        if fields is None and not withheld:
+            return rows
+        index_field = self.index_field
+        keys = {row.get(index_field) for row in rows}
+        by_key = {
+            row.get(index_field): row
+            for row in self.data
+            if row.get(index_field) in keys
+        }
+        return [by_key.get(row.get(index_field), row) for row in rows]
+
+    def _restore_event_rows(self, args):
+        if not isinstance(args, dict):
+            return
+        if isinstance(args.get("row"), dict):
+            args["row"] = self._full_rows([args["row"]])[0]
+        if isinstance(args.get("cell"), dict) and isinstance(
+            args["cell"].get("row"), dict
+        ):
+            args["cell"]["row"] = self._full_rows([args["cell"]["row"]])[0]
+        if isinstance(args.get("rows"), list):
+            args["rows"] = self._full_rows(args["rows"])
+
     def delete(self) -> None:
         for tp in self._teleport_slots_cache.values():
             tp.delete()
         return super().delete()
 
+    def _handle_delete(self) -> None:
+        # also reached when a parent container is cleared, which does not call `delete`
+        self.__deferred_task.release()
+        if self._search_timer is not None:
+            self._search_timer.cancel()
+        if self._shared_data is not None:
+            self._shared_data.unsubscribe(self)
+        super()._handle_delete()
+
     def on_event(
         self,
         event: str,
@@ -107,14 +451,67 @@ class Tabulator(
         if not event.startswith("table:"):
             event = f"table:{event}"
 
-        @self.__deferred_task.register
+        # registering the same event twice before the table connects would add two client listeners
+        @self.__deferred_task.register(key=("onEvent", event))
         def _():
             self.run_method("onEvent", event)
 
-        self.on(event, callback)
+        def handler(e):
+            self._restore_event_rows(e.args)
+            handle_event(callback, e)
+
+        self.on(event, handler)
 
         return self
 
+    def run_method(self, name: str, *args, timeout: float = 1) -> AwaitableResponse:
+        if self._pending_calls is not None:
+            self._pending_calls.append(([name, *args], timeout))
+            return NullResponse()
+        return super().run_method(name, *args, timeout=timeout)
+
+    @contextmanager
+    def batch(self):
+        """
+        Send the method calls made within the block to the client as one message.
+
+        The client runs them between `blockRedraw` and `restoreRedraw`, so the table is rendered once.
+        Calls made within the block return `None` when awaited. Large `set_data`/`add_data` payloads that are
+        sent in chunks, and changes of shared data, are sent separately.
+
+        @see https://tabulator.info/docs/6.2/update#block
+
+        ## Example Usage
+
+        .. code-block:: python
+            table = tabulator({...})
+
+            with table.batch():
+                table.set_columns(columns)
+                table.set_data(data)
+                table.run_table_method("setSort", "age", "desc")
+                table.run_table_method("setFilter", "age", ">", 18)
+
+        """
+        if self._pending_calls is not None:
+            yield
+            return
+
+        self._pending_calls = []
+        try:
+            yield
+        finally:
+            calls, self._pending_calls = self._pending_calls, None
+            if len(calls) == 1:
+                call, timeout = calls[0]
+                self.run_method(*call, timeout=timeout)
+            elif calls:
+                self.run_method(
+                    "runCalls",
+                    [call for call, _ in calls],
+                    timeout=sum(timeout for _, timeout in calls),
+                )
+
     def run_table_method(
         self, name: str, *args, timeout: float = 1, check_interval: float = 0.01
     ) -> AwaitableResponse:
@@ -125,7 +522,7 @@ class Tabulator(
             name (str): The name of the method to run.
             *args: The arguments to pass to the method.
             timeout (float, optional): The maximum time to wait for the method to complete. Defaults to 1.
-            check_interval (float, optional): The interval at which to check if the method has completed. Defaults to 0.01.
+            check_interval (float, optional): Ignored, kept for backward compatibility. Responses are delivered as soon as they arrive.
 
         """
         return self.run_method("run_table_method", name, *args, timeout=timeout)
@@ -153,9 +550,19 @@ class Tabulator(
 
         """
 
-        @self.__deferred_task.register
+        selection = self._field_selection()
+        self._columns = list(columns)
+        self._reset_search()
+
+        # pending column changes are replaced by the new columns
+        self.__deferred_task.discard("columns")
+
+        @self.__deferred_task.register(group="columns")
         def _():
-            return self.run_method("setColumns", columns)
+            self._load_luxon(columns)
+            return self.run_method("setColumns", self._register_functions(columns))
+
+        self._send_new_fields(selection)
 
     def update_column_definition(self, field: str, definition: Dict) -> None:
         """
@@ -175,9 +582,19 @@ class Tabulator(
 
         """
 
-        @self.__deferred_task.register
+        selection = self._field_selection()
+        if self._columns is not None:
+            utils.update_column(self._columns, field, definition)
+            self._reset_search()
+
+        @self.__deferred_task.register(group="columns")
         def _():
-            self.run_method("updateColumnDefinition", field, definition)
+            self._load_luxon([definition])
+            self.run_method(
+                "updateColumnDefinition", field, self._register_functions(definition)
+            )
+
+        self._send_new_fields(selection)
 
     def add_column(
         self,
@@ -204,9 +621,78 @@ class Tabulator(
 
         """
 
+        selection = self._field_selection()
+        if self._columns is not None:
+            utils.insert_column(self._columns, definition, before, position)
+            self._reset_search()
+
+        @self.__deferred_task.register(group="columns")
+        def _():
+            self._load_luxon([definition])
+            return self.run_method(
+                "addColumn", self._register_functions(definition), before, position
+            )
+
+        self._send_new_fields(selection)
+
+    def _field_selection(self) -> Tuple[Optional[Set[str]], Set[str]]:
+        """The fields sent to the client (`None` for all fields) and the fields withheld from it."""
+        if self._columns is None:
+            return None, set()
+
+        always_sent = {self.index_field, *self._transfer.keep_fields}
+        fields = (
+            {*utils.column_fields(self._columns), *always_sent}
+            if self._transfer.projection
+            else None
+        )
+        withheld = (
+            utils.column_fields(self._columns, hidden_only=True)
+            - always_sent
+            - self._revealed_fields
+            if self._transfer.lazy_hidden_columns and self._data_source is None
+            else set()
+        )
+        return fields, withheld
+
+    def _send_new_fields(self, previous: Tuple[Optional[Set[str]], Set[str]]):
+        """Send the values of fields the client did not receive before the column definitions changed."""
+        previous_fields, previous_withheld = previous
+        fields, withheld = self._field_selection()
+
+        new_fields = previous_withheld - withheld
+        if fields is not None and previous_fields is not None:
+            new_fields |= fields - previous_fields
+        new_fields -= withheld
+        if fields is not None:
+            new_fields &= fields
+        self._send_field_values(new_fields)
+
+    def _reveal_field(self, field: str):
+        """Send the withheld values of a column that has been shown on the client."""
+        selection = self._field_selection()
+        self._revealed_fields.add(field)
+        self._send_new_fields(selection)
+
+    def _send_field_values(self, new_fields: Set[str]):
+        if not new_fields or not self.data:
+            return
+
         @self.__deferred_task.register
         def _():
-            return self.run_table_method("addColumn", definition, before, position)
+            index_field = self.index_field
+            rows = [
+                {
+                    index_field: row[index_field],
+                    **{field: row[field] for field in new_fields if field in row},
+                }
+                for row in self.data
+            ]
+            return self.run_method(
+                "setFieldValues",
+                encode_rows(rows, self._transfer),
+                timeout=utils.scaled_timeout(len(rows)),
+            )
 
     @classmethod
     def from_pandas(
@@ -217,6 +703,7 @@ class Tabulator(
         auto_index=False,
         options: Optional[Dict] = None,
         column_definition: Optional[Callable[[str], Dict]] = None,
+        transfer: Optional[TransferOptions] = None,
     ):
         """Create a table from a Pandas DataFrame.
 
@@ -230,7 +717,10 @@ class Tabulator(
             auto_index (bool, optional): If `True` and the `index` parameter is `None`, a sequence number column will be automatically generated as the index.
             options (Dict, optional): The options for the tabulator table.
             column_definition (Callable[[str], Dict], optional): A function that takes a column name and returns a column definition object for that column.
+            transfer (TransferOptions, optional): How row data is encoded when it is sent to the client. `category` columns are always dictionary-encoded if dictionary encoding is enabled, and numeric columns keep their width if binary transfer is enabled.
         """
+        # imported on first use, importing pandas takes longer than importing this package
+        import pandas as pd
 
         def is_special_dtype(dtype):
             return (
@@ -240,6 +730,24 @@ class Tabulator(
                 or isinstance(dtype, pd.PeriodDtype)
             )
 
+        transfer = transfer or TransferOptions()
+        category_cols = df.columns[
+            df.dtypes.apply(lambda d: isinstance(d, pd.CategoricalDtype))
+        ]
+        if not category_cols.empty:
+            transfer = replace(
+                transfer,
+                categorical_fields=transfer.categorical_fields.union(category_cols),
+            )
+        if transfer.binary_numeric:
+            transfer = replace(
+                transfer,
+                numeric_dtypes={
+                    **utils.typed_array_dtypes(df.dtypes),
+                    **transfer.numeric_dtypes,
+                },
+            )
+
         special_cols = df.columns[df.dtypes.apply(is_special_dtype)]
         if not special_cols.empty:
             df = df.copy()
@@ -271,7 +779,237 @@ class Tabulator(
 
         options.update({"data": df.to_dict(orient="records"), "columns": columns})
 
-        return cls(options, row_key=None)
+        return cls(options, row_key=None, transfer=transfer)
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: Union[str, Path],
+        *,
+        index: Optional[str] = None,
+        options: Optional[Dict] = None,
+        column_definition: Optional[Callable[[str], Dict]] = None,
+        transfer: Optional[TransferOptions] = None,
+    ):
+        """Create a remotely paginated table from a Parquet file.
+
+        The file is memory-mapped and read lazily by row group, so only the rows and columns needed for the
+        current page, sort or filter are loaded. Requires `pyarrow`.
+
+        Args:
+            path (Union[str, Path]): The path of the Parquet file.
+            index (str, optional): The field to be used as the unique index for each row. If `None`, a hidden column holding the position of the row in the file is used.
+            options (Dict, optional): The options for the tabulator table.
+            column_definition (Callable[[str], Dict], optional): A function that takes a column name and returns a column definition object for that column.
+            transfer (TransferOptions, optional): How the rows of each page are encoded when they are sent to the client.
+        """
+        from .arrow import ArrowDataSource
+
+        return cls._from_arrow_source(
+            lambda row_id_field: ArrowDataSource.from_parquet(
+                path, row_id_field=row_id_field
+            ),
+            index=index,
+            options=options,
+            column_definition=column_definition,
+            transfer=transfer,
+        )
+
+    @classmethod
+    def from_arrow_file(
+        cls,
+        path: Union[str, Path],
+        *,
+        index: Optional[str] = None,
+        options: Optional[Dict] = None,
+        column_definition: Optional[Callable[[str], Dict]] = None,
+        transfer: Optional[TransferOptions] = None,
+    ):
+        """Create a remotely paginated table from an Arrow IPC (Feather v2) file.
+
+        The file is memory-mapped and read lazily by record batch, so only the rows and columns needed for the
+        current page, sort or filter are loaded. Requires `pyarrow`.
+
+        Args:
+            path (Union[str, Path]): The path of the Arrow file.
+            index (str, optional): The field to be used as the unique index for each row. If `None`, a hidden column holding the position of the row in the file is used.
+            options (Dict, optional): The options for the tabulator table.
+            column_definition (Callable[[str], Dict], optional): A function that takes a column name and returns a column definition object for that column.
+            transfer (TransferOptions, optional): How the rows of each page are encoded when they are sent to the client.
+        """
+        from .arrow import ArrowDataSource
+
+        return cls._from_arrow_source(
+            lambda row_id_field: ArrowDataSource.from_arrow_file(
+                path, row_id_field=row_id_field
+            ),
+            index=index,
+            options=options,
+            column_definition=column_definition,
+            transfer=transfer,
+        )
+
+    @classmethod
+    def _from_arrow_source(
+        cls,
+        open_source: Callable[[Optional[str]], RemoteDataSource],
+        *,
+        index: Optional[str],
+        options: Optional[Dict],
+        column_definition: Optional[Callable[[str], Dict]],
+        transfer: Optional[TransferOptions],
+    ):
+        row_id_field = (
+            None
+            if index is not None
+            else utils.generate_dataframe_unique_id_column_name()
+        )
+        source = open_source(row_id_field)
+
+        columns: List[Dict] = [
+            {"title": col, "field": col}
+            if column_definition is None
+            else {"field": col, **column_definition(col)}
+            for col in source.fields
+            if col != row_id_field
+        ]
+
+        options = options or {}
+        if row_id_field is not None:
+            columns.insert(
+                0, {"title": row_id_field, "field": row_id_field, "visible": False}
+            )
+        options.update({"index": index or row_id_field, "columns": columns})
+
+        return cls(options, row_key=None, data_source=source, transfer=transfer)
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: Union[str, Path],
+        *,
+        index: Optional[str] = None,
+        auto_index=False,
+        options: Optional[Dict] = None,
+        column_definition: Optional[Callable[[str], Dict]] = None,
+        chunk_size: int = 5000,
+        on_progress: Optional[Handler[DataProgressEventArguments]] = None,
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+        transfer: Optional[TransferOptions] = None,
+        infer_types: bool = True,
+    ):
+        """Create a table from a CSV file, streaming its rows to the client in chunks.
+
+        Only the header and the first chunk are read before the table is created, so the first rows can be shown
+        immediately. The remaining chunks are parsed in a separate thread and pushed with `addData` once the
+        table is connected; the next chunk is only read after the client has acknowledged the previous one.
+
+        Args:
+            path (Union[str, Path]): The path of the CSV file. The first line must contain the column names.
+            index (str, optional): The field to be used as the unique index for each row.
+            auto_index (bool, optional): If `True` and the `index` parameter is `None`, a sequence number column will be automatically generated as the index.
+            options (Dict, optional): The options for the tabulator table.
+            column_definition (Callable[[str], Dict], optional): A function that takes a column name and returns a column definition object for that column.
+            chunk_size (int, optional): The number of rows per chunk. Defaults to 5000.
+            on_progress (Handler[DataProgressEventArguments], optional): Called after each chunk has been pushed to the client.
+            encoding (str, optional): The encoding of the file. Defaults to "utf-8".
+            delimiter (str, optional): The field delimiter. Defaults to ",".
+            transfer (TransferOptions, optional): How row data is encoded when it is sent to the client.
+            infer_types (bool, optional): Convert the values of columns whose values in the first chunk all are written as numbers to `int` or `float`, so that they sort numerically. Values with leading zeros, like ZIP codes, are not numbers. Empty values in these columns become `None`. If `False`, all values are kept as strings. Defaults to True.
+        """
+        file = open(path, newline="", encoding=encoding)
+        try:
+            reader = csv.reader(file, delimiter=delimiter)
+            header = next(reader, [])
+
+            columns: List[Dict] = [
+                {"title": col, "field": col}
+                if column_definition is None
+                else {"field": col, **column_definition(col)}
+                for col in header
+            ]
+
+            options = options or {}
+            row_id_field = None
+            if index is not None:
+                options["index"] = index
+            elif auto_index:
+                row_id_field = utils.generate_dataframe_unique_id_column_name()
+                columns.insert(
+                    0, {"title": row_id_field, "field": row_id_field, "visible": False}
+                )
+                options["index"] = row_id_field
+
+            chunks = utils.iter_csv_chunks(
+                reader, header, chunk_size, row_id_field, infer_types
+            )
+            options.update({"data": next(chunks, []), "columns": columns})
+            table = cls(options, row_key=None, transfer=transfer)
+        except BaseException:
+            file.close()
+            raise
+
+        table._stream_chunks(
+            chunks,
+            on_progress=on_progress,
+            close=file.close,
+            bytes_read=lambda: file.buffer.tell(),
+            total_bytes=os.fstat(file.fileno()).st_size,
+        )
+        return table
+
+    def _stream_chunks(
+        self,
+        chunks: Iterator[List[Dict]],
+        *,
+        on_progress: Optional[Handler[DataProgressEventArguments]],
+        close: Callable[[], None],
+        bytes_read: Callable[[], int],
+        total_bytes: int,
+    ):
+        def emit_progress(done: bool):
+            handle_event(
+                on_progress,
+                DataProgressEventArguments(
+                    sender=self,
+                    client=self.client,
+                    loaded_rows=len(self.data),
+                    total_rows=len(self.data) if done else None,
+                    bytes_read=total_bytes if done else bytes_read(),
+                    total_bytes=total_bytes,
+                    done=done,
+                ),
+            )
+
+        streaming = False
+
+        def release():
+            # a running stream closes the file itself, after the read it may be waiting for
+            if not streaming:
+                close()
+
+        # the stream never starts if the table is deleted before the client connects
+        self.__deferred_task.on_release(release)
+
+        async def stream():
+            nonlocal streaming
+            streaming = True
+            try:
+                while not self.is_deleted:
+                    chunk = await run.io_bound(next, chunks, None)
+                    if chunk is None:
+                        break
+                    # waiting for the client to acknowledge each chunk keeps the socket from being flooded
+                    await self.add_data(chunk)
+                    emit_progress(done=False)
+                emit_progress(done=True)
+            finally:
+                close()
+
+        @self.__deferred_task.register
+        def _():
+            return stream()
 
     def add_cell_slot(
         self,
@@ -304,13 +1042,12 @@ class Tabulator(
 
         def wrapper(build_fn: Callable[[CellSlotProps], None]):
             def fn(row_number: int, row_index: int):
-                options = self._props["options"]
-                data = options.get("data", [])
+                data = self.data
                 if not data:
                     return
                 row = data[row_index]
 
-                class_name = f"ng-cell-slot-{field}-{row_index}"
+                class_name = f"ng-cell-slot-{field}-{row_number}"
                 with teleport(f"#{id} .{class_name}") as tp:
                     cell_slot = CellSlotProps(
                         field=field,
@@ -327,25 +1064,8 @@ class Tabulator(
             self.update_column_definition(
                 field,
                 {
-                    ":formatter": rf"""
-        function(cell, formatterParams, onRendered){{
-        
-            const row = cell.getRow();
-            const table = row.getTable();
-            const field = cell.getField();
-
-            onRendered(function(){{
-                const rowNumber = row.getPosition();
-                const rowIndexValue = row.getIndex();
-                const indexField = table.options.index;
-                const rowIndex = table.options.data.findIndex(r => r[indexField] === rowIndexValue);
-                const target = cell.getElement();
-                target.innerHTML = `<div class="ng-cell-slot-${{field}}-${{rowIndex}} fit"></div>`
-                const tableObject = getElement({self.id});
-                runMethod(tableObject, 'updateCellSlot',[field,rowNumber,rowIndex]);
-            }});
-        }}
-        """
+                    ":formatter": _CELL_SLOT_FORMATTER,
+                    "formatterParams": {"elementId": self.id},
                 },
             )
             self._cell_slot_map[field] = fn
@@ -353,7 +1073,14 @@ class Tabulator(
         return wrapper
 
     def set_data(
-        self, data: List[Dict], *, timeout: float = 1, check_interval: float = 0.01
+        self,
+        data: List[Dict],
+        *,
+        timeout: Optional[float] = None,
+        check_interval: float = 0.01,
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Handler[DataProgressEventArguments]] = None,
+        reply: bool = True,
     ):
         """set the data of the table.
 
@@ -361,13 +1088,29 @@ class Tabulator(
 
         Args:
             data (List[Dict]): The data to set for the table.
-            timeout (float, optional): The maximum time to wait for the method to complete. Defaults to 1.
-            check_interval (float, optional): The interval at which to check if the method has completed. Defaults to 0.01.
+            timeout (float, optional): The maximum time to wait for each message to complete. Defaults to `None`, which scales with the number of rows sent.
+            check_interval (float, optional): Ignored, kept for backward compatibility. Responses are delivered as soon as they arrive.
+            chunk_size (int, optional): The maximum number of rows sent per message. Larger data is sent in chunks and assembled on the client. Defaults to `Tabulator.DATA_CHUNK_SIZE`.
+            on_progress (Handler[DataProgressEventArguments], optional): Called after each chunk has been sent to the client.
+            reply (bool, optional): If `False`, the message is queued for the client directly, without a response path, and an awaitable that resolves to `None` is returned. Defaults to `True`. Larger data is still sent in acknowledged chunks.
 
         """
+        if self._shared_data is not None:
+            self._shared_data.set_data(data)
+            return NullResponse()
+        if self._rows_source is not None:
+            self._rows_source.set_data(data)
+            return self._reload_remote_data()
+
         self._set_data_on_server(data)
-        return self.run_table_method(
-            "setData", data, timeout=timeout, check_interval=check_interval
+        return self._run_data_method(
+            "setData",
+            data,
+            version=self._changes.record("setData"),
+            timeout=timeout,
+            chunk_size=chunk_size,
+            on_progress=on_progress,
+            reply=reply,
         )
 
     def replace_data(self, data: List[Dict]):
@@ -382,7 +1125,12 @@ class Tabulator(
         return self.set_data(data)
 
     def update_data(
-        self, data: List[Dict], *, timeout: float = 1, check_interval: float = 0.01
+        self,
+        data: List[Dict],
+        *,
+        timeout: Optional[float] = None,
+        check_interval: float = 0.01,
+        reply: bool = True,
     ):
         """update the data of the table.
 
@@ -390,13 +1138,25 @@ class Tabulator(
 
         Args:
             data (List[Dict]): The data to update the current data with.
-            timeout (float, optional): The maximum time to wait for the method to complete. Defaults to 1.
-            check_interval (float, optional): The interval at which to check if the method has completed. Defaults to 0.01.
+            timeout (float, optional): The maximum time to wait for the method to complete. Defaults to `None`, which scales with the number of rows sent.
+            check_interval (float, optional): Ignored, kept for backward compatibility. Responses are delivered as soon as they arrive.
+            reply (bool, optional): If `False`, the message is queued for the client directly, without a response path, and an awaitable that resolves to `None` is returned. Defaults to `True`.
 
         """
+        if self._shared_data is not None:
+            self._shared_data.update_data(data)
+            return NullResponse()
+        if self._rows_source is not None:
+            self._rows_source.update_data(data)
+            return self._reload_remote_data()
+
         self._update_data_on_server(data)
-        return self.run_table_method(
-            "updateData", data, timeout=timeout, check_interval=check_interval
+        return self._send_change(
+            self._changes.record("updateData", data),
+            "updateData",
+            self._encode_rows(data),
+            timeout=timeout or utils.scaled_timeout(len(data)),
+            reply=reply,
         )
 
     def add_data(
@@ -405,8 +1165,11 @@ class Tabulator(
         at_top: Optional[bool] = None,
         index: Optional[Union[int, str]] = None,
         *,
-        timeout: float = 1,
+        timeout: Optional[float] = None,
         check_interval: float = 0.01,
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Handler[DataProgressEventArguments]] = None,
+        reply: bool = True,
     ):
         """add data to the table.
 
@@ -416,22 +1179,52 @@ class Tabulator(
             data (List[Dict]): The data to add to the current data.
             at_top (Optional[bool], optional): determines whether the data is added to the top or bottom of the table. A value of true will add the data to the top of the table, a value of false will add the data to the bottom of the table. If the parameter is not set the data will be placed according to the addRowPos global option.
             index (Optional[Union[int, str]], optional): table row index. position the new rows next to the specified row (above or below based on the value of the second argument). This argument will take any of the standard row component look up options
-            timeout (float, optional): The maximum time to wait for the method to complete. Defaults to 1.
-            check_interval (float, optional): The interval at which to check if the method has completed. Defaults to 0.01.
+            timeout (float, optional): The maximum time to wait for each message to complete. Defaults to `None`, which scales with the number of rows sent.
+            check_interval (float, optional): Ignored, kept for backward compatibility. Responses are delivered as soon as they arrive.
+            chunk_size (int, optional): The maximum number of rows sent per message. Larger data is sent in chunks and assembled on the client. Defaults to `Tabulator.DATA_CHUNK_SIZE`.
+            on_progress (Handler[DataProgressEventArguments], optional): Called after each chunk has been sent to the client.
+            reply (bool, optional): If `False`, the message is queued for the client directly, without a response path, and an awaitable that resolves to `None` is returned. Defaults to `True`. Larger data is still sent in acknowledged chunks.
 
         """
+        if self._shared_data is not None:
+            self._shared_data.add_data(
+                data,
+                at_top
+                if at_top is not None
+                else self._option("addRowPos", "bottom") == "top",
+                index,
+            )
+            return NullResponse()
+        if self._rows_source is not None:
+            self._rows_source.add_data(
+                data,
+                at_top
+                if at_top is not None
+                else self._option("addRowPos", "bottom") == "top",
+                index,
+            )
+            return self._reload_remote_data()
+
         self._add_data_on_server(data, at_top, index)
-        return self.run_table_method(
+        return self._run_data_method(
             "addData",
             data,
             at_top,
             index,
+            version=self._changes.record("addData", data, (at_top, index)),
             timeout=timeout,
-            check_interval=check_interval,
+            chunk_size=chunk_size,
+            on_progress=on_progress,
+            reply=reply,
         )
 
     def update_or_add_data(
-        self, data: List[Dict], *, timeout: float = 1, check_interval: float = 0.01
+        self,
+        data: List[Dict],
+        *,
+        timeout: Optional[float] = None,
+        check_interval: float = 0.01,
+        reply: bool = True,
     ):
         """update or add data to the table.
         If the data you are passing to the table contains a mix of existing rows to be updated and new rows to be added then you can call the updateOrAddData function. This will check each row object provided and update the existing row if available, or else create a new row with the data.
@@ -440,28 +1233,50 @@ class Tabulator(
 
         Args:
             data (List[Dict]): The data to update or add to the current data.
-            timeout (float, optional): The maximum time to wait for the method to complete. Defaults to 1.
-            check_interval (float, optional): The interval at which to check if the method has completed. Defaults to 0.01.
+            timeout (float, optional): The maximum time to wait for the method to complete. Defaults to `None`, which scales with the number of rows sent.
+            check_interval (float, optional): Ignored, kept for backward compatibility. Responses are delivered as soon as they arrive.
+            reply (bool, optional): If `False`, the message is queued for the client directly, without a response path, and an awaitable that resolves to `None` is returned. Defaults to `True`.
 
         """
+        if self._shared_data is not None:
+            self._shared_data.update_or_add_data(data)
+            return NullResponse()
+        if self._rows_source is not None:
+            self._rows_source.update_or_add_data(data)
+            return self._reload_remote_data()
+
         self._update_or_add_data_on_server(data)
-        return self.run_table_method(
-            "updateOrAddData", data, timeout=timeout, check_interval=check_interval
+        return self._send_change(
+            self._changes.record("updateOrAddData", data),
+            "updateOrAddData",
+            self._encode_rows(data),
+            timeout=timeout or utils.scaled_timeout(len(data)),
+            reply=reply,
         )
 
-    def clear_data(self, *, timeout: float = 1, check_interval: float = 0.01):
+    def clear_data(
+        self, *, timeout: float = 1, check_interval: float = 0.01, reply: bool = True
+    ):
         """clear the data of the table.
 
         @see https://tabulator.info/docs/6.2/update#alter-empty
 
         Args:
             timeout (float, optional): The maximum time to wait for the method to complete. Defaults to 1.
-            check_interval (float, optional): The interval at which to check if the method has completed. Defaults to 0.01.
+            check_interval (float, optional): Ignored, kept for backward compatibility. Responses are delivered as soon as they arrive.
+            reply (bool, optional): If `False`, the message is queued for the client directly, without a response path, and an awaitable that resolves to `None` is returned. Defaults to `True`.
 
         """
+        if self._shared_data is not None:
+            self._shared_data.clear_data()
+            return NullResponse()
+        if self._rows_source is not None:
+            self._rows_source.clear_data()
+            return self._reload_remote_data()
+
         self._set_data_on_server([])
-        return self.run_table_method(
-            "clearData", timeout=timeout, check_interval=check_interval
+        return self._send_change(
+            self._changes.record("clearData"), "clearData", timeout=timeout, reply=reply
         )
 
     def sync_data_to_client(self):
@@ -469,7 +1284,121 @@ class Tabulator(
 
         @see https://github.com/CrystalWindSnake/nicegui-tabulator/tree/main?tab=readme-ov-file##cell-slot
         """
-        return self.set_data(self._props["options"]["data"])
+        if self._shared_data is not None:
+            # the shared version is unchanged, the client applies a reset of the version it already has
+            return self._run_data_method(
+                "setData",
+                self.data,
+                version=self._changes.version,
+                timeout=None,
+                chunk_size=None,
+                on_progress=None,
+            )
+        if self._rows_source is not None:
+            return self._reload_remote_data()
+        return self.set_data(self.data)
+
+    def _reload_remote_data(self) -> AwaitableResponse:
+        """Let the client request the current page of a server-side table again."""
+
+        # a pending reload covers all changes made until the client connects
+        @self.__deferred_task.register(key="reloadData")
+        def _():
+            self._run_method_without_reply("run_table_method", "replaceData")
+
+        return NullResponse()
+
+    def _run_data_method(
+        self,
+        name: str,
+        data: List[Dict],
+        *args,
+        version: int,
+        timeout: Optional[float],
+        chunk_size: Optional[int],
+        on_progress: Optional[Handler[DataProgressEventArguments]],
+        reply: bool = True,
+    ) -> AwaitableResponse:
+        chunk_size = chunk_size or self.DATA_CHUNK_SIZE
+
+        def emit_progress(loaded_rows: int):
+            handle_event(
+                on_progress,
+                DataProgressEventArguments(
+                    sender=self,
+                    client=self.client,
+                    loaded_rows=loaded_rows,
+                    total_rows=len(data),
+                    done=loaded_rows == len(data),
+                ),
+            )
+
+        if len(data) <= chunk_size:
+            response = self._send_change(
+                version,
+                name,
+                self._encode_rows(data),
+                *args,
+                timeout=timeout or utils.scaled_timeout(len(data)),
+                reply=reply,
+            )
+            emit_progress(len(data))
+            return response
+
+        if not utils.is_loop_running():
+            return NullResponse()
+
+        transfer_id = uuid.uuid4().hex
+        rows = data[:]
+
+        async def send():
+            # each chunk is its own message, so other elements' updates can go out in between
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                await self.run_method(
+                    "receiveChunk",
+                    transfer_id,
+                    self._encode_rows(chunk),
+                    timeout=timeout or utils.scaled_timeout(len(chunk)),
+                )
+                emit_progress(start + len(chunk))
+            return await self.run_method(
+                "commitChunks",
+                transfer_id,
+                version,
+                name,
+                *args,
+                timeout=timeout or utils.scaled_timeout(len(rows)),
+            )
+
+        return AwaitableResponse(send, send)
+
+    def _send_change(
+        self, version: int, name: str, *args, timeout: float, reply: bool = True
+    ) -> AwaitableResponse:
+        if reply:
+            return self.run_method("applyChange", version, name, *args, timeout=timeout)
+        self._run_method_without_reply("applyChange", version, name, *args)
+        return NullResponse()
+
+    def _run_method_without_reply(self, name: str, *args):
+        """Queue a method call for the client, skipping the response bookkeeping of `run_method`.
+
+        Unlike `run_method`, the message is queued right away instead of by a background task.
+        """
+        if self._pending_calls is not None:
+            self._pending_calls.append(([name, *args], 1))
+            return
+        self._enqueue_javascript(
+            f"return runMethod({self.id}, {json.dumps(name)}, {json.dumps(args)})"
+        )
+
+    def _enqueue_javascript(self, code: str):
+        if not utils.is_loop_running() or self.is_deleted:
+            return
+        self.client.outbox.enqueue_message(
+            "run_javascript", {"code": code}, self.client.id
+        )
 
     def _add_data_on_server(
         self,
@@ -480,51 +1409,114 @@ class Tabulator(
         at_top = (
             at_top
             if at_top is not None
-            else self._props["options"].get("addRowPos", "bottom") == "top"
+            else self._option("addRowPos", "bottom") == "top"
         )
-
-        if index is None:
-            row_index = 0 if at_top else len(self.data)
-        else:
-            index_field = self.index_field
-            indices = [
-                i for i, row in enumerate(self.data) if row[index_field] == index
-            ]
-            if not indices:
-                row_index = 0 if at_top else len(self.data)
-            else:
-                row_index = indices[0] + (0 if at_top else 1)
-
-        self._set_data_on_server(self.data[:row_index] + data + self.data[row_index:])
+        # the data methods send the change, an update of the element would send all rows again
+        with self._props.suspend_updates():
+            rows = utils.insert_rows(self.data, data, self.index_field, at_top, index)
+        self._update_search("addData", data, rows)
 
     def _set_data_on_server(self, data: List[Dict]):
-        if "data" not in self._props["options"]:
-            self._props["options"]["data"] = None
-        self._props["options"]["data"] = data[:]
+        with self._props.suspend_updates():
+            self._props["options"]["data"] = data[:]
+        self._update_search("setData", data)
 
     def _update_data_on_server(self, data: List[Dict]):
-        index_field = self.index_field
-        update_dict = {record[index_field]: record for record in data}
+        with self._props.suspend_updates():
+            utils.update_rows(self.data, data, self.index_field)
+        self._update_search("updateData", data)
 
-        for row in self.data:
-            update_id = row.get(index_field, None)
-            if not update_id:
-                continue
+    def _update_or_add_data_on_server(self, data: List[Dict]):
+        with self._props.suspend_updates():
+            rows = utils.update_or_add_rows(self.data, data, self.index_field)
+        self._update_search("updateOrAddData", data, rows)
 
-            update_record = update_dict.get(update_id, None)
+    def search(self, query: str, *, debounce: float = 0.2) -> None:
+        """Show only the rows matching a full-text query, e.g. the value of a search input. An empty query shows all rows.
 
-            if update_record:
-                row.update(update_record)
+        A row matches if, for each word of the query, one of its values contains a word starting with it. The words are
+        looked up in an index on the server, built on the first search and kept up to date by the data methods, and the
+        client filters the table by the indexes of the matching rows (server-side tables serve only the matching rows).
+        Tables showing their rows on the client only search the fields of their columns, if the columns are set.
 
-    def _update_or_add_data_on_server(self, data: List[Dict]):
-        index_field = self.index_field
-        update_dict = {item[index_field]: item for item in data}
+        Args:
+            query (str): The words to search for, case-insensitive.
+            debounce (float, optional): The seconds to wait for the next query before searching, so that typing in a search input runs one search. Defaults to 0.2.
+
+        ## Example Usage
 
-        for item in self.data:
-            if item[index_field] in update_dict:
-                item.update(update_dict.pop(item[index_field]))
+        .. code-block:: python
+            table = tabulator({...})
+            ui.input("Search", on_change=lambda e: table.search(e.value))
+
+        """
+        self._search_query = query
+        if self._search_timer is not None:
+            self._search_timer.cancel()
+            self._search_timer = None
+        if debounce > 0 and utils.is_loop_running():
+            self._search_timer = core.loop.call_later(debounce, self._run_search)
+        else:
+            self._run_search()
+
+    def _run_search(self):
+        self._search_timer = None
+        if self._rows_source is not None:
+            self._rows_source.search(self._search_query)
+            self._reload_remote_data()
+            return
+
+        keys = None
+        if words(self._search_query):
+            if self._search_index is None:
+                fields = (
+                    utils.column_fields(self._columns)
+                    if self._columns is not None
+                    else None
+                )
+                self._search_index = SearchIndex(self.index_field, fields)
+                self._search_index.update_rows(self.data)
+            keys = list(self._search_index.search(self._search_query))
+
+        # only the latest result is sent
+        @self.__deferred_task.register(key="search")
+        def _():
+            self._run_method_without_reply("setSearchKeys", keys)
 
-        self._set_data_on_server([*self.data, *update_dict.values()])
+    def _update_search(
+        self,
+        method: str,
+        data: Optional[List[Dict]],
+        added: Optional[List[Dict]] = None,
+    ):
+        """Index the rows changed by a data method, and search them again if a query is shown.
+
+        Args:
+            method (str): The data method.
+            data (Optional[List[Dict]]): The records passed to the method.
+            added (Optional[List[Dict]], optional): The rows the method added, as the table holds them, e.g. observed copies of the records. Defaults to the records themselves.
+        """
+        if self._search_index is not None:
+            if method in ("setData", "clearData"):
+                self._search_index = None
+            elif method == "addData":
+                self._search_index.update_rows(added if added is not None else data)
+            else:
+                # the records of updates may be partial, the index looks up the rows holding all their values
+                self._search_index.update_records(
+                    data, add=method == "updateOrAddData" and added is None
+                )
+                if added:
+                    self._search_index.update_rows(added)
+
+        if words(self._search_query) and self._search_timer is None:
+            self._run_search()
+
+    def _reset_search(self):
+        """Index the rows again on the next search, e.g. when the searched fields have changed."""
+        self._search_index = None
+        if words(self._search_query) and self._search_timer is None:
+            self._run_search()
 
     def print(
         self,
@@ -543,10 +1535,21 @@ class Tabulator(
         self.sync_data_to_client()
         return self.run_table_method("print", row_range_lookup, style, config)
 
+    async def get_build_time(self, *, timeout: float = 1) -> Optional[float]:
+        """Get the time in milliseconds it took the client to build the table, or `None` if it is not built yet.
+
+        The time is measured from the mount of the element (or, for lazy tables, from the moment it became visible)
+        to Tabulator's `tableBuilt` event. It is also recorded as a `performance.measure` entry named
+        `nicegui-tabulator:built:c<id>` for the browser's developer tools.
+        """
+        timing = await self.run_method("getBuildTiming", timeout=timeout)
+        return timing["duration"] if timing else None
+
     async def get_selected_data(
         self, *, timeout: float = 1, check_interval: float = 0.01
     ) -> List[Dict]:
         """Get the selected data from the table."""
-        return await self.run_table_method(
+        rows = await self.run_table_method(
             "getSelectedData", timeout=timeout, check_interval=check_interval
         )
+        return self._full_rows(rows) if rows else rows
@@ -1,7 +1,9 @@
 from __future__ import annotations
+import json
 from pathlib import Path
 from typing import Literal, Optional
-from nicegui import ui, app, Client
+from nicegui import ui, Client
+from .assets import asset_url
 
 _ASSETS_DIR = Path(__file__).parent / "libs"
 
@@ -27,6 +29,24 @@ _remove_old_theme_js = """
     });
 """
 
+# the old theme is removed once the new one is loaded, so the tables are never unstyled
+_switch_theme_js = """
+    ((name, href) => {
+        const start = performance.now();
+        const oldLinks = document.querySelectorAll('link.nicegui-tabulator-theme');
+        const link = Object.assign(document.createElement('link'), {
+            rel: 'stylesheet', className: 'nicegui-tabulator-theme', href,
+        });
+        link.onload = () => {
+            oldLinks.forEach(oldLink => oldLink.remove());
+            performance.measure(`nicegui-tabulator:theme:${name}`, { start, end: performance.now() });
+        };
+        document.head.appendChild(link);
+    })(%s, %s);
+"""
+
+_shared_theme_html: Optional[str] = None
+
 
 def use_theme(theme_name: _T_THEME_NAME, shared: Optional[bool] = None) -> None:
     """Use a tabulator theme.
@@ -38,6 +58,9 @@ def use_theme(theme_name: _T_THEME_NAME, shared: Optional[bool] = None) -> None:
             `True`: use the theme for all clients.
             `False`: use the theme only for the current client.
 
+    A shared theme is switched on all open pages, also on pages that reconnect later. Each browser records the time until the
+    new theme is loaded as a `performance.measure` entry named `nicegui-tabulator:theme:<theme_name>`.
+
     ## Example
 
     ```python
@@ -70,19 +93,33 @@ def use_theme(theme_name: _T_THEME_NAME, shared: Optional[bool] = None) -> None:
     if not css_path.exists():
         raise ValueError(f"theme '{css_path.resolve()}' not found")
 
-    app.add_static_file(local_file=css_path, url_path="/" + css_name)
+    css_url = asset_url(css_path)
+    link_html = (
+        rf'<link class="nicegui-tabulator-theme" rel="stylesheet" href="{css_url}">'
+    )
 
-    clients_to_update = []
     if shared:
-        clients_to_update.extend(list(Client.instances.values()))
-    elif has_context:
-        clients_to_update.append(ui.context.client)
+        _use_shared_theme(theme_name, css_url, link_html)
+        return
 
-    for client in clients_to_update:
-        if client.has_socket_connection:
-            client.run_javascript(_remove_old_theme_js)
+    if has_context and ui.context.client.has_socket_connection:
+        ui.context.client.run_javascript(_remove_old_theme_js)
 
-    ui.add_head_html(
-        rf'<link class="nicegui-tabulator-theme" rel="stylesheet" href="/{css_name}">',
-        shared=shared,
-    )
+    ui.add_head_html(link_html)
+
+
+def _use_shared_theme(theme_name: str, css_url: str, link_html: str) -> None:
+    global _shared_theme_html
+
+    # new pages get only the latest theme
+    if _shared_theme_html is not None:
+        Client.shared_head_html = Client.shared_head_html.replace(
+            _shared_theme_html + "\n", ""
+        )
+    _shared_theme_html = link_html
+    ui.add_head_html(link_html, shared=True)
+
+    # open pages switch through their outboxes, so a page that reconnects gets the switch from its message history
+    code = _switch_theme_js % (json.dumps(theme_name), json.dumps(css_url))
+    for client in list(Client.instances.values()):
+        client.outbox.enqueue_message("run_javascript", {"code": code}, client.id)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import base64
+import math
+import numbers
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Mapping, Optional, Union
+
+ENCODED_ROWS_KEY = "__ngt_rows__"
+"""Marks a row payload that has to be decoded by `tabulator.js` before it is handed to Tabulator."""
+
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+_MAX_SAFE_INTEGER = 2**53
+
+_TYPECODES = {
+    "f8": "d",
+    "f4": "f",
+    "i4": "i" if array("i").itemsize == 4 else "l",
+}
+
+
+@dataclass(frozen=True)
+class TransferOptions:
+    """Controls how row data is encoded on its way to the client.
+
+    The server keeps the rows as they are; only the payloads sent to the browser are encoded
+    and `tabulator.js` restores the original rows before passing them to Tabulator.
+    """
+
+    dictionary_encoding: bool = False
+    """Send low-cardinality string columns as a dictionary of distinct values plus integer codes."""
+    max_cardinality_ratio: float = 0.5
+    """A string column is dictionary-encoded if its number of distinct values is at most this fraction of the rows."""
+    categorical_fields: FrozenSet[str] = field(default_factory=frozenset)
+    """Fields that are always dictionary-encoded, e.g. pandas `category` columns."""
+    binary_numeric: bool = False
+    """Send numeric columns as base64-encoded typed arrays (`float64`, `float32` or `int32`) instead of JSON numbers.
+    `None` and `NaN` both arrive as `null`."""
+    numeric_dtypes: Mapping[str, str] = field(default_factory=dict)
+    """The typed array to use per field (`"f8"`, `"f4"` or `"i4"`), e.g. derived from pandas dtypes.
+    Other numeric fields are inspected to pick `int32` or `float64`."""
+    projection: bool = False
+    """Only send the fields used by the table's columns, its index field and `keep_fields`.
+    The server keeps the full rows, e.g. for `CellSlotProps.row` and event arguments."""
+    keep_fields: FrozenSet[str] = field(default_factory=frozenset)
+    """Fields that are always sent, even if `projection` or `lazy_hidden_columns` would withhold them."""
+    lazy_hidden_columns: bool = False
+    """Withhold the values of columns with `visible: False` until the column is shown.
+    The index field is always sent."""
+    min_rows: int = 100
+    """Payloads with fewer rows are sent as they are."""
+
+
+def project_rows(
+    rows: List[Dict],
+    fields: Optional[AbstractSet[str]] = None,
+    withheld: AbstractSet[str] = frozenset(),
+) -> List[Dict]:
+    """Strip every field not in `fields` (if given) and every field in `withheld` from `rows`."""
+    if fields is not None:
+        fields = set(fields) - set(withheld)
+        return [{key: row[key] for key in fields if key in row} for row in rows]
+    return [
+        {key: value for key, value in row.items() if key not in withheld}
+        for row in rows
+    ]
+
+
+def encode_rows(
+    rows: List[Dict],
+    options: TransferOptions,
+    fields: Optional[AbstractSet[str]] = None,
+    withheld: AbstractSet[str] = frozenset(),
+) -> Union[List[Dict], Dict]:
+    """Encode `rows` for transmission, or return them unchanged if encoding would not pay off.
+
+    If `fields` or `withheld` are given, the rows are projected with `project_rows` first.
+    """
+    if fields is not None or withheld:
+        rows = project_rows(rows, fields, withheld)
+
+    if (
+        not rows
+        or len(rows) < options.min_rows
+        or not (options.dictionary_encoding or options.binary_numeric)
+    ):
+        return rows
+
+    buffers = _binary_encode(rows, options) if options.binary_numeric else {}
+    dictionaries = (
+        _dictionary_encode(rows, options, exclude=buffers.keys())
+        if options.dictionary_encoding
+        else {}
+    )
+    if not buffers and not dictionaries:
+        return rows
+
+    encoded_fields = {*buffers, *dictionaries}
+    return {
+        ENCODED_ROWS_KEY: {
+            "rows": [
+                {key: value for key, value in row.items() if key not in encoded_fields}
+                for row in rows
+            ],
+            "dictionaries": dictionaries,
+            "buffers": buffers,
+        }
+    }
+
+
+def _dictionary_encode(
+    rows: List[Dict], options: TransferOptions, exclude=()
+) -> Dict[str, Dict]:
+    limit = int(len(rows) * options.max_cardinality_ratio)
+    dictionaries: Dict[str, Dict] = {}
+
+    for name in rows[0]:
+        if name in exclude:
+            continue
+        categorical = name in options.categorical_fields
+        codes_by_value: Dict[Any, int] = {}
+        codes: List[int] = []
+        for row in rows:
+            if name not in row:
+                codes.append(-1)
+                continue
+            value = row[name]
+            if not categorical and value is not None and not isinstance(value, str):
+                break
+            code = codes_by_value.get(value)
+            if code is None:
+                if not categorical and len(codes_by_value) >= limit:
+                    break
+                code = codes_by_value[value] = len(codes_by_value)
+            codes.append(code)
+        else:
+            dictionaries[name] = {"values": list(codes_by_value), "codes": codes}
+
+    return dictionaries
+
+
+def _binary_encode(rows: List[Dict], options: TransferOptions) -> Dict[str, Dict]:
+    buffers: Dict[str, Dict] = {}
+
+    for name in rows[0]:
+        try:
+            values = [row[name] for row in rows]
+        except KeyError:
+            continue
+        dtype = options.numeric_dtypes.get(name) or _infer_dtype(values)
+        if dtype not in _TYPECODES:
+            continue
+        if dtype != "i4":
+            values = [math.nan if value is None else value for value in values]
+        try:
+            packed = array(_TYPECODES[dtype], values)
+        except (TypeError, OverflowError):
+            continue
+        if sys.byteorder != "little":
+            packed.byteswap()
+        buffers[name] = {
+            "dtype": dtype,
+            "data": base64.b64encode(packed.tobytes()).decode("ascii"),
+        }
+
+    return buffers
+
+
+def _infer_dtype(values: List[Any]) -> Optional[str]:
+    integral = True
+    has_value = False
+    for value in values:
+        if value is None:
+            integral = False
+            continue
+        if isinstance(value, bool) or not isinstance(value, numbers.Real):
+            return None
+        has_value = True
+        if isinstance(value, numbers.Integral):
+            if abs(value) > _MAX_SAFE_INTEGER:
+                return None
+            integral = integral and _INT32_MIN <= value <= _INT32_MAX
+        else:
+            integral = False
+
+    if not has_value:
+        return None
+    return "i4" if integral else "f8"
@@ -1,43 +1,306 @@
-from typing import Union, Callable
-from nicegui import ui, Client as ng_client
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from nicegui import ui, background_tasks, core, Client as ng_client
 from nicegui.awaitable_response import AwaitableResponse
 import asyncio
+import contextlib
+import functools
+import itertools
+import re
 import uuid
+import weakref
 
 _TTask = Union[Callable[..., None], Callable[..., AwaitableResponse]]
 
+_CSV_NUMBER = re.compile(
+    r"-?(?:0|[1-9][0-9]*)(?P<fraction>\.[0-9]+)?(?P<exponent>[eE][-+]?[0-9]+)?"
+)
+"""A number as it is written in a CSV file. Values like `01234` (ZIP codes, IDs), `1_000` or ` 12` are not numbers."""
+
+
+class _ConnectionDispatcher:
+    """Flushes the deferred tasks of all live tables of a client through a single connect handler."""
+
+    _instances: "weakref.WeakKeyDictionary[ng_client, _ConnectionDispatcher]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, client: ng_client):
+        self._deferred_tasks: "weakref.WeakSet[DeferredTask]" = weakref.WeakSet()
+        client.on_connect(self._on_connect)
+
+    @classmethod
+    def of(cls, client: ng_client) -> "_ConnectionDispatcher":
+        if client not in cls._instances:
+            cls._instances[client] = cls(client)
+        return cls._instances[client]
+
+    def add(self, deferred_task: "DeferredTask"):
+        self._deferred_tasks.add(deferred_task)
+
+    def discard(self, deferred_task: "DeferredTask"):
+        self._deferred_tasks.discard(deferred_task)
+
+    async def _on_connect(self, client: ng_client):
+        await client.connected()
+
+        for deferred_task in list(self._deferred_tasks):
+            # the others are flushed once their component is ready, e.g. a lazy table once it is built
+            if deferred_task.component_connected:
+                deferred_task.flush()
+
 
 class DeferredTask:
-    def __init__(self):
-        self._tasks: list[_TTask] = []
+    def __init__(self, batch: Optional[Callable[[], ContextManager]] = None):
+        """
+        Args:
+            batch (Callable[[], ContextManager], optional): A context manager the pending tasks are flushed in, e.g. to send them as one message.
+        """
+        self._tasks: List[Tuple[Optional[Hashable], Optional[str], _TTask]] = []
+        self._batch = batch or contextlib.nullcontext
+        self._release_callbacks: List[Callable[[], None]] = []
         self.component_connected = False
 
-        async def on_client_connect(
-            client: ng_client,
-        ):
-            await client.connected()
+        self._client = ui.context.client
+        self._dispatcher = _ConnectionDispatcher.of(self._client)
+        self._dispatcher.add(self)
 
-            self.flush()
+    def register(
+        self,
+        task: Optional[_TTask] = None,
+        *,
+        key: Optional[Hashable] = None,
+        group: Optional[str] = None,
+    ):
+        """Run the task now if the component is connected, otherwise when it connects.
 
-        ui.context.client.on_connect(on_client_connect)
+        Can be used as a decorator, with or without arguments.
 
-    def register(self, task: _TTask):
-        if ui.context.client.has_socket_connection and self.component_connected:
-            task()
-        else:
-            self._tasks.append(task)
+        Args:
+            task (_TTask, optional): The task to run.
+            key (Hashable, optional): A pending task with the same key is superseded by this one and dropped.
+            group (str, optional): The group of the task, see `discard`.
+        """
+        if task is None:
+            return lambda task: self.register(task, key=key, group=group)
 
-    def flush(self):
-        for task in self._tasks:
+        if self._client.has_socket_connection and self.component_connected:
             self._execute_task(task)
+            return
 
+        if key is not None:
+            self._tasks = [pending for pending in self._tasks if pending[0] != key]
+        self._tasks.append((key, group, task))
+
+    def discard(self, group: str):
+        """Drop the pending tasks of a group, e.g. because a new task makes them obsolete."""
+        self._tasks = [pending for pending in self._tasks if pending[1] != group]
+
+    def on_release(self, callback: Callable[[], None]):
+        """Run the callback when the tasks are released, e.g. to free resources a pending task would have used."""
+        self._release_callbacks.append(callback)
+
+    def release(self):
+        """Drop the pending tasks and stop flushing on connect, e.g. because the component has been deleted."""
         self._tasks.clear()
+        self._dispatcher.discard(self)
+        callbacks, self._release_callbacks = self._release_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def flush(self):
+        with self._batch():
+            # tasks may register further tasks while they run
+            while self._tasks:
+                tasks, self._tasks = self._tasks, []
+                for _, _, task in tasks:
+                    self._execute_task(task)
 
     def _execute_task(self, task):
         result = task()
         if asyncio.iscoroutine(result):
-            asyncio.create_task(result)
+            background_tasks.create(result)
 
 
 def generate_dataframe_unique_id_column_name():
     return f"__{uuid.uuid4().hex}"
+
+
+def iter_csv_chunks(
+    reader: Iterator[List[str]],
+    header: List[str],
+    chunk_size: int,
+    row_id_field: Optional[str] = None,
+    infer_types: bool = False,
+) -> Iterator[List[Dict]]:
+    row_id = 0
+    converters: Optional[List[Callable[[str], Any]]] = None
+    for rows in iter(lambda: list(itertools.islice(reader, chunk_size)), []):
+        if infer_types:
+            if converters is None:
+                converters = [
+                    _csv_converter(row[i] for row in rows if i < len(row))
+                    for i in range(len(header))
+                ]
+            rows = [
+                [convert(value) for convert, value in zip(converters, row)]
+                for row in rows
+            ]
+        chunk = [dict(zip(header, row)) for row in rows]
+        if row_id_field is not None:
+            for row in chunk:
+                row[row_id_field] = row_id
+                row_id += 1
+        yield chunk
+
+
+def _csv_converter(values: Iterable[str]) -> Callable[[str], Any]:
+    """Convert the values of a CSV column to `int` or `float` if all of the given non-empty values are written as one."""
+    matches = [_CSV_NUMBER.fullmatch(value) for value in values if value != ""]
+    if matches and all(matches):
+        is_int = not any(m.group("fraction") or m.group("exponent") for m in matches)
+        return functools.partial(_csv_number, number_type=int if is_int else float)
+    return _csv_text
+
+
+def _csv_number(value: str, number_type: type) -> Any:
+    if value == "":
+        return None
+    match = _CSV_NUMBER.fullmatch(value)
+    if match is None:
+        # a later value that is not a number is kept as it is
+        return value
+    if match.group("fraction") or match.group("exponent"):
+        return float(value)
+    return number_type(value)
+
+
+def _csv_text(value: str) -> str:
+    return value
+
+
+def is_loop_running() -> bool:
+    """Whether the NiceGUI event loop is running, i.e. messages can be sent and tasks scheduled."""
+    return core.loop is not None and core.loop.is_running()
+
+
+def scaled_timeout(num_rows: int, *, base: float = 1.0, rows_per_second: int = 50_000):
+    """A response timeout that grows with the number of rows sent."""
+    return base + num_rows / rows_per_second
+
+
+def typed_array_dtypes(dtypes) -> Dict[str, str]:
+    """Map the numeric columns of a pandas `dtypes` series to the typed arrays used by binary transfer."""
+    result = {}
+    for name, dtype in dtypes.items():
+        if dtype.kind == "f":
+            result[name] = "f4" if dtype.itemsize <= 4 else "f8"
+        elif (dtype.kind == "i" and dtype.itemsize <= 4) or (
+            dtype.kind == "u" and dtype.itemsize <= 2
+        ):
+            result[name] = "i4"
+    return result
+
+
+def column_fields(columns: List[Dict], *, hidden_only: bool = False) -> Set[str]:
+    """Collect the fields of column definitions, including those nested in column groups."""
+    fields = set()
+    for column in columns:
+        if "field" in column and (not hidden_only or column.get("visible") is False):
+            fields.add(column["field"])
+        fields.update(column_fields(column.get("columns", []), hidden_only=hidden_only))
+    return fields
+
+
+def update_column(columns: List[Dict], field: str, definition: Dict) -> bool:
+    """Merge `definition` into the column with the given field, searching column groups too."""
+    for i, column in enumerate(columns):
+        if column.get("field") == field:
+            columns[i] = {**column, **definition}
+            return True
+        if "columns" in column:
+            children = list(column["columns"])
+            if update_column(children, field, definition):
+                columns[i] = {**column, "columns": children}
+                return True
+    return False
+
+
+def insert_column(
+    columns: List[Dict],
+    definition: Dict,
+    before: Optional[bool] = None,
+    position: Optional[str] = None,
+):
+    """Insert a column the way Tabulator's `addColumn` does."""
+    fields = [column.get("field") for column in columns]
+    if position is not None and position in fields:
+        index = fields.index(position)
+        columns.insert(index if before else index + 1, definition)
+    elif before:
+        columns.insert(0, definition)
+    else:
+        columns.append(definition)
+
+
+def insert_rows(
+    rows: List[Dict],
+    data: List[Dict],
+    index_field: str,
+    at_top: bool,
+    index: Optional[Union[int, str]] = None,
+) -> List[Dict]:
+    """Insert `data` into `rows` the way Tabulator's `addData` does, returning the inserted rows as `rows` holds them."""
+    if index is None:
+        row_index = 0 if at_top else len(rows)
+    else:
+        indices = [i for i, row in enumerate(rows) if row[index_field] == index]
+        if not indices:
+            row_index = 0 if at_top else len(rows)
+        else:
+            row_index = indices[0] + (0 if at_top else 1)
+
+    rows[row_index:row_index] = data
+    return rows[row_index : row_index + len(data)]
+
+
+def update_rows(rows: List[Dict], data: List[Dict], index_field: str):
+    """Update `rows` in place the way Tabulator's `updateData` does."""
+    update_dict = {record[index_field]: record for record in data}
+
+    for row in rows:
+        update_id = row.get(index_field, None)
+        if not update_id:
+            continue
+
+        update_record = update_dict.get(update_id, None)
+
+        if update_record:
+            row.update(update_record)
+
+
+def update_or_add_rows(
+    rows: List[Dict], data: List[Dict], index_field: str
+) -> List[Dict]:
+    """Update or append rows in place the way Tabulator's `updateOrAddData` does, returning the appended rows as `rows` holds them."""
+    update_dict = {item[index_field]: item for item in data}
+
+    for item in rows:
+        if item[index_field] in update_dict:
+            item.update(update_dict.pop(item[index_field]))
+
+    count = len(rows)
+    rows.extend(update_dict.values())
+    return rows[count:]
@@ -0,0 +1,129 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+from nicegui_tabulator.core.arrow import ArrowDataSource
+from nicegui_tabulator.core.remote import RemoteRequest
+
+
+@pytest.fixture
+def table():
+    return pa.table(
+        {
+            "name": [f"name{i}" for i in range(10)],
+            "age": [5, 3, 9, 1, 7, 3, 8, 2, 6, 4],
+            "color": ["red", "blue"] * 5,
+        }
+    )
+
+
+@pytest.fixture(params=["parquet", "arrow"])
+def source(request, table, tmp_path):
+    if request.param == "parquet":
+        path = tmp_path / "data.parquet"
+        pq.write_table(table, path, row_group_size=3)
+        return ArrowDataSource.from_parquet(path, row_id_field="rid")
+
+    path = tmp_path / "data.arrow"
+    feather.write_feather(table, path, chunksize=3)
+    return ArrowDataSource.from_arrow_file(path, row_id_field="rid")
+
+
+def test_pages(source: ArrowDataSource):
+    rows, total = source.fetch(RemoteRequest.from_params({"page": 2, "size": 4}))
+
+    assert total == 10
+    assert [row["name"] for row in rows] == ["name4", "name5", "name6", "name7"]
+    assert [row["rid"] for row in rows] == [4, 5, 6, 7]
+
+    response = RemoteRequest(page=3, size=4).to_response(
+        *source.fetch(RemoteRequest(page=3, size=4))
+    )
+    assert response["last_page"] == 3
+    assert len(response["data"]) == 2
+
+
+def test_unsorted_page_positions(source: ArrowDataSource, monkeypatch):
+    sizes = []
+    arange = np.arange
+
+    def recording_arange(*args, **kwargs):
+        sizes.append(len(arange(*args, **kwargs)))
+        return arange(*args, **kwargs)
+
+    monkeypatch.setattr(np, "arange", recording_arange)
+    rows, total = source.fetch(RemoteRequest(page=2, size=4))
+
+    assert total == 10
+    assert [row["rid"] for row in rows] == [4, 5, 6, 7]
+    # only the positions of the page, not of all rows
+    assert sizes == [4]
+
+
+def test_concurrent_fetches(source: ArrowDataSource):
+    params = [
+        {"page": page, "size": 2, "sort": [{"field": field, "dir": "asc"}]}
+        for page in range(1, 6)
+        for field in ["age", "name", "color"]
+    ]
+
+    def fetch(params):
+        rows, _ = source.fetch(RemoteRequest.from_params(params))
+        return [row["rid"] for row in rows]
+
+    expected = [fetch(p) for p in params]
+    source._groups.clear()
+    source._orders.clear()
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(fetch, params * 20)) == expected * 20
+
+
+def test_sort(source: ArrowDataSource):
+    params = {
+        "page": 1,
+        "size": 3,
+        # the last sorter is the primary one
+        "sort": [{"field": "name", "dir": "desc"}, {"field": "age", "dir": "asc"}],
+    }
+    rows, _ = source.fetch(RemoteRequest.from_params(params))
+
+    assert [(row["age"], row["name"]) for row in rows] == [
+        (1, "name3"),
+        (2, "name7"),
+        (3, "name5"),
+    ]
+
+
+def test_filter(source: ArrowDataSource):
+    params = {
+        "page": 1,
+        "size": 10,
+        "sort": [{"field": "age", "dir": "desc"}],
+        "filter": [
+            {"field": "color", "type": "=", "value": "red"},
+            {"field": "age", "type": ">=", "value": "7"},
+        ],
+    }
+    rows, total = source.fetch(RemoteRequest.from_params(params))
+
+    assert total == 3
+    assert [row["age"] for row in rows] == [9, 8, 7]
+
+    rows, total = source.fetch(
+        RemoteRequest.from_params(
+            {"filter": [{"field": "name", "type": "like", "value": "ME1"}]}
+        )
+    )
+    assert [row["name"] for row in rows] == ["name1"]
+
+
+def test_unsupported_filter(source: ArrowDataSource):
+    with pytest.raises(ValueError):
+        source.fetch(
+            RemoteRequest.from_params(
+                {"filter": [{"field": "age", "type": "between", "value": 1}]}
+            )
+        )
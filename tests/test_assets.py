@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from nicegui import app
+
+from nicegui_tabulator.core.assets import ASSETS_URL, asset_url
+from nicegui_tabulator.core.dependencies import luxon_url
+
+CSS_PATH = (
+    Path(__file__).parent.parent
+    / "nicegui_tabulator"
+    / "core"
+    / "libs"
+    / "tabulator.min.css"
+)
+
+
+def test_hashed_url():
+    url = asset_url(CSS_PATH)
+
+    assert url.startswith(ASSETS_URL + "/tabulator.min.")
+    assert url.endswith(".css")
+    assert asset_url(CSS_PATH) == url
+
+
+def test_precompressed_and_immutable():
+    client = TestClient(app)
+    url = asset_url(CSS_PATH)
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "immutable" in response.headers["cache-control"]
+    assert response.content == CSS_PATH.read_bytes()
+
+    response = client.get(
+        url,
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+    assert client.get(ASSETS_URL + "/unknown.css").status_code == 404
+
+
+def test_vendored_luxon():
+    response = TestClient(app).get(luxon_url())
+
+    assert response.status_code == 200
+    assert "javascript" in response.headers["content-type"]
+    assert b'VERSION="3.' in response.content
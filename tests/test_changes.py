@@ -0,0 +1,37 @@
+from nicegui_tabulator.core.changes import ChangeLog
+
+
+def test_replay_since_version():
+    log = ChangeLog()
+    log.record("setData")
+    log.record("addData", [{"id": 1}], (False, None))
+    log.record("updateData", [{"id": 1, "name": "foo"}])
+
+    assert log.version == 3
+    assert [change.method for change in log.since(1)] == ["addData", "updateData"]
+    assert log.since(3) == []
+
+
+def test_reset_requires_resync():
+    log = ChangeLog()
+    log.record("addData", [{"id": 1}])
+    log.record("clearData")
+    log.record("addData", [{"id": 2}])
+
+    assert log.since(0) is None
+    assert [change.version for change in log.since(2)] == [3]
+    # a client ahead of the server, e.g. after a restart
+    assert log.since(4) is None
+
+
+def test_bounded_log():
+    log = ChangeLog(max_changes=2, max_rows=3)
+    for i in range(3):
+        log.record("addData", [{"id": i}])
+
+    assert log.since(0) is None
+    assert [change.version for change in log.since(1)] == [2, 3]
+
+    log.record("addData", [{"id": 3}, {"id": 4}])
+    assert log.since(1) is None
+    assert [change.version for change in log.since(2)] == [3, 4]
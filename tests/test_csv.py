@@ -0,0 +1,69 @@
+import csv
+import io
+
+import nicegui_tabulator.core.tabulator as tabulator_module
+from nicegui_tabulator import tabulator
+from nicegui_tabulator.core.utils import iter_csv_chunks
+
+
+def read_chunks(text: str, chunk_size: int, infer_types: bool = True):
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader)
+    return list(iter_csv_chunks(reader, header, chunk_size, infer_types=infer_types))
+
+
+def test_infer_types():
+    text = "name,age,score,zip\nfoo,1,1.5,x1\nbar,,2,x2\nbaz,3.5,n/a,x3\n"
+    chunks = read_chunks(text, chunk_size=2)
+
+    # the types are inferred from the first chunk, later values that don't parse are kept as they are
+    assert chunks == [
+        [
+            {"name": "foo", "age": 1, "score": 1.5, "zip": "x1"},
+            {"name": "bar", "age": None, "score": 2.0, "zip": "x2"},
+        ],
+        [{"name": "baz", "age": 3.5, "score": "n/a", "zip": "x3"}],
+    ]
+
+    assert read_chunks(text, chunk_size=2, infer_types=False)[0][0] == {
+        "name": "foo",
+        "age": "1",
+        "score": "1.5",
+        "zip": "x1",
+    }
+
+
+def test_values_not_written_as_numbers():
+    text = "zip,count,size,code\n01234,1_000,1.50, 12\n10115,7,2e3,7\n98052,007,3,8\n"
+    chunks = read_chunks(text, chunk_size=2)
+
+    # leading zeros, underscores and padding keep a column as text, later values like them stay as they are
+    assert chunks == [
+        [
+            {"zip": "01234", "count": "1_000", "size": 1.5, "code": " 12"},
+            {"zip": "10115", "count": "7", "size": 2000.0, "code": "7"},
+        ],
+        [{"zip": "98052", "count": "007", "size": 3.0, "code": "8"}],
+    ]
+
+    chunks = read_chunks("count\n1\n2\n007\n", chunk_size=2)
+    assert chunks == [[{"count": 1}, {"count": 2}], [{"count": "007"}]]
+
+
+def test_file_closed_when_deleted_before_streaming(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    path.write_text("name\n" + "".join(f"name{i}\n" for i in range(5)))
+
+    files = []
+
+    def recording_open(*args, **kwargs):
+        files.append(open(*args, **kwargs))
+        return files[-1]
+
+    monkeypatch.setattr(tabulator_module, "open", recording_open, raising=False)
+
+    # the client never connects, the stream never starts
+    table = tabulator.from_csv(path, chunk_size=2)
+    assert not files[0].closed
+    table.delete()
+    assert files[0].closed
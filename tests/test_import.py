@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+
+def test_import_without_data_libraries():
+    # pandas, numpy and pyarrow are only imported by the helpers using them
+    code = (
+        "import sys, nicegui_tabulator;"
+        "print(','.join(m for m in ('pandas', 'numpy', 'pyarrow') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
@@ -0,0 +1,117 @@
+import asyncio
+import datetime
+import json
+import re
+
+import numpy as np
+from nicegui import core
+
+from nicegui_tabulator import SharedData, tabulator
+
+ROWS = [
+    {
+        "id": np.int64(2),
+        "value": np.float64("nan"),
+        "at": datetime.datetime(2024, 1, 2, 3, 4),
+    }
+]
+
+
+def call_arguments(code: str):
+    """The arguments of a `runMethod` call, parsed as strict JSON."""
+    arguments = re.search(r"runMethod\(\d+, \"\w+\", (.*)\)$", code).group(1)
+    return json.loads(arguments, parse_constant=lambda constant: 1 / 0)
+
+
+def test_shared_delta_with_numpy_and_datetime():
+    shared = SharedData([{"id": 1}])
+    table = tabulator({}, shared_data=shared)
+    table._rendered_version = 0
+    codes = []
+    table._enqueue_javascript = codes.append
+
+    shared.add_data(ROWS)
+    table._Tabulator__deferred_task.flush()
+
+    version, method, rows, *_ = call_arguments(codes[0])
+    assert (version, method) == (1, "addData")
+    assert rows == [{"id": 2, "value": None, "at": "2024-01-02T03:04:00"}]
+
+
+def test_no_reply_call_with_numpy_and_datetime(monkeypatch):
+    monkeypatch.setattr("nicegui_tabulator.core.utils.is_loop_running", lambda: True)
+    table = tabulator({"data": [{"id": 2}]})
+    codes = []
+    table._enqueue_javascript = codes.append
+
+    table.update_data(ROWS, reply=False)
+
+    version, method, rows = call_arguments(codes[0])
+    assert (version, method) == (1, "updateData")
+    assert rows == [{"id": 2, "value": None, "at": "2024-01-02T03:04:00"}]
+
+
+def test_data_methods_do_not_update_the_element(monkeypatch):
+    table = tabulator({"data": [{"id": 1, "name": "foo"}]})
+    methods = []
+
+    async def run_method(name, *args, timeout=None):
+        methods.append(name)
+
+    table.run_method = run_method
+    table._enqueue_javascript = lambda code: None
+
+    async def change_data():
+        monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+        table.client.outbox.updates.clear()
+        await table.set_data([{"id": i} for i in range(5)], chunk_size=2)
+        table.update_data([{"id": 1, "name": "bar"}], reply=False)
+        table.add_data([{"id": 9}], reply=False)
+        table.update_or_add_data([{"id": 10}], reply=False)
+
+    asyncio.run(change_data())
+    assert methods == ["receiveChunk"] * 3 + ["commitChunks"]
+    # the rows are sent by the data methods, not again with the options of the element
+    assert table.id not in table.client.outbox.updates
+    assert [row["id"] for row in table.data] == [0, 1, 2, 3, 4, 9, 10]
+
+
+def test_failed_remote_request_is_rejected(monkeypatch):
+    table = tabulator({"data": [{"id": 1, "age": 3}]}, server_side=True)
+    calls = []
+    table.run_method = lambda name, *args, **kwargs: calls.append((name, *args))
+    errors = []
+    monkeypatch.setattr(core.app, "handle_exception", errors.append)
+
+    async def request(filters):
+        monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+        await table._serve_remote_request(7, {"filter": filters})
+
+    asyncio.run(request([{"field": "age", "type": "between", "value": 1}]))
+    assert calls == [
+        ("rejectRemoteRequest", 7, "Unsupported remote filter type 'between'")
+    ]
+    assert isinstance(errors[0], ValueError)
+
+    calls.clear()
+    asyncio.run(request([{"field": "age", "type": "=", "value": 3}]))
+    assert calls[0][:2] == ("resolveRemoteRequest", 7)
+
+
+def test_cell_slot_finds_rows_by_key():
+    rows = [{"id": 10, "name": "foo"}, {"id": 20, "name": "bar"}]
+    local = tabulator({"data": [dict(row) for row in rows]})
+    server_side = tabulator({"data": [dict(row) for row in rows]}, server_side=True)
+
+    for table in (local, server_side):
+        calls = []
+        table.run_method = lambda name, *args, **kwargs: calls.append((name, *args))
+        slots = []
+        table.add_cell_slot("name")(slots.append)
+
+        # the client renders the second row first, e.g. after sorting or on its page
+        table._update_cell_slot("name", 1, 20)
+        table._update_cell_slot("name", 2, 30)
+
+        assert [(s.row_number, s.row_index, s.value) for s in slots] == [(1, 1, "bar")]
+        assert calls == [("resetRowFormat", 1)]
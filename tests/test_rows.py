@@ -0,0 +1,297 @@
+import operator
+import random
+import re
+
+import pytest
+from nicegui_tabulator.core.remote import RemoteRequest
+from nicegui_tabulator.core.rows import RowsDataSource
+
+
+def make_rows(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "age": rng.choice([None, *range(10)]),
+            "color": rng.choice(["red", "green", "blue", None]),
+        }
+        for i in range(count)
+    ]
+
+
+def expected_ids(rows, sorters):
+    """Sort the way Tabulator does: the last sorter is the primary one. Missing values are last."""
+    result = list(rows)
+    for field, descending in sorters:
+        present = [row for row in result if row.get(field) is not None]
+        missing = [row for row in result if row.get(field) is None]
+        result = (
+            sorted(present, key=lambda row: row[field], reverse=descending) + missing
+        )
+    return [row["id"] for row in result]
+
+
+def fetch_ids(source: RowsDataSource, sorters, filters=None):
+    params = {
+        "sort": [
+            {"field": field, "dir": "desc" if descending else "asc"}
+            for field, descending in sorters
+        ],
+        "filter": filters or [],
+    }
+    rows, _ = source.fetch(RemoteRequest.from_params(params))
+    return [row["id"] for row in rows]
+
+
+def test_sort():
+    rows = make_rows(200)
+    source = RowsDataSource(rows)
+
+    for sorters in (
+        [("age", False)],
+        [("color", True)],
+        [("color", False), ("age", True)],
+        [("age", False), ("color", False)],
+    ):
+        assert fetch_ids(source, sorters) == expected_ids(rows, sorters)
+
+
+def test_changes_keep_orders_valid():
+    rows = make_rows(100)
+    source = RowsDataSource(rows)
+    sorters = [("color", False), ("age", True)]
+    fetch_ids(source, sorters)
+
+    source.update_data([{"id": 3, "age": 42}, {"id": 7, "color": "purple"}])
+    assert fetch_ids(source, sorters) == expected_ids(source.rows, sorters)
+
+    # rows added at the bottom are merged into the cached orders
+    source.add_data([{"id": 100 + i, "age": i % 4, "color": "red"} for i in range(20)])
+    assert fetch_ids(source, sorters) == expected_ids(source.rows, sorters)
+    assert fetch_ids(source, [("color", True)]) == expected_ids(
+        source.rows, [("color", True)]
+    )
+
+    source.add_data([{"id": 200, "age": 99, "color": "amber"}], at_top=True)
+    source.update_or_add_data([{"id": 0, "age": 1}, {"id": 201, "age": 5}])
+    assert fetch_ids(source, sorters) == expected_ids(source.rows, sorters)
+    assert fetch_ids(source, [("age", False)]) == expected_ids(
+        source.rows, [("age", False)]
+    )
+
+
+def test_new_values_keep_keys():
+    source = RowsDataSource(make_rows(50))
+    fetch_ids(source, [("color", False)])
+    column = source._columns["color"]
+
+    source.add_data([{"id": 50, "color": "amber"}])
+    source.update_data([{"id": 3, "color": "zinc"}, {"id": 4, "color": "cyan"}])
+    assert source._columns["color"] is column
+    assert ("color", False) in source._sorts._permutations
+    assert fetch_ids(source, [("color", False)]) == expected_ids(
+        source.rows, [("color", False)]
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_changes(seed):
+    rng = random.Random(seed)
+    source = RowsDataSource(make_rows(200, seed))
+    like = {"field": "color", "type": "like", "value": "C1"}
+    sorter_lists = [
+        [("color", False)],
+        [("color", True)],
+        [("age", True), ("color", False)],
+    ]
+    for sorters in sorter_lists:
+        fetch_ids(source, sorters)
+
+    next_id = 200
+    for _ in range(30):
+        if rng.random() < 0.7:
+            records = [
+                {
+                    "id": rng.randrange(next_id),
+                    rng.choice(["age", "color"]): rng.choice(
+                        [None, rng.randrange(20), rng.choice("abcdefgh") * 3]
+                    ),
+                }
+                for _ in range(rng.randint(1, 5))
+            ]
+            # a field gets either numbers or strings, like a real column
+            for record in records:
+                if "age" in record and isinstance(record["age"], str):
+                    record["age"] = len(record["age"])
+                if "color" in record and isinstance(record["color"], int):
+                    record["color"] = str(record["color"])
+            source.update_data(records)
+        else:
+            count = rng.randint(1, 80)
+            source.add_data(
+                [
+                    {
+                        "id": next_id + i,
+                        "age": rng.randrange(10),
+                        "color": f"c{rng.randrange(500)}",
+                    }
+                    for i in range(count)
+                ]
+            )
+            next_id += count
+        for sorters in sorter_lists:
+            assert fetch_ids(source, sorters) == expected_ids(source.rows, sorters)
+        assert fetch_ids(source, [], [like]) == expected_filter_ids(
+            source.rows, "color", "like", "C1"
+        )
+
+
+def test_pages_and_filters():
+    source = RowsDataSource(
+        [{"id": i, "age": i % 5, "name": f"name{i}"} for i in range(20)]
+    )
+
+    rows, total = source.fetch(
+        RemoteRequest.from_params(
+            {
+                "page": 2,
+                "size": 2,
+                "sort": [{"field": "id", "dir": "desc"}],
+                "filter": [{"field": "age", "type": ">=", "value": "3"}],
+            }
+        )
+    )
+    assert total == 8
+    assert [row["id"] for row in rows] == [14, 13]
+
+    source.clear_data()
+    assert source.fetch(RemoteRequest()) == ([], 0)
+
+
+def expected_filter_ids(rows, field, type, value):
+    """Evaluate a filter row by row, values being compared with the type of the field."""
+    compare = {
+        "=": operator.eq,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
+
+    def matches(cell):
+        if type == "!=":
+            return not matches_type(cell, "=")
+        return matches_type(cell, type)
+
+    def matches_type(cell, type):
+        if cell is None:
+            return False
+        if type in compare:
+            target = float(value) if isinstance(cell, (int, float)) else value
+            return compare[type](cell, target)
+        if type == "in":
+            return str(cell) in value
+        text = str(cell).lower()
+        if type == "like":
+            return value.lower() in text
+        if type == "starts":
+            return text.startswith(value.lower())
+        if type == "ends":
+            return text.endswith(value.lower())
+        if type == "regex":
+            return re.search(value, str(cell)) is not None
+        return any(keyword in text for keyword in value.lower().split())
+
+    return [row["id"] for row in rows if matches(row.get(field))]
+
+
+@pytest.mark.parametrize(
+    "field, type, value",
+    [
+        ("age", "=", "3"),
+        ("age", "!=", "3"),
+        ("age", "<", "3"),
+        ("age", "<=", "3"),
+        ("age", ">", "3.5"),
+        ("age", ">=", "3"),
+        ("age", "in", ["1", "7"]),
+        ("age", "like", "7"),
+        ("color", "=", "red"),
+        ("color", "!=", "red"),
+        ("color", "<", "green"),
+        ("color", ">=", "cyan"),
+        ("color", "in", ["blue", "red"]),
+        ("color", "like", "RE"),
+        ("color", "starts", "b"),
+        ("color", "ends", "n"),
+        ("color", "regex", "^(red|blue)$"),
+        ("color", "keywords", "gr bl"),
+    ],
+)
+def test_filters(field, type, value):
+    rows = make_rows(300)
+    source = RowsDataSource(rows)
+
+    filters = [{"field": field, "type": type, "value": value}]
+    assert fetch_ids(source, [], filters) == expected_filter_ids(
+        rows, field, type, value
+    )
+
+    # the indexes are kept up to date by changes
+    source.update_data([{"id": 5, "age": 3, "color": "red"}, {"id": 6, "age": None}])
+    source.add_data(
+        [
+            {"id": 300, "age": 7, "color": "green"},
+            {"id": 301, "age": 3.5, "color": "cyan"},
+        ]
+    )
+    assert fetch_ids(source, [], filters) == expected_filter_ids(
+        source.rows, field, type, value
+    )
+
+
+class CountedText(str):
+    conversions = 0
+
+    def __str__(self):
+        CountedText.conversions += 1
+        return str.__str__(self)
+
+
+def test_text_filters_run_on_arrays():
+    rows = [{"id": i, "name": CountedText(f"Name {i % 10}")} for i in range(100)]
+    source = RowsDataSource(rows)
+    filters = [
+        ("like", "E 1"),
+        ("like", "e 12"),
+        ("starts", "name"),
+        ("ends", "7"),
+        ("keywords", "3 4"),
+    ]
+    expected = [expected_filter_ids(rows, "name", *flt) for flt in filters]
+    CountedText.conversions = 0
+    for (type, value), ids in zip(filters, expected):
+        flt = {"field": "name", "type": type, "value": value}
+        assert fetch_ids(source, [], [flt]) == ids
+    # converted once per distinct value, not again per filter or row
+    assert CountedText.conversions == 10
+
+    # a new value is added to the cached texts
+    source.update_data([{"id": 0, "name": CountedText("Name 42")}])
+    flt = {"field": "name", "type": "ends", "value": "2"}
+    assert fetch_ids(source, [], [flt]) == [0, *range(2, 100, 10)]
+    assert CountedText.conversions == 11
+
+
+def test_combined_filters():
+    rows = make_rows(300)
+    source = RowsDataSource(rows)
+    filters = [
+        {"field": "color", "type": "=", "value": "red"},
+        {"field": "age", "type": ">=", "value": "5"},
+    ]
+
+    expected = set(expected_filter_ids(rows, "color", "=", "red")) & set(
+        expected_filter_ids(rows, "age", ">=", "5")
+    )
+    assert fetch_ids(source, [("id", True)], filters) == sorted(expected, reverse=True)
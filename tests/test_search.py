@@ -0,0 +1,117 @@
+from nicegui_tabulator import tabulator
+from nicegui_tabulator.core.remote import RemoteRequest
+from nicegui_tabulator.core.rows import RowsDataSource
+from nicegui_tabulator.core.search import SearchIndex, words
+
+ROWS = [
+    {"id": 1, "name": "Alice Smith", "city": "New York"},
+    {"id": 2, "name": "Bob Smithers", "city": "Newark"},
+    {"id": 3, "name": "Carol", "city": "York"},
+    {"id": 4, "name": None, "city": "Boston", "age": 42},
+]
+
+
+def test_words():
+    assert words("New-York, NY") == ["new", "york", "ny"]
+    assert words(42.5) == ["42", "5"]
+    assert words(None) == []
+
+
+def test_prefix_and_all_words():
+    index = SearchIndex("id")
+    index.update_rows(ROWS)
+
+    assert index.search("smith") == {1, 2}
+    assert index.search("SMITH new") == {1, 2}
+    assert index.search("smith york") == {1}
+    assert index.search("york") == {1, 3}
+    assert index.search("42") == {4}
+    assert index.search("smith boston") == set()
+    assert index.search("  ") == {1, 2, 3, 4}
+
+
+def test_fields():
+    index = SearchIndex("id", fields=["name"])
+    index.update_rows(ROWS)
+
+    assert index.search("york") == set()
+    assert index.search("carol") == {3}
+
+
+def test_changes():
+    index = SearchIndex("id")
+    index.update_rows(ROWS)
+    assert index.search("york") == {1, 3}
+
+    index.update_rows(
+        [
+            {"id": 3, "name": "Carol", "city": "Paris"},
+            {"id": 5, "name": "Dave", "city": "Yorktown"},
+        ]
+    )
+    assert index.search("york") == {1, 5}
+    assert index.search("paris") == {3}
+    # words no row contains any more are dropped
+    index.update_rows([{"id": 3, "name": "Carol", "city": "Rome"}])
+    assert index.search("paris") == set()
+
+
+def test_records():
+    rows = [dict(row) for row in ROWS]
+    index = SearchIndex("id")
+    index.update_rows(rows)
+
+    # rows are updated in place, the records only hold the changed values
+    rows[2]["city"] = "Paris"
+    index.update_records([{"id": 3, "city": "Paris"}, {"id": 9, "city": "Paris"}])
+    assert index.search("paris") == {3}
+    assert index.search("carol paris") == {3}
+
+    index.update_records([{"id": 9, "name": "Dave"}], add=True)
+    assert index.search("dave") == {9}
+
+
+def fetch_ids(source: RowsDataSource, filters=None):
+    rows, _ = source.fetch(RemoteRequest.from_params({"filter": filters or []}))
+    return [row["id"] for row in rows]
+
+
+def test_rows_data_source():
+    source = RowsDataSource([dict(row) for row in ROWS])
+    source.search("new")
+    assert fetch_ids(source) == [1, 2]
+    assert fetch_ids(source, [{"field": "name", "type": "like", "value": "bob"}]) == [2]
+
+    # the index follows the changes of the rows
+    source.update_data([{"id": 2, "city": "Chicago"}])
+    source.add_data([{"id": 5, "name": "Eve", "city": "New Haven"}])
+    assert fetch_ids(source) == [1, 5]
+    source.add_data([{"id": 6, "name": "Newton"}], at_top=True)
+    assert fetch_ids(source) == [6, 1, 5]
+
+    source.search("")
+    assert fetch_ids(source) == [6, 1, 2, 3, 4, 5]
+
+
+def test_table_updates():
+    table = tabulator({"data": [dict(row) for row in ROWS]})
+    table.search("paris", debounce=0)
+    table.update_or_add_data(
+        [{"id": 3, "city": "Paris"}, {"id": 5, "name": "Dave", "city": "Paris"}]
+    )
+    assert table._search_index.search("paris") == {3, 5}
+    assert table._search_index.search("carol") == {3}
+
+
+def test_table_add_then_update():
+    table = tabulator({"data": [dict(row) for row in ROWS]})
+    table.search("alpha", debounce=0)
+
+    # the table holds copies of the added records, later updates change the copies
+    table.add_data([{"id": 9, "name": "alpha"}])
+    table.update_or_add_data([{"id": 10, "name": "gamma"}])
+    table.update_data([{"id": 9, "name": "beta"}, {"id": 10, "name": "delta"}])
+    assert table._search_index.search("beta") == {9}
+    assert table._search_index.search("alpha") == set()
+    assert table._search_index.search("delta") == {10}
+    assert table._search_index.search("gamma") == set()
@@ -1,11 +1,20 @@
 from datetime import datetime, timedelta, timezone
 import re
 from typing import Dict, List, Optional
-from nicegui import ui
+from nicegui import Client, ui
 from .screen import BrowserManager
 from playwright.sync_api import expect, Locator, Page
-from nicegui_tabulator import tabulator, CellSlotProps, import_luxon
+from nicegui_tabulator import (
+    tabulator,
+    CellSlotProps,
+    SharedData,
+    TransferOptions,
+    import_luxon,
+    register_preset,
+    use_theme,
+)
 import pandas as pd
+from nicegui_tabulator.core import themes
 
 
 def get_table_data(table: Locator):
@@ -975,3 +984,715 @@ def test_import_luxon(browser: BrowserManager, page_path: str):
     table = page.locator(".target")
     expect(table).to_be_visible()
     check_table_rows(table, expected_data=[["14/05/1982"], ["31/01/1999"]])
+
+
+def test_luxon_loaded_on_demand(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        tabledata = [
+            {"id": 1, "name": "bar", "dob": "1982-05-14"},
+            {"id": 2, "name": "foo", "dob": "1999-01-31"},
+        ]
+        table = tabulator(
+            {"data": tabledata, "columns": [{"title": "name", "field": "name"}]}
+        ).classes("target")
+
+        ui.button(
+            "add dob",
+            on_click=lambda: table.add_column(
+                {
+                    "title": "dob",
+                    "field": "dob",
+                    "formatter": "datetime",
+                    "formatterParams": {
+                        "inputFormat": "iso",
+                        "outputFormat": "dd/MM/yyyy",
+                    },
+                }
+            ),
+        )
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+    check_table_rows(table, expected_data=[["bar"], ["foo"]])
+    assert page.evaluate("window.luxon === undefined")
+
+    page.get_by_role("button", name="add dob").click()
+    check_table_rows(
+        table, expected_data=[["bar", "14/05/1982"], ["foo", "31/01/1999"]]
+    )
+
+
+def test_from_parquet(browser: BrowserManager, page_path: str, tmp_path):
+    path = tmp_path / "data.parquet"
+    pd.DataFrame(
+        {"name": [f"name{i}" for i in range(30)], "age": list(range(30))}
+    ).to_parquet(path, row_group_size=7)
+
+    @ui.page(page_path)
+    def _():
+        tabulator.from_parquet(path, options={"paginationSize": 5}).classes("target")
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    check_table_rows(table, [[f"name{i}", str(i)] for i in range(5)])
+
+    table.get_by_text("age").click()
+    table.get_by_text("age").click()
+    check_table_rows(table, [[f"name{i}", str(i)] for i in range(29, 24, -1)])
+
+    table.get_by_role("button", name="Next Page").click()
+    check_table_rows(table, [[f"name{i}", str(i)] for i in range(24, 19, -1)])
+
+
+def test_server_side(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        data = [{"id": i, "name": f"name{i}", "age": i % 7} for i in range(30)]
+        columns = [
+            {"title": "Name", "field": "name"},
+            {"title": "Age", "field": "age"},
+        ]
+        table = tabulator(
+            {"data": data, "columns": columns, "paginationSize": 3}, server_side=True
+        ).classes("target")
+
+        ui.button("update", on_click=lambda: table.update_data([{"id": 0, "age": 99}]))
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    check_table_rows(table, [["name0", "0"], ["name1", "1"], ["name2", "2"]])
+
+    table.get_by_text("Age").click()
+    table.get_by_text("Age").click()
+    check_table_rows(table, [["name6", "6"], ["name13", "6"], ["name20", "6"]])
+
+    page.get_by_role("button", name="update").click()
+    check_table_rows(table, [["name0", "99"], ["name6", "6"], ["name13", "6"]])
+
+
+def test_search(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        data = [
+            {"id": 1, "name": "Alice Smith"},
+            {"id": 2, "name": "Bob Smithers"},
+            {"id": 3, "name": "Carol"},
+        ]
+        table = tabulator(
+            {"data": data, "columns": [{"title": "Name", "field": "name"}]}
+        ).classes("target")
+
+        ui.button("search", on_click=lambda: table.search("smith", debounce=0))
+        ui.button(
+            "update",
+            on_click=lambda: table.update_data([{"id": 3, "name": "Carol Smith"}]),
+        )
+        ui.button("clear", on_click=lambda: table.search("", debounce=0))
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    page.get_by_role("button", name="search").click()
+    check_table_rows(table, [["Alice Smith"], ["Bob Smithers"]])
+
+    # changed rows are indexed again and the query is run again
+    page.get_by_role("button", name="update").click()
+    check_table_rows(table, [["Alice Smith"], ["Bob Smithers"], ["Carol Smith"]])
+
+    page.get_by_role("button", name="clear").click()
+    check_table_rows(table, [["Alice Smith"], ["Bob Smithers"], ["Carol Smith"]])
+
+
+def test_from_csv(browser: BrowserManager, page_path: str, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "name,age\n" + "".join(f"name{i},{i}\n" for i in range(7)), encoding="utf-8"
+    )
+
+    @ui.page(page_path)
+    def _():
+        def on_progress(e):
+            lbl_progress.set_text(f"{e.loaded_rows} {e.done}")
+
+        tabulator.from_csv(
+            path, auto_index=True, chunk_size=3, on_progress=on_progress
+        ).classes("target")
+        lbl_progress = ui.label("").classes("progress-label")
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    expect(page.locator(".progress-label")).to_have_text("7 True")
+    check_table_rows(table, [[f"name{i}", str(i)] for i in range(7)])
+
+
+def test_set_data_in_chunks(browser: BrowserManager, page_path: str):
+    server_data_checker = ServerDataChecker()
+
+    @ui.page(page_path)
+    def _():
+        table = tabulator(create_table_options()).classes("target")
+        label_server_data = server_data_checker.create_elements(table)
+        lbl_progress = ui.label("").classes("progress-label")
+
+        def on_progress(e):
+            lbl_progress.set_text(f"{e.loaded_rows}/{e.total_rows}")
+
+        def set_data():
+            data = [{"id": i, "name": f"name{i}", "age": str(i)} for i in range(5)]
+            table.set_data(data, chunk_size=2, on_progress=on_progress)
+            label_server_data.set_text(str(table.data))
+
+        ui.button("set data", on_click=set_data)
+
+    page = browser.open(page_path)
+    table_locator = page.locator(".target")
+
+    page.get_by_role("button").filter(has_text=re.compile("^set data$")).click()
+    expect(page.locator(".progress-label")).to_have_text("5/5")
+    check_table_rows(table_locator, [[f"name{i}", str(i)] for i in range(5)])
+
+    server_data_checker.expect_server_data(page)
+
+
+def test_from_pandas_dictionary_encoding(browser: BrowserManager, page_path: str):
+    df = pd.DataFrame(
+        {
+            "name": [f"name{i}" for i in range(200)],
+            "region": pd.Categorical(["north", "south"] * 100),
+            "status": ["open", "closed"] * 100,
+        }
+    )
+
+    @ui.page(page_path)
+    def _():
+        table = tabulator.from_pandas(
+            df,
+            options={"pagination": True, "paginationSize": 2},
+            transfer=TransferOptions(dictionary_encoding=True),
+        ).classes("target")
+
+        ui.button(
+            "set data",
+            on_click=lambda: table.set_data(df.iloc[::-1].to_dict("records")),
+        )
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    check_table_rows(table, [["name0", "north", "open"], ["name1", "south", "closed"]])
+
+    page.get_by_role("button").filter(has_text=re.compile("^set data$")).click()
+    check_table_rows(
+        table, [["name199", "south", "closed"], ["name198", "north", "open"]]
+    )
+
+
+def test_from_pandas_binary_numeric(browser: BrowserManager, page_path: str):
+    df = pd.DataFrame(
+        {
+            "name": [f"name{i}" for i in range(200)],
+            "price": [i / 4 for i in range(200)],
+            "size": pd.Series(range(200), dtype="int32"),
+        }
+    )
+
+    @ui.page(page_path)
+    def _():
+        tabulator.from_pandas(
+            df,
+            options={"pagination": True, "paginationSize": 2},
+            transfer=TransferOptions(binary_numeric=True),
+        ).classes("target")
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    check_table_rows(table, [["name0", "0", "0"], ["name1", "0.25", "1"]])
+
+
+def test_projection(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        data = [
+            {"id": 1, "name": "bar", "age": "12", "secret": "s1"},
+            {"id": 2, "name": "foo", "age": "1", "secret": "s2"},
+        ]
+        table = (
+            tabulator(
+                create_table_options(data), transfer=TransferOptions(projection=True)
+            )
+            .classes("target")
+            .on_event(
+                "rowClick", lambda e: lbl_row_click.set_text(e.args["row"]["secret"])
+            )
+        )
+        lbl_row_click = ui.label("").classes("row-click-label")
+        lbl_client_data = ui.label("").classes("client-data")
+
+        async def show_client_data():
+            data = await table.run_table_method("getData")
+            lbl_client_data.set_text(str(data))
+
+        ui.button("show client data", on_click=show_client_data)
+        ui.button(
+            "add column",
+            on_click=lambda: table.add_column({"title": "Secret", "field": "secret"}),
+        )
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+    lbl_client_data = page.locator(".client-data")
+
+    page.get_by_role("button", name="show client data").click()
+    expect(lbl_client_data).to_contain_text("'name': 'bar'")
+    expect(lbl_client_data).not_to_contain_text("secret")
+
+    table.locator(".tabulator-row").first.click()
+    expect(page.locator(".row-click-label")).to_have_text("s1")
+
+    page.get_by_role("button", name="add column").click()
+    check_table_rows(table, [["bar", "12", "s1"], ["foo", "1", "s2"]])
+
+
+def test_lazy_hidden_columns(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        data = [
+            {"id": 1, "name": "bar", "detail": "d1", "note": "n1"},
+            {"id": 2, "name": "foo", "detail": "d2", "note": "n2"},
+        ]
+        options = {
+            "data": data,
+            "columns": [
+                {"title": "Name", "field": "name"},
+                {"title": "Detail", "field": "detail", "visible": False},
+                {"title": "Note", "field": "note", "visible": False},
+            ],
+        }
+        table = tabulator(
+            options, transfer=TransferOptions(lazy_hidden_columns=True)
+        ).classes("target")
+        lbl_client_data = ui.label("").classes("client-data")
+
+        async def show_client_data():
+            data = await table.run_table_method("getData")
+            lbl_client_data.set_text(str(data))
+
+        ui.button("show client data", on_click=show_client_data)
+        ui.button(
+            "show detail",
+            on_click=lambda: table.update_column_definition(
+                "detail", {"visible": True}
+            ),
+        )
+        ui.button(
+            "show note", on_click=lambda: table.run_table_method("showColumn", "note")
+        )
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+    lbl_client_data = page.locator(".client-data")
+
+    page.get_by_role("button", name="show client data").click()
+    expect(lbl_client_data).to_contain_text("'name': 'bar'")
+    expect(lbl_client_data).not_to_contain_text("d1")
+
+    page.get_by_role("button", name="show detail").click()
+    check_table_rows(table, [["bar", "d1"], ["foo", "d2"]])
+
+    page.get_by_role("button", name="show note").click()
+    check_table_rows(table, [["bar", "d1", "n1"], ["foo", "d2", "n2"]])
+
+
+def test_shared_data(browser: BrowserManager, page_path: str):
+    shared = SharedData([{"id": 1, "name": "bar"}, {"id": 2, "name": "foo"}])
+
+    @ui.page(page_path)
+    def _():
+        options = {"columns": [{"title": "Name", "field": "name"}]}
+        first = tabulator(options, shared_data=shared).classes("first")
+        tabulator(dict(options), shared_data=shared).classes("second")
+
+        ui.button(
+            "update", on_click=lambda: first.update_data([{"id": 1, "name": "baz"}])
+        )
+        ui.button("add", on_click=lambda: first.add_data([{"id": 3, "name": "new"}]))
+
+    page = browser.open(page_path)
+    first = page.locator(".first")
+    second = page.locator(".second")
+    check_table_rows(second, [["bar"], ["foo"]])
+
+    page.get_by_role("button", name="update").click()
+    check_table_rows(first, [["baz"], ["foo"]])
+    check_table_rows(second, [["baz"], ["foo"]])
+
+    page.get_by_role("button", name="add").click()
+    check_table_rows(second, [["baz"], ["foo"], ["new"]])
+    assert [row["name"] for row in shared.rows] == ["baz", "foo", "new"]
+
+
+def test_resume_missed_changes(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        data = [{"id": 1, "name": "bar"}, {"id": 2, "name": "foo"}]
+        table = tabulator(
+            {"data": data, "columns": [{"title": "Name", "field": "name"}]}
+        ).classes("target")
+
+        def lose_change():
+            # a change whose message never reached the client, e.g. while it was offline
+            change = [{"id": 1, "name": "lost"}]
+            table._update_data_on_server(change)
+            table._changes.record("updateData", change)
+
+        ui.button("lose change", on_click=lose_change)
+        ui.button(
+            "update", on_click=lambda: table.update_data([{"id": 2, "name": "new"}])
+        )
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+    check_table_rows(table, [["bar"], ["foo"]])
+
+    page.get_by_role("button", name="lose change").click()
+    page.get_by_role("button", name="update").click()
+    check_table_rows(table, [["lost"], ["new"]])
+
+
+def test_deferred_task_compaction(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        data = [{"id": 1, "name": "bar", "age": 12}]
+        table = tabulator(
+            {"data": data, "columns": [{"title": "Name", "field": "name"}]}
+        ).classes("target")
+        clicks = []
+
+        def on_click(e):
+            clicks.append(e.args["row"]["name"])
+            lbl_clicks.set_text(str(len(clicks)))
+
+        # only the last columns are sent, and the event listener is added once on the client
+        table.set_columns([{"title": "Age", "field": "age"}])
+        table.update_column_definition("age", {"title": "Years"})
+        table.set_columns(
+            [{"title": "Name", "field": "name"}, {"title": "Age", "field": "age"}]
+        )
+        table.on_event("rowClick", on_click)
+        table.on_event("rowClick", lambda e: None)
+
+        lbl_clicks = ui.label("").classes("clicks")
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+    check_table_rows(table, [["bar", "12"]])
+    expect(table.locator(".tabulator-col-title")).to_have_text(["Name", "Age"])
+
+    table.locator(".tabulator-row").first.click()
+    expect(page.locator(".clicks")).to_have_text("1")
+
+
+def test_connect_handler_per_client(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        client = ui.context.client
+        num_handlers = len(client.connect_handlers)
+
+        options = {
+            "data": [{"id": 1, "name": "bar"}],
+            "columns": [{"title": "Name", "field": "name"}],
+        }
+        with ui.column() as container:
+            for _ in range(10):
+                tabulator(dict(options))
+        container.clear()
+
+        tabulator(dict(options)).classes("target").on_event(
+            "rowClick", lambda e: lbl_row_click.set_text(e.args["row"]["name"])
+        )
+        lbl_row_click = ui.label("").classes("row-click-label")
+        ui.label(str(len(client.connect_handlers) - num_handlers)).classes("handlers")
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+    expect(page.locator(".handlers")).to_have_text("1")
+
+    check_table_rows(table, [["bar"]])
+    table.locator(".tabulator-row").first.click()
+    expect(page.locator(".row-click-label")).to_have_text("bar")
+
+
+def test_batch(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        table = tabulator(
+            {"data": [], "columns": [{"title": "Name", "field": "name"}]}
+        ).classes("target")
+
+        def load():
+            with table.batch():
+                table.set_columns(
+                    [
+                        {"title": "Name", "field": "name"},
+                        {"title": "Age", "field": "age"},
+                    ]
+                )
+                table.set_data(
+                    [
+                        {"id": 1, "name": "bar", "age": 12},
+                        {"id": 2, "name": "foo", "age": 30},
+                        {"id": 3, "name": "baz", "age": 45},
+                    ]
+                )
+                table.run_table_method("setSort", "age", "desc")
+                table.run_table_method("setFilter", "age", ">", 18)
+
+        ui.button("load", on_click=load)
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    page.get_by_role("button", name="load").click()
+    check_table_rows(table, [["baz", "45"], ["foo", "30"]])
+
+
+def test_batch_before_built(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        with ui.expansion("details") as expansion:
+            table = tabulator(
+                {"data": [], "columns": [{"title": "Name", "field": "name"}]},
+                lazy=True,
+            ).classes("target")
+
+        def load():
+            # the lazy table is not built yet, the changes are resumed once it is
+            with table.batch():
+                table.add_data([{"id": 1, "name": "bar"}])
+                table.add_data([{"id": 2, "name": "foo"}])
+            expansion.open()
+
+        ui.button("load", on_click=load)
+
+    page = browser.open(page_path)
+    page.get_by_role("button", name="load").click()
+    check_table_rows(page.locator(".target"), [["bar"], ["foo"]])
+
+
+def test_update_data_without_reply(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        table = tabulator(
+            {
+                "data": [{"id": 1, "name": "bar"}, {"id": 2, "name": "foo"}],
+                "columns": [{"title": "Name", "field": "name"}],
+            }
+        ).classes("target")
+
+        def update():
+            for i in range(10):
+                table.update_data([{"id": 1, "name": f"bar{i}"}], reply=False)
+            table.add_data([{"id": 3, "name": "new"}], reply=False)
+
+        ui.button("update", on_click=update)
+
+    page = browser.open(page_path)
+    table = page.locator(".target")
+
+    page.get_by_role("button", name="update").click()
+    check_table_rows(table, [["bar9"], ["foo"], ["new"]])
+
+
+def test_shared_formatter_function(browser: BrowserManager, page_path: str):
+    formatter = "function(cell){ return cell.getValue() + '!'; }"
+
+    @ui.page(page_path)
+    def _():
+        for name in ("first", "second"):
+            tabulator(
+                {
+                    "data": [{"id": 1, "name": name}],
+                    "columns": [
+                        {"title": "Name", "field": "name", ":formatter": formatter}
+                    ],
+                }
+            ).classes(name)
+
+        table = tabulator(
+            {"data": [{"id": 1, "name": "bar", "age": 12}], "columns": []}
+        ).classes("third")
+        ui.button(
+            "add column",
+            on_click=lambda: table.add_column(
+                {"title": "Name", "field": "name", ":formatter": formatter}
+            ),
+        )
+
+    page = browser.open(page_path)
+    check_table_rows(page.locator(".first"), [["first!"]])
+    check_table_rows(page.locator(".second"), [["second!"]])
+
+    page.get_by_role("button", name="add column").click()
+    check_table_rows(page.locator(".third"), [["bar!"]])
+
+
+def test_presets(browser: BrowserManager, page_path: str):
+    register_preset(
+        "people",
+        {
+            "columns": [
+                {"title": "Name", "field": "name"},
+                {"title": "Age", "field": "age"},
+            ],
+            "addRowPos": "top",
+        },
+    )
+
+    @ui.page(page_path)
+    def _():
+        data = [{"id": 1, "name": "bar", "age": 12}]
+        first = tabulator({"data": data}, presets=["people"]).classes("first")
+        tabulator(
+            {"data": data, "columns": [{"title": "Name", "field": "name"}]},
+            presets=["people"],
+        ).classes("second")
+
+        ui.button(
+            "add", on_click=lambda: first.add_data([{"id": 2, "name": "foo", "age": 3}])
+        )
+
+    page = browser.open(page_path)
+    check_table_rows(page.locator(".first"), [["bar", "12"]])
+    check_table_rows(page.locator(".second"), [["bar"]])
+
+    page.get_by_role("button", name="add").click()
+    check_table_rows(page.locator(".first"), [["foo", "3"], ["bar", "12"]])
+
+
+def test_lazy(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        data = [{"id": 1, "name": "bar"}, {"id": 2, "name": "foo"}]
+        columns = [{"title": "Name", "field": "name"}]
+
+        ui.element("div").style("height: 3000px")
+        lazy = tabulator({"data": data, "columns": columns}, lazy=True).classes("lazy")
+        lazy_data = tabulator(
+            {"data": [dict(row) for row in data], "columns": columns}, lazy_data=True
+        ).classes("lazy-data")
+
+        def update():
+            lazy.update_data([{"id": 1, "name": "baz"}])
+            lazy_data.update_data([{"id": 2, "name": "new"}])
+
+        ui.button("update", on_click=update)
+
+    page = browser.open(page_path)
+    lazy = page.locator(".lazy")
+    lazy_data = page.locator(".lazy-data")
+    expect(lazy.locator(".tabulator-row")).to_have_count(0)
+
+    page.get_by_role("button", name="update").click()
+    lazy.scroll_into_view_if_needed()
+    check_table_rows(lazy, [["baz"], ["foo"]])
+    check_table_rows(lazy_data, [["bar"], ["new"]])
+
+
+def test_lazy_table_shares_function(browser: BrowserManager, page_path: str):
+    formatter = "function(cell){ return cell.getValue() + '!'; }"
+    columns = [{"title": "Name", "field": "name", ":formatter": formatter}]
+
+    @ui.page(page_path)
+    def _():
+        # the function is sent with the lazy table, which comes first but is not built
+        with ui.expansion("details"):
+            tabulator(
+                {"data": [{"id": 1, "name": "lazy"}], "columns": columns}, lazy=True
+            )
+        tabulator({"data": [{"id": 1, "name": "eager"}], "columns": columns}).classes(
+            "eager"
+        )
+
+    page = browser.open(page_path)
+    check_table_rows(page.locator(".eager"), [["eager!"]])
+
+
+def test_build_time(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        table = tabulator(
+            {
+                "data": [{"id": 1, "name": "bar"}],
+                "columns": [{"title": "Name", "field": "name"}],
+                "renderVertical": "basic",
+            }
+        ).classes("target")
+        lbl_build_time = ui.label("").classes("build-time")
+
+        async def show_build_time():
+            build_time = await table.get_build_time()
+            lbl_build_time.set_text("built" if build_time is not None else "")
+
+        ui.button("build time", on_click=show_build_time)
+
+    page = browser.open(page_path)
+    check_table_rows(page.locator(".target"), [["bar"]])
+
+    page.get_by_role("button", name="build time").click()
+    expect(page.locator(".build-time")).to_have_text("built")
+
+
+def test_luxon_failure_does_not_block_build(browser: BrowserManager, page_path: str):
+    @ui.page(page_path)
+    def _():
+        tabulator(
+            {
+                "data": [{"id": 1, "name": "bar", "dob": "1982-05-14"}],
+                "columns": [
+                    {"title": "name", "field": "name"},
+                    {"title": "dob", "field": "dob", "formatter": "datetime"},
+                ],
+            }
+        ).classes("target")
+
+    browser.pw_page.route("**/luxon.*", lambda route: route.abort())
+    page = browser.open(page_path)
+    check_table_rows(page.locator(".target"), [["bar"]])
+
+
+def test_shared_theme_switch(browser: BrowserManager, page_path: str, monkeypatch):
+    monkeypatch.setattr(Client, "shared_head_html", Client.shared_head_html)
+    monkeypatch.setattr(themes, "_shared_theme_html", None)
+
+    @ui.page(page_path)
+    def _():
+        data = [{"id": 1, "name": "bar"}]
+        tabulator({"data": data, "columns": [{"title": "Name", "field": "name"}]})
+        ui.button("midnight", on_click=lambda: use_theme("midnight", shared=True))
+        ui.button("modern", on_click=lambda: use_theme("modern", shared=True))
+
+    page = browser.open(page_path)
+    theme_links = page.locator("link.nicegui-tabulator-theme")
+
+    page.get_by_role("button", name="midnight").click()
+    expect(theme_links).to_have_count(1)
+    expect(theme_links).to_have_attribute("href", re.compile("tabulator_midnight"))
+
+    page.get_by_role("button", name="modern").click()
+    expect(theme_links).to_have_count(1)
+    expect(theme_links).to_have_attribute("href", re.compile("tabulator_modern"))
+    assert (
+        page.evaluate(
+            "performance.getEntriesByName('nicegui-tabulator:theme:modern').length"
+        )
+        == 1
+    )
+
+    # new pages get only the latest theme
+    page = browser.open(page_path)
+    expect(page.locator("link.nicegui-tabulator-theme")).to_have_count(1)
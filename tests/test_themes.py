@@ -0,0 +1,25 @@
+from types import SimpleNamespace
+
+from nicegui import Client
+
+from nicegui_tabulator import use_theme
+from nicegui_tabulator.core import themes
+
+
+def test_shared_theme_goes_through_the_outboxes(monkeypatch):
+    messages = []
+    outbox = SimpleNamespace(enqueue_message=lambda *message: messages.append(message))
+    clients = {"a": SimpleNamespace(id="a", outbox=outbox)}
+    clients["b"] = SimpleNamespace(id="b", outbox=outbox)
+    monkeypatch.setattr(Client, "instances", clients)
+    monkeypatch.setattr(Client, "shared_head_html", "")
+    monkeypatch.setattr(themes, "_shared_theme_html", None)
+
+    use_theme("midnight", shared=True)
+
+    assert [(message_type, target) for message_type, _, target in messages] == [
+        ("run_javascript", "a"),
+        ("run_javascript", "b"),
+    ]
+    assert '"midnight"' in messages[0][1]["code"]
+    assert Client.shared_head_html.count("nicegui-tabulator-theme") == 1
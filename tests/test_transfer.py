@@ -0,0 +1,108 @@
+import base64
+import math
+from array import array
+import numpy as np
+from nicegui_tabulator import TransferOptions
+from nicegui_tabulator.core.transfer import ENCODED_ROWS_KEY, encode_rows
+
+
+def decode(payload):
+    if not isinstance(payload, dict):
+        return payload
+    payload = payload[ENCODED_ROWS_KEY]
+    rows = [dict(row) for row in payload["rows"]]
+    for field, dictionary in payload["dictionaries"].items():
+        for row, code in zip(rows, dictionary["codes"]):
+            if code >= 0:
+                row[field] = dictionary["values"][code]
+    for field, buffer in payload["buffers"].items():
+        values = array({"f8": "d", "f4": "f", "i4": "i"}[buffer["dtype"]])
+        values.frombytes(base64.b64decode(buffer["data"]))
+        for row, value in zip(rows, values):
+            row[field] = None if math.isnan(value) else value
+    return rows
+
+
+def test_dictionary_encoding():
+    rows = [
+        {"id": i, "status": ["open", "closed", None][i % 3], "name": f"name{i}"}
+        for i in range(300)
+    ]
+    del rows[7]["status"]
+
+    payload = encode_rows(rows, TransferOptions(dictionary_encoding=True))
+
+    assert set(payload[ENCODED_ROWS_KEY]["dictionaries"]) == {"status"}
+    assert decode(payload) == rows
+
+
+def test_dictionary_encoding_disabled_or_small():
+    rows = [{"id": i, "status": "open"} for i in range(300)]
+
+    assert encode_rows(rows, TransferOptions()) is rows
+    assert (
+        encode_rows(rows[:10], TransferOptions(dictionary_encoding=True)) == rows[:10]
+    )
+
+
+def test_categorical_fields():
+    rows = [{"id": i, "code": i} for i in range(200)]
+
+    payload = encode_rows(
+        rows,
+        TransferOptions(
+            dictionary_encoding=True, categorical_fields=frozenset({"code"})
+        ),
+    )
+
+    assert set(payload[ENCODED_ROWS_KEY]["dictionaries"]) == {"code"}
+    assert decode(payload) == rows
+
+
+def test_binary_numeric():
+    rows = [
+        {
+            "id": i,
+            "price": i / 4,
+            "volume": np.int64(i * 1000),
+            "ticker": f"T{i}",
+            "flag": i % 2 == 0,
+        }
+        for i in range(200)
+    ]
+    rows[3]["price"] = None
+
+    payload = encode_rows(
+        rows, TransferOptions(binary_numeric=True, numeric_dtypes={"price": "f4"})
+    )
+    buffers = payload[ENCODED_ROWS_KEY]["buffers"]
+
+    assert {field: buffer["dtype"] for field, buffer in buffers.items()} == {
+        "id": "i4",
+        "price": "f4",
+        "volume": "i4",
+    }
+    assert decode(payload) == rows
+
+
+def test_binary_numeric_out_of_range():
+    rows = [{"id": i, "big": 2**40 + i, "huge": 2**60 + i} for i in range(200)]
+
+    buffers = encode_rows(rows, TransferOptions(binary_numeric=True))[ENCODED_ROWS_KEY][
+        "buffers"
+    ]
+
+    assert buffers["big"]["dtype"] == "f8"
+    assert "huge" not in buffers
+
+
+def test_projection():
+    rows = [
+        {"id": i, "name": f"name{i}", "status": "open", "notes": "..."}
+        for i in range(3)
+    ]
+
+    projected = encode_rows(rows, TransferOptions(projection=True), {"id", "name"})
+
+    assert projected == [{"id": i, "name": f"name{i}"} for i in range(3)]
+    assert rows[0]["notes"] == "..."